@@ -0,0 +1,104 @@
+"""
+Shared timing / allocation harness for the offline benchmark suites.
+
+Every measurement is a plain dict so results can be dumped to JSON and
+compared against a stored baseline (see `compare`).
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _percentile(sorted_ns: List[int], q: float) -> float:
+    index = min(len(sorted_ns) - 1, int(round(q * (len(sorted_ns) - 1))))
+    return sorted_ns[index] / 1000.0
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    *,
+    group: str,
+    params: Optional[Dict[str, Any]] = None,
+    min_time: float = 0.25,
+    min_calls: int = 5,
+    alloc_calls: int = 20,
+) -> Dict[str, Any]:
+    """
+    Time `fn` for at least `min_time` seconds and `min_calls` calls.
+
+    Latencies are per call (microseconds). Allocation is measured in a
+    separate tracemalloc pass so tracing does not skew the timings:
+    `alloc_peak_bytes` is the mean peak of traced memory allocated while
+    one call runs.
+    """
+    fn()  # warm caches, imports and lazy state
+    gc.collect()
+
+    samples: List[int] = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * 1e9)
+    while len(samples) < min_calls or clock() < deadline:
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+    samples.sort()
+    total_s = sum(samples) / 1e9
+
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(alloc_calls):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "group": group,
+        "params": dict(params or {}),
+        "calls": len(samples),
+        "ops_per_sec": len(samples) / total_s if total_s else float("inf"),
+        "p50_us": _percentile(samples, 0.50),
+        "p90_us": _percentile(samples, 0.90),
+        "p99_us": _percentile(samples, 0.99),
+        "max_us": samples[-1] / 1000.0,
+        "alloc_peak_bytes": int(sum(peaks) / len(peaks)) if peaks else 0,
+    }
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    """
+    Return the benchmarks whose throughput fell more than `threshold`
+    (a fraction, e.g. 0.2 = 20%) below the baseline. Benchmarks missing
+    from either side are ignored.
+    """
+    previous = {entry["name"]: entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        old = previous.get(entry["name"])
+        if old is None or not old.get("ops_per_sec"):
+            continue
+        change = entry["ops_per_sec"] / old["ops_per_sec"] - 1.0
+        if change < -threshold:
+            regressions.append(
+                {
+                    "name": entry["name"],
+                    "baseline_ops_per_sec": old["ops_per_sec"],
+                    "ops_per_sec": entry["ops_per_sec"],
+                    "change": round(change, 4),
+                }
+            )
+    return regressions
@@ -0,0 +1,141 @@
+"""
+Import-time benchmark.
+
+Imports each entry module in a fresh interpreter under ``-X importtime`` and
+reports the cumulative import cost plus the heaviest modules it pulled in.
+Every run is a new process, so nothing is cached in ``sys.modules``; byte
+code caches (``__pycache__``) are used as they would be in production.
+
+    python benchmarks/bench_import.py --repeat 7
+    python benchmarks/bench_import.py sentinel_ai_v2.server --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+ENTRY_MODULES = ("sentinel_ai_v2.cli", "sentinel_ai_v2.api", "sentinel_ai_v2.server")
+
+# (self_us, cumulative_us, module, depth) in the order the imports completed.
+ImportRecord = Tuple[int, int, str, int]
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    Parse ``-X importtime`` output, dropping everything the interpreter
+    imported for `site` before the measured code ran.
+    """
+    records: List[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        record = (int(fields[0]), int(fields[1]), stripped, depth)
+        if depth == 0 and stripped == "site":
+            records = []
+            continue
+        records.append(record)
+    return records
+
+
+def import_profile(module: str, *, python: str = sys.executable) -> List[ImportRecord]:
+    """Import `module` in a fresh interpreter and return its import records."""
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def total_us(records: Sequence[ImportRecord]) -> int:
+    """Cumulative import time of all top-level imports in `records`."""
+    return sum(cumulative for _, cumulative, _, depth in records if depth == 0)
+
+
+def loaded_modules(records: Sequence[ImportRecord]) -> List[str]:
+    return [name for _, _, name, _ in records]
+
+
+def heaviest(records: Sequence[ImportRecord], top: int = 10) -> List[Dict[str, Any]]:
+    """The `top` modules by self time."""
+    ranked = sorted(records, key=lambda r: r[0], reverse=True)[:top]
+    return [{"module": name, "self_us": own, "cumulative_us": cumulative} for own, cumulative, name, _ in ranked]
+
+
+def bench_module(module: str, *, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Import `module` `repeat` times; the fastest run is the headline number
+    (the others include scheduler and page-cache noise).
+    """
+    runs = [import_profile(module) for _ in range(repeat)]
+    totals = [total_us(records) for records in runs]
+    best = runs[totals.index(min(totals))]
+    return {
+        "module": module,
+        "runs": repeat,
+        "min_us": min(totals),
+        "median_us": statistics.median(totals),
+        "max_us": max(totals),
+        "modules_loaded": len(best),
+        "heaviest": heaviest(best),
+    }
+
+
+def run(measure, *, quick: bool = False) -> list:
+    """
+    Suite entry point for `benchmarks/run.py`.
+
+    `measure` is not used: each sample is a whole interpreter, so the
+    results are built here in the same shape.
+    """
+    results = []
+    for module in ENTRY_MODULES:
+        report = bench_module(module, repeat=3 if quick else 7)
+        us = float(report["min_us"])
+        results.append({
+            "name": f"import.{module}",
+            "group": "import",
+            "params": {"modules_loaded": report["modules_loaded"]},
+            "calls": report["runs"],
+            "ops_per_sec": 1e6 / us if us else 0.0,
+            "p50_us": float(report["median_us"]),
+            "p90_us": float(report["max_us"]),
+            "p99_us": float(report["max_us"]),
+            "max_us": float(report["max_us"]),
+            "alloc_peak_bytes": 0,
+        })
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="heaviest modules to list")
+    args = parser.parse_args(argv)
+
+    reports = []
+    for module in args.modules:
+        report = bench_module(module, repeat=args.repeat)
+        report["heaviest"] = report["heaviest"][: args.top]
+        reports.append(report)
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""
+Model startup benchmark.
+
+Compares the legacy two-pass model startup (8 KiB streamed hash, then a
+second full read for the runtime) with the memory-mapped single-pass
+loader (hash over the mapping, same buffer handed to the runtime).
+
+Runs offline against a synthetic model file:
+
+    python benchmarks/bench_model_load.py --size-mb 256 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sentinel_ai_v2.model_loader import compute_file_hash, hash_buffer, map_model_file
+
+
+def _legacy_two_pass(path: Path) -> int:
+    compute_file_hash(path, chunk_size=8192)
+    return len(path.read_bytes())
+
+
+def _mapped_single_pass(path: Path) -> int:
+    with map_model_file(path) as mapped:
+        hash_buffer(mapped)
+        return len(mapped)
+
+
+def _time(fn, path: Path, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(path)
+        samples.append(time.perf_counter() - start)
+    return {
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def _write_model(path: Path, size_mb: int) -> None:
+    with path.open("wb") as f:
+        block = os.urandom(1 << 20)
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def run(measure, *, quick: bool = False) -> list:
+    """Suite entry point for `benchmarks/run.py`."""
+    size_mb = 8 if quick else 64
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.bin"
+        _write_model(path, size_mb)
+        params = {"size_mb": size_mb}
+        return [
+            measure("model_load.legacy_two_pass", lambda: _legacy_two_pass(path),
+                    group="model_load", params=params, alloc_calls=3),
+            measure("model_load.mapped_single_pass", lambda: _mapped_single_pass(path),
+                    group="model_load", params=params, alloc_calls=3),
+        ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.bin"
+        _write_model(path, args.size_mb)
+
+        results = {
+            "benchmark": "model_load",
+            "size_mb": args.size_mb,
+            "repeat": args.repeat,
+            "legacy_two_pass": _time(_legacy_two_pass, path, args.repeat),
+            "mapped_single_pass": _time(_mapped_single_pass, path, args.repeat),
+        }
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
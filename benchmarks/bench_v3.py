@@ -0,0 +1,167 @@
+"""
+Shield Contract v3 hot-path benchmarks.
+
+Covers `canonical_hash_v3`, `SentinelV3Request.from_dict`,
+`compute_risk_score`, `SentinelV3.evaluate` and the v2
+`SentinelClient.evaluate_snapshot` adapter over synthetic telemetry of
+growing size / depth (up to the 200 KB / 20k-node request limits) and the
+toxic telemetry pack. Run through `benchmarks/run.py`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List
+
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.contracts import SentinelV3Request, canonical_hash_v3
+from sentinel_ai_v2.scoring import compute_risk_score
+from sentinel_ai_v2.v3 import SentinelV3
+
+MAX_BYTES = SentinelV3Request.MAX_TELEMETRY_BYTES
+MAX_NODES = SentinelV3Request.MAX_TELEMETRY_NODES
+
+FEATURES = {
+    "entropy_score": 0.42,
+    "mempool_score": 0.31,
+    "reorg_score": 0.12,
+    "entropy_drop": 0.2,
+    "mempool_anomaly": 0.1,
+    "reorg_depth": 1,
+}
+
+
+def _base() -> Dict[str, Any]:
+    return {
+        "block_height": 1_234_567,
+        "mempool_size": 4_200,
+        "entropy": {"score": 0.42, "drop": 0.2},
+        "mempool": {"score": 0.31, "anomaly": 0.1},
+        "reorg": {"score": 0.12, "depth": 1},
+    }
+
+
+def _size(telemetry: Dict[str, Any]) -> int:
+    return len(json.dumps(telemetry, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def sized_telemetry(target_bytes: int) -> Dict[str, Any]:
+    """Valid telemetry padded with peer samples to about `target_bytes`."""
+    telemetry = _base()
+    peer = {"id": "peer-000000", "latency_ms": 12.5, "height": 1_234_567}
+    count = max(0, (target_bytes - _size(telemetry)) // (_size(peer) + 1))
+    telemetry["peers"] = [
+        {"id": f"peer-{i:06d}", "latency_ms": 12.5 + i % 7, "height": 1_234_567 - i % 3}
+        for i in range(count)
+    ]
+    return telemetry
+
+
+def wide_telemetry(nodes: int) -> Dict[str, Any]:
+    """Valid telemetry with about `nodes` structure nodes."""
+    telemetry = _base()
+    telemetry["samples"] = list(range(nodes - 20))
+    return telemetry
+
+
+def deep_telemetry(depth: int) -> Dict[str, Any]:
+    telemetry = _base()
+    node: Dict[str, Any] = {"leaf": 1.0}
+    for _ in range(depth):
+        node = {"n": node}
+    telemetry["nested"] = node
+    return telemetry
+
+
+def toxic_pack() -> Dict[str, Dict[str, Any]]:
+    """The toxic telemetry regression pack, as benchmark inputs."""
+    deep: Dict[str, Any] = {"x": 1}
+    for _ in range(200):
+        deep = {"d": deep}
+    return {
+        "bool_number": {**_base(), "flag": True},
+        "nan": {**_base(), "x": float("nan")},
+        "inf": {**_base(), "x": float("inf")},
+        "non_string_key": {**_base(), "m": {1: "a"}},
+        "unicode": {**_base(), "ключ": "значение", "emoji": "☃"},
+        "wide_dict": {**_base(), "wide": {f"k{i}": i for i in range(2000)}},
+        "list_10k": {**_base(), "items": list(range(10_000))},
+        "deep_nesting": {**_base(), "deep": deep},
+        "oversized_blob": {**_base(), "blob": "A" * 300_000},
+    }
+
+
+def _request(telemetry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "contract_version": 3,
+        "component": "sentinel",
+        "request_id": "bench",
+        "telemetry": telemetry,
+    }
+
+
+def _from_dict(request: Dict[str, Any]) -> Callable[[], Any]:
+    def call() -> Any:
+        try:
+            return SentinelV3Request.from_dict(request)
+        except ValueError:  # toxic inputs are rejected; the rejection is the cost
+            return None
+
+    return call
+
+
+def run(measure: Callable[..., Dict[str, Any]], *, quick: bool = False) -> List[Dict[str, Any]]:
+    thresholds = CircuitBreakerThresholds()
+    v3 = SentinelV3(thresholds=thresholds)
+    client = SentinelClient(SentinelConfig(model_path=""))
+
+    inputs: Dict[str, Dict[str, Any]] = {}
+    for size in ((1_000, 64_000) if quick else (1_000, 16_000, 64_000, MAX_BYTES - 10_000)):
+        inputs[f"bytes_{size}"] = sized_telemetry(size)
+    for nodes in ((5_000,) if quick else (5_000, MAX_NODES - 100)):
+        inputs[f"nodes_{nodes}"] = wide_telemetry(nodes)
+    for depth in ((32,) if quick else (32, 256)):
+        inputs[f"depth_{depth}"] = deep_telemetry(depth)
+
+    results = [
+        measure(
+            "v3.compute_risk_score",
+            lambda: compute_risk_score(FEATURES, thresholds),
+            group="v3",
+        )
+    ]
+    for label, telemetry in inputs.items():
+        request = _request(telemetry)
+        params = {"input": label, "bytes": _size(telemetry)}
+        results.append(
+            measure(f"v3.canonical_hash[{label}]", lambda t=telemetry: canonical_hash_v3(t),
+                    group="v3", params=params)
+        )
+        results.append(
+            measure(f"v3.from_dict[{label}]", _from_dict(request), group="v3", params=params)
+        )
+        results.append(
+            measure(f"v3.evaluate[{label}]", lambda r=request: v3.evaluate(r),
+                    group="v3", params=params)
+        )
+
+    for label, telemetry in toxic_pack().items():
+        request = _request(telemetry)
+        results.append(
+            measure(f"toxic.from_dict[{label}]", _from_dict(request),
+                    group="toxic", params={"input": label})
+        )
+        results.append(
+            measure(f"toxic.evaluate[{label}]", lambda r=request: v3.evaluate(r),
+                    group="toxic", params={"input": label})
+        )
+
+    for label in ("bytes_1000", "bytes_64000"):
+        telemetry = inputs[label]
+        results.append(
+            measure(f"v2.evaluate_snapshot[{label}]",
+                    lambda t=telemetry: client.evaluate_snapshot(t),
+                    group="v2_adapter", params={"input": label})
+        )
+    return results
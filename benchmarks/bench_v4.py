@@ -0,0 +1,248 @@
+"""
+Shield v4 signing / envelope / verification benchmarks.
+
+Parameterized by verdict metadata size and trust-profile size (10 to 10k
+keys) over the test-only signature path, so per-verdict cost and O(n)
+registry behaviour show up offline. When `oqs` (liboqs-python) imports,
+the real ML-DSA-65 / Falcon-1024 backends are timed as well. Run through
+`benchmarks/run.py`.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional
+
+from sentinel_ai_v2.contracts.v3_2_lock import SUPPORTED_EVIDENCE_FAMILIES, SUPPORTED_REASON_IDS
+from sentinel_ai_v2.v4 import COMPONENT_ROLE
+from sentinel_ai_v2.v4.crypto_verdict import (
+    build_signed_crypto_verdict_envelope,
+    build_unsigned_crypto_verdict_payload,
+    validate_crypto_verdict_envelope,
+)
+from sentinel_ai_v2.v4.signing import (
+    COMPONENT_VERDICT_DOMAIN,
+    build_signature_bundle,
+    build_test_signature_entry,
+    signed_payload_hash,
+    verify_signature_bundle,
+    verify_test_only_signature,
+)
+from sentinel_ai_v2.v4.trust_profile import (
+    ACTIVE,
+    CLASSICAL_ED25519,
+    FN_DSA,
+    ML_DSA,
+    SUPPORTED_ALGORITHMS,
+    build_test_trust_profile,
+    default_standard_profile_for_algorithm,
+    find_trusted_key,
+)
+
+CONTEXT_HASH = "a" * 64
+EVIDENCE_HASH = "b" * 64
+NOT_BEFORE = "2026-06-21T00:00:00Z"
+NOT_AFTER = "2026-06-21T00:05:00Z"
+VERIFY_AT = "2026-06-21T00:01:00Z"
+ALGORITHMS = (CLASSICAL_ED25519, ML_DSA, FN_DSA)
+
+
+def metadata_of(keys: int) -> Dict[str, Any]:
+    """Authority-free metadata with `keys` entries (strings, ints, nesting)."""
+    return {
+        f"field_{i:05d}": ({"note": f"value-{i}", "n": i} if i % 10 == 0 else f"value-{i}")
+        for i in range(keys)
+    }
+
+
+def trust_profile_of(keys: int) -> Dict[str, Any]:
+    """
+    Test trust profile padded with decoy keys to `keys` entries. The real
+    test keys come last, so every lookup walks the whole registry.
+    """
+    profile = build_test_trust_profile()
+    real = profile["entries"]
+    decoys = [
+        {
+            "role": COMPONENT_ROLE,
+            "key_id": f"decoy-{COMPONENT_ROLE}-{i:05d}",
+            "key_version": 1,
+            "algorithm": SUPPORTED_ALGORITHMS[i % len(SUPPORTED_ALGORITHMS)],
+            "not_before": "2026-01-01T00:00:00Z",
+            "not_after": "2030-01-01T00:00:00Z",
+            "status": ACTIVE,
+            "public_key": f"DECOY-PUBLIC-{i:05d}",
+        }
+        for i in range(max(0, keys - len(real)))
+    ]
+    profile["entries"] = decoys + real
+    return profile
+
+
+def unsigned_payload(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    return build_unsigned_crypto_verdict_payload(
+        request_id="req-bench",
+        context_hash=CONTEXT_HASH,
+        freshness_nonce="nonce-bench",
+        not_before=NOT_BEFORE,
+        not_after=NOT_AFTER,
+        decision="ALLOW",
+        reason_ids=[SUPPORTED_REASON_IDS[0]],
+        evidence_hash=EVIDENCE_HASH,
+        evidence_families=list(SUPPORTED_EVIDENCE_FAMILIES[:2]),
+        key_registry_version=1,
+        metadata=metadata,
+    )
+
+
+def signed_verdict(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    payload = unsigned_payload(metadata)
+    payload_hash = signed_payload_hash(payload=payload)
+    signatures = [build_test_signature_entry(algorithm=a, signed_hash=payload_hash) for a in ALGORITHMS]
+    return build_signed_crypto_verdict_envelope(
+        unsigned_payload=payload,
+        signature_bundle=build_signature_bundle(signatures=signatures),
+    )
+
+
+def _validate(verdict: Dict[str, Any], profile: Dict[str, Any]) -> Callable[[], Any]:
+    return lambda: validate_crypto_verdict_envelope(
+        verdict,
+        expected_context_hash=CONTEXT_HASH,
+        trust_profile=profile,
+        verification_time=VERIFY_AT,
+        verifier=verify_test_only_signature,
+    )
+
+
+def _load_oqs() -> Optional[Any]:
+    try:
+        return importlib.import_module("oqs")
+    except (Exception, SystemExit):  # liboqs-python may exit when liboqs is missing
+        return None
+
+
+def _oqs_cases(measure: Callable[..., Dict[str, Any]], oqs: Any) -> List[Dict[str, Any]]:
+    from sentinel_ai_v2.v4.oqs_falcon_backend import OQS_FALCON_MECHANISM, OqsFalcon1024Backend
+    from sentinel_ai_v2.v4.oqs_mldsa_backend import OQS_ML_DSA_MECHANISM, OqsMlDsaBackend
+    from sentinel_ai_v2.v4.real_crypto_backend import (
+        build_signature_entry_with_real_backend,
+        encode_binary_signature_material,
+        verify_signature_entry_with_real_backend,
+    )
+
+    payload_hash = signed_payload_hash(payload=unsigned_payload(metadata_of(10)))
+    results = []
+    for algorithm, mechanism, backend_cls in (
+        (ML_DSA, OQS_ML_DSA_MECHANISM, OqsMlDsaBackend),
+        (FN_DSA, OQS_FALCON_MECHANISM, OqsFalcon1024Backend),
+    ):
+        with oqs.Signature(mechanism) as signer:
+            public_key = signer.generate_keypair()
+            secret_key = signer.export_secret_key()
+        backend = backend_cls(private_key_resolver=lambda ref, sk=secret_key: sk, oqs_module=oqs)
+        key_id = f"bench-{COMPONENT_ROLE}-{algorithm}"
+
+        def sign(algorithm: str = algorithm, backend: Any = backend, key_id: str = key_id) -> Dict[str, Any]:
+            return build_signature_entry_with_real_backend(
+                algorithm=algorithm,
+                standard_profile=default_standard_profile_for_algorithm(algorithm),
+                domain_tag=COMPONENT_VERDICT_DOMAIN,
+                signed_payload_hash=payload_hash,
+                key_id=key_id,
+                key_version=1,
+                private_key_reference=f"hsm://bench/{algorithm}",
+                backend=backend,
+            )
+
+        entry = sign()
+        key = {
+            "role": COMPONENT_ROLE,
+            "algorithm": algorithm,
+            "key_id": key_id,
+            "key_version": 1,
+            "public_key": encode_binary_signature_material(public_key, field="public_key"),
+        }
+        params = {"mechanism": mechanism}
+        results.append(measure(f"v4.oqs.sign[{algorithm}]", sign, group="v4_oqs", params=params))
+        results.append(
+            measure(f"v4.oqs.verify[{algorithm}]",
+                    lambda e=entry, k=key, b=backend: verify_signature_entry_with_real_backend(e, k, backend=b),
+                    group="v4_oqs", params=params)
+        )
+    return results
+
+
+def run(measure: Callable[..., Dict[str, Any]], *, quick: bool = False) -> List[Dict[str, Any]]:
+    metadata_sizes = (0, 100) if quick else (0, 10, 100, 1_000)
+    trust_sizes = (10, 1_000) if quick else (10, 100, 1_000, 10_000)
+
+    results: List[Dict[str, Any]] = []
+    base_profile = build_test_trust_profile()
+    for keys in metadata_sizes:
+        metadata = metadata_of(keys)
+        payload = unsigned_payload(metadata)
+        params = {"metadata_keys": keys}
+        results.append(
+            measure(f"v4.build_unsigned_payload[meta_{keys}]",
+                    lambda m=metadata: unsigned_payload(m), group="v4", params=params)
+        )
+        results.append(
+            measure(f"v4.signed_payload_hash[meta_{keys}]",
+                    lambda p=payload: signed_payload_hash(payload=p), group="v4", params=params)
+        )
+        results.append(
+            measure(f"v4.sign_test_only[meta_{keys}]",
+                    lambda m=metadata: signed_verdict(m), group="v4", params=params)
+        )
+        results.append(
+            measure(f"v4.validate_envelope[meta_{keys}]",
+                    _validate(signed_verdict(metadata), base_profile), group="v4", params=params)
+        )
+
+    payload_hash = signed_payload_hash(payload=unsigned_payload(metadata_of(10)))
+    entries = [build_test_signature_entry(algorithm=a, signed_hash=payload_hash) for a in reversed(ALGORITHMS)]
+    results.append(
+        measure("v4.build_signature_bundle", lambda: build_signature_bundle(signatures=entries), group="v4")
+    )
+
+    verdict = signed_verdict(metadata_of(10))
+    bundle = verdict["signature_bundle"]
+    for keys in trust_sizes:
+        profile = trust_profile_of(keys)
+        params = {"trust_keys": keys}
+        results.append(
+            measure(f"v4.find_trusted_key[trust_{keys}]",
+                    lambda p=profile: find_trusted_key(
+                        p,
+                        key_id=f"test-{COMPONENT_ROLE}-{FN_DSA}-v1",
+                        key_version=1,
+                        algorithm=FN_DSA,
+                        verification_time=VERIFY_AT,
+                        artifact_not_before=NOT_BEFORE,
+                        artifact_not_after=NOT_AFTER,
+                    ),
+                    group="v4_registry", params=params)
+        )
+        results.append(
+            measure(f"v4.verify_signature_bundle[trust_{keys}]",
+                    lambda p=profile: verify_signature_bundle(
+                        bundle,
+                        expected_signed_payload_hash=verdict["signed_payload_hash"],
+                        trust_profile=p,
+                        verification_time=VERIFY_AT,
+                        artifact_not_before=NOT_BEFORE,
+                        artifact_not_after=NOT_AFTER,
+                        verifier=verify_test_only_signature,
+                    ),
+                    group="v4_registry", params=params)
+        )
+        results.append(
+            measure(f"v4.validate_envelope[trust_{keys}]",
+                    _validate(verdict, profile), group="v4_registry", params=params)
+        )
+
+    oqs = _load_oqs()
+    if oqs is not None:
+        results.extend(_oqs_cases(measure, oqs))
+    return results
@@ -0,0 +1,485 @@
+"""
+Load generator and soak harness for `sentinel_ai_v2.server.app`.
+
+Drives the HTTP endpoints with a weighted request mix from N concurrent
+workers, either in-process (straight through the ASGI app, no server or
+HTTP client needed) or against a server on localhost. Records per-endpoint
+latency histograms and error rates, samples process RSS during the run and
+flags steady memory growth. Exits 1 when the error rate or memory growth
+exceeds its limit.
+
+    # in-process, 30 s, 16 workers
+    python benchmarks/loadgen.py --duration 30 --concurrency 16
+
+    # soak a local uvicorn for an hour, sampling the server's RSS
+    uvicorn sentinel_ai_v2.server:app --port 8000 &
+    python benchmarks/loadgen.py --url http://127.0.0.1:8000 --pid $! \\
+        --duration 3600 --mix evaluate=8,evaluate_large=1,status=1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import ipaddress
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Upper bucket bounds in microseconds: 10 log-spaced buckets per decade,
+# 10 us .. 10 s (about 25% relative resolution).
+BUCKETS_US: Tuple[int, ...] = tuple(round(10 ** (k / 10)) for k in range(10, 71))
+
+DEFAULT_MIX = "evaluate=8,status=1,health=1"
+
+
+def _telemetry(rng: random.Random, *, peers: int = 0) -> Dict[str, Any]:
+    telemetry: Dict[str, Any] = {
+        "block_height": rng.randint(1, 20_000_000),
+        "mempool_size": rng.randint(0, 50_000),
+        "entropy": {"score": rng.random(), "drop": rng.random() * 0.5},
+        "mempool": {"score": rng.random(), "anomaly": rng.random() * 0.5},
+        "reorg": {"score": rng.random(), "depth": rng.randint(0, 3)},
+    }
+    if peers:
+        telemetry["peers"] = [
+            {"id": f"peer-{i:05d}", "latency_ms": rng.randint(1, 500)} for i in range(peers)
+        ]
+    return telemetry
+
+
+# name -> (method, path, body factory)
+OPERATIONS: Dict[str, Tuple[str, str, Optional[Callable[[random.Random], bytes]]]] = {
+    "evaluate": ("POST", "/evaluate",
+                 lambda rng: json.dumps({"telemetry": _telemetry(rng)}).encode()),
+    "evaluate_large": ("POST", "/evaluate",
+                       lambda rng: json.dumps({"telemetry": _telemetry(rng, peers=1_500)}).encode()),
+    "status": ("GET", "/status", None),
+    "health": ("GET", "/health", None),
+    "history": ("GET", "/history?limit=100", None),
+}
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """Parse ``name=weight,...`` into a weight map of known operations."""
+    mix: Dict[str, int] = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation: {name} (known: {', '.join(OPERATIONS)})")
+        mix[name] = int(weight or 1)
+        if mix[name] < 0:
+            raise ValueError(f"negative weight for {name}")
+    if not any(mix.values()):
+        raise ValueError("request mix is empty")
+    return mix
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (see `BUCKETS_US`) plus error counts."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+        self.errors: Dict[str, int] = {}
+
+    def record(self, latency_us: float, error: Optional[str] = None) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_US, latency_us)] += 1
+        self.count += 1
+        self.total_us += latency_us
+        self.max_us = max(self.max_us, latency_us)
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(BUCKETS_US[index]) if index < len(BUCKETS_US) else self.max_us
+        return self.max_us
+
+    def summary(self) -> Dict[str, Any]:
+        error_count = sum(self.errors.values())
+        return {
+            "requests": self.count,
+            "errors": error_count,
+            "error_rate": error_count / self.count if self.count else 0.0,
+            "error_kinds": dict(self.errors),
+            "mean_us": self.total_us / self.count if self.count else 0.0,
+            "p50_us": self.percentile(0.50),
+            "p90_us": self.percentile(0.90),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max_us,
+            "histogram": {
+                (f"le_{bound}us" if i < len(BUCKETS_US) else "overflow"): n
+                for i, (bound, n) in enumerate(zip(BUCKETS_US + (None,), self.counts))
+                if n
+            },
+        }
+
+
+# -----------------------------
+# Targets
+# -----------------------------
+
+class InProcessTarget:
+    """Calls the ASGI app directly; measures app cost without HTTP overhead."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def request(self, method: str, path: str, body: bytes) -> int:
+        route, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": route,
+            "raw_path": route.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", b"loadgen"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 80),
+        }
+        pending = [{"type": "http.request", "body": body, "more_body": False}]
+        status = 0
+
+        async def receive() -> Dict[str, Any]:
+            return pending.pop() if pending else {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await self.app(scope, receive, send)
+        return status
+
+    async def close(self) -> None:
+        return None
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+
+def _is_loopback(host: str) -> bool:
+    # Literal addresses only: a name other than localhost is never resolved.
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class HttpTarget:
+    """Minimal HTTP/1.1 client over a pool of keep-alive connections (one per busy worker)."""
+
+    def __init__(self, url: str, *, allow_remote: bool = False) -> None:
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError("--url must be http://host[:port]")
+        if not allow_remote and not _is_loopback(parts.hostname):
+            raise ValueError("--url must point at a loopback address (pass --allow-remote to override)")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self._idle: List[_Connection] = []
+
+    async def _connect(self) -> _Connection:
+        if self._idle:
+            return self._idle.pop()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return _Connection(reader, writer)
+
+    async def request(self, method: str, path: str, body: bytes) -> int:
+        conn = await self._connect()
+        try:
+            head = (
+                f"{method} {self.prefix}{path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode()
+            conn.writer.write(head + body)
+            await conn.writer.drain()
+            status_line = await conn.reader.readline()
+            if not status_line:
+                raise ConnectionError("connection closed by server")
+            status = int(status_line.split()[1])
+            length, keep_alive = -1, True
+            while True:
+                line = await conn.reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value)
+                elif name == "connection" and value.strip().lower() == "close":
+                    keep_alive = False
+            if length >= 0:
+                await conn.reader.readexactly(length)
+            else:
+                await conn.reader.read()
+                keep_alive = False
+        except BaseException:
+            conn.writer.close()
+            raise
+        if keep_alive:
+            self._idle.append(conn)
+        else:
+            conn.writer.close()
+        return status
+
+    async def close(self) -> None:
+        for conn in self._idle:
+            conn.writer.close()
+        self._idle.clear()
+
+
+# -----------------------------
+# Memory sampling
+# -----------------------------
+
+def rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Resident set size of `pid` (default: this process) from /proc, or None."""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def memory_growth(samples: List[Tuple[float, int]], *, skip_fraction: float = 0.2) -> Dict[str, Any]:
+    """
+    Least-squares RSS trend over `samples` of ``(seconds, rss_bytes)``,
+    ignoring the first `skip_fraction` of the run as warm-up.
+    """
+    if len(samples) < 3:
+        return {"samples": len(samples), "slope_bytes_per_min": None, "growth_bytes": None}
+    start = samples[0][0] + (samples[-1][0] - samples[0][0]) * skip_fraction
+    points = [(t, rss) for t, rss in samples if t >= start] or samples
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_r = sum(r for _, r in points) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in points)
+    slope = sum((t - mean_t) * (r - mean_r) for t, r in points) / var_t if var_t else 0.0
+    span = points[-1][0] - points[0][0]
+    return {
+        "samples": len(samples),
+        "rss_start_bytes": samples[0][1],
+        "rss_end_bytes": samples[-1][1],
+        "rss_peak_bytes": max(r for _, r in samples),
+        "slope_bytes_per_min": slope * 60.0,
+        "growth_bytes": slope * span,
+    }
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+
+async def run_load(
+    target: Any,
+    *,
+    mix: Dict[str, int],
+    concurrency: int = 8,
+    duration: Optional[float] = 10.0,
+    requests: Optional[int] = None,
+    warmup: float = 0.0,
+    pid: Optional[int] = None,
+    sample_interval: float = 1.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run `concurrency` workers against `target` until `duration` seconds or
+    `requests` total requests (whichever comes first) and return the report.
+    Requests issued during the first `warmup` seconds are not recorded.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if duration is None and requests is None:
+        raise ValueError("set duration and/or requests")
+
+    names = [name for name, weight in mix.items() if weight]
+    weights = [mix[name] for name in names]
+    histograms = {name: Histogram() for name in names}
+    clock = time.perf_counter
+    begin = clock()
+    measure_from = begin + warmup
+    deadline = None if duration is None else measure_from + duration
+    budget = [requests]
+    samples: List[Tuple[float, int]] = []
+
+    def more() -> bool:
+        if deadline is not None and clock() >= deadline:
+            return False
+        if budget[0] is not None:
+            if budget[0] <= 0:
+                return False
+            budget[0] -= 1
+        return True
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1_000_003 + index)
+        while more():
+            name = rng.choices(names, weights)[0]
+            method, path, make_body = OPERATIONS[name]
+            body = make_body(rng) if make_body else b""
+            error = None
+            start = clock()
+            try:
+                status = await target.request(method, path, body)
+                if status >= 400:
+                    error = f"http_{status}"
+            except Exception as exc:  # noqa: BLE001 - every failure is a data point
+                error = type(exc).__name__
+            end = clock()
+            if start >= measure_from:
+                histograms[name].record((end - start) * 1e6, error)
+            await asyncio.sleep(0)  # let the sampler and peers run in-process
+
+    async def sampler() -> None:
+        while True:
+            rss = rss_bytes(pid)
+            if rss is not None:
+                samples.append((clock() - begin, rss))
+            await asyncio.sleep(sample_interval)
+
+    sampling = asyncio.ensure_future(sampler())
+    try:
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    finally:
+        sampling.cancel()
+        await asyncio.gather(sampling, return_exceptions=True)
+        await target.close()
+    rss = rss_bytes(pid)
+    if rss is not None:
+        samples.append((clock() - begin, rss))
+
+    elapsed = max(1e-9, clock() - max(begin, measure_from))
+    total = Histogram()
+    for hist in histograms.values():
+        for i, n in enumerate(hist.counts):
+            total.counts[i] += n
+        total.count += hist.count
+        total.total_us += hist.total_us
+        total.max_us = max(total.max_us, hist.max_us)
+        for kind, n in hist.errors.items():
+            total.errors[kind] = total.errors.get(kind, 0) + n
+    return {
+        "concurrency": concurrency,
+        "mix": dict(mix),
+        "seconds": elapsed,
+        "throughput_rps": total.count / elapsed,
+        "overall": total.summary(),
+        "operations": {name: hist.summary() for name, hist in histograms.items()},
+        "memory": memory_growth(samples),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="drive a running server (default: in-process ASGI)")
+    parser.add_argument("--allow-remote", action="store_true",
+                        help="allow a --url that is not a loopback address")
+    parser.add_argument("--pid", type=int, help="server pid whose RSS to sample (with --url)")
+    parser.add_argument("--concurrency", "-c", type=int, default=8)
+    parser.add_argument("--duration", "-d", type=float, default=10.0,
+                        help="seconds to run after warm-up (0 = until --requests)")
+    parser.add_argument("--requests", "-n", type=int, help="stop after this many requests")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unrecorded warm-up seconds")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"weighted request mix (default: {DEFAULT_MIX}; "
+                             f"operations: {', '.join(OPERATIONS)})")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="RSS sampling period (s)")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="fail when the overall error rate exceeds this fraction")
+    parser.add_argument("--max-growth-mb", type=float, default=None,
+                        help="fail when post-warm-up RSS grows more than this many MiB")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.url:
+        try:
+            target: Any = HttpTarget(args.url, allow_remote=args.allow_remote)
+        except ValueError as exc:
+            parser.error(str(exc))
+        pid = args.pid
+    else:
+        from sentinel_ai_v2.server import app
+
+        target, pid = InProcessTarget(app), None
+
+    report = asyncio.run(
+        run_load(
+            target,
+            mix=mix,
+            concurrency=args.concurrency,
+            duration=args.duration or None,
+            requests=args.requests,
+            warmup=args.warmup,
+            pid=pid,
+            sample_interval=args.sample_interval,
+            seed=args.seed,
+        )
+    )
+    report["target"] = args.url or "in-process"
+
+    failures = []
+    if report["overall"]["error_rate"] > args.max_error_rate:
+        failures.append(f"error rate {report['overall']['error_rate']:.2%}")
+    growth = report["memory"]["growth_bytes"]
+    if args.max_growth_mb is not None and growth is not None and growth > args.max_growth_mb * (1 << 20):
+        failures.append(f"RSS grew {growth / (1 << 20):.1f} MiB")
+    report["failures"] = failures
+
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    overall = report["overall"]
+    sys.stderr.write(
+        f"{overall['requests']} requests in {report['seconds']:.1f}s "
+        f"({report['throughput_rps']:.1f} req/s), p50 {overall['p50_us']:.0f}us "
+        f"p99 {overall['p99_us']:.0f}us, errors {overall['errors']}\n"
+    )
+    for failure in failures:
+        sys.stderr.write(f"FAIL {failure}\n")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
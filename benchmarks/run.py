@@ -0,0 +1,105 @@
+"""
+Offline benchmark runner.
+
+Runs the benchmark suites, prints a summary table to stderr and writes the
+JSON results. With `--baseline` the run is compared against a stored
+results file and exits 1 if any benchmark's throughput regressed by more
+than `--threshold`:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline baseline.json --threshold 0.2
+    python benchmarks/run.py --suite v3 --quick
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import bench_import
+import bench_model_load
+import bench_v3
+import bench_v4
+from _harness import compare, measure
+
+SUITES = {
+    "import": bench_import.run,
+    "v3": bench_v3.run,
+    "v4": bench_v4.run,
+    "model_load": bench_model_load.run,
+}
+
+
+def _load_baseline(path: Path) -> List[Dict[str, Any]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data["results"] if isinstance(data, dict) else data
+
+
+def _summary(results: List[Dict[str, Any]]) -> str:
+    width = max(len(r["name"]) for r in results)
+    lines = [f"{'benchmark':<{width}}  {'ops/s':>10}  {'p50 us':>10}  {'p99 us':>10}  {'alloc B':>10}"]
+    for r in results:
+        lines.append(
+            f"{r['name']:<{width}}  {r['ops_per_sec']:>10.1f}  {r['p50_us']:>10.1f}"
+            f"  {r['p99_us']:>10.1f}  {r['alloc_peak_bytes']:>10d}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES),
+                        help="suite to run (repeatable, default: all)")
+    parser.add_argument("--quick", action="store_true",
+                        help="smaller inputs and shorter timing windows")
+    parser.add_argument("--min-time", type=float, default=None,
+                        help="seconds spent timing each benchmark")
+    parser.add_argument("--output", "-o", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed throughput drop vs baseline (fraction, default 0.2)")
+    args = parser.parse_args(argv)
+
+    min_time = args.min_time if args.min_time is not None else (0.05 if args.quick else 0.5)
+    timed = functools.partial(measure, min_time=min_time)
+
+    results: List[Dict[str, Any]] = []
+    for name in args.suite or sorted(SUITES):
+        results.extend(SUITES[name](timed, quick=args.quick))
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "quick": args.quick,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+    if args.baseline is not None:
+        report["threshold"] = args.threshold
+        report["regressions"] = compare(results, _load_baseline(args.baseline), args.threshold)
+
+    sys.stderr.write(_summary(results) + "\n")
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+    for regression in report.get("regressions", []):
+        sys.stderr.write(
+            f"REGRESSION {regression['name']}: {regression['ops_per_sec']:.1f} ops/s "
+            f"vs baseline {regression['baseline_ops_per_sec']:.1f} ({regression['change']:+.1%})\n"
+        )
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
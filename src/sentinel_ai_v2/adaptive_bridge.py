@@ -14,12 +14,27 @@ import json
 import logging
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .adaptive_event import AdaptiveEvent
 
+if TYPE_CHECKING:
+    from .adaptive_exporter import AdaptiveEventExporter
+
 logger = logging.getLogger(__name__)
 
+# Optional buffered exporter (see `attach_exporter`).
+_EXPORTER: Optional["AdaptiveEventExporter"] = None
+
+
+def attach_exporter(exporter: Optional["AdaptiveEventExporter"]) -> None:
+    """
+    Route `emit_adaptive_event` through `exporter` (queued, batched, sent by
+    a background thread) instead of logging inline; None restores logging.
+    """
+    global _EXPORTER
+    _EXPORTER = exporter
+
 
 def build_adaptive_event(
     *,
@@ -55,14 +70,18 @@ def build_adaptive_event(
 
 def emit_adaptive_event(event: AdaptiveEvent) -> None:
     """
-    Placeholder sink for AdaptiveEvents.
+    Default sink for AdaptiveEvents.
 
-    For v2 this only logs a structured JSON line.
-    Later, DigiByte-Quantum-Adaptive-Core can replace this with:
-      – HTTP/gRPC send
-      – message queue push
-      – file / DB logger, etc.
+    With an exporter attached (see `attach_exporter`) the event is queued
+    for batched export. Otherwise it is logged as a structured JSON line at
+    DEBUG; the event is only serialized when that level is enabled.
     """
+    exporter = _EXPORTER
+    if exporter is not None:
+        exporter.submit(event)
+        return
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
         payload = asdict(event)
         # default=str ensures datetime is JSON-serializable
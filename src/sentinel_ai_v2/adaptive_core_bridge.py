@@ -2,17 +2,72 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import importlib
+import os
+import queue
+import threading
+from functools import partial
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-try:
-    # These imports will only work when the Adaptive Core package
-    # is available in the same environment. If not, we handle it
-    # gracefully and keep Sentinel AI v2 fully functional.
-    from adaptive_core.interface import AdaptiveCoreInterface  # type: ignore
-    from adaptive_core.threat_packet import ThreatPacket  # type: ignore
-except ImportError:  # pragma: no cover - optional integration
-    AdaptiveCoreInterface = None  # type: ignore
-    ThreatPacket = None  # type: ignore
+from .fork_safety import reset_lock_in_child
+
+# The Adaptive Core classes, resolved when the first bridge is built rather
+# than at import, so importing Sentinel never loads the optional package.
+# None once resolution found it missing: the bridge is then a no-op and
+# Sentinel AI v2 stays fully functional. Tests may assign these directly.
+_UNRESOLVED: Any = object()
+AdaptiveCoreInterface: Any = _UNRESOLVED
+ThreatPacket: Any = _UNRESOLVED
+
+
+def _resolve_adaptive_core() -> None:
+    global AdaptiveCoreInterface, ThreatPacket
+    if AdaptiveCoreInterface is not _UNRESOLVED and ThreatPacket is not _UNRESOLVED:
+        return
+    try:
+        interface = importlib.import_module("adaptive_core.interface").AdaptiveCoreInterface
+        packet = importlib.import_module("adaptive_core.threat_packet").ThreatPacket
+    except ImportError:
+        interface = packet = None
+    if AdaptiveCoreInterface is _UNRESOLVED:
+        AdaptiveCoreInterface = interface
+    if ThreatPacket is _UNRESOLVED:
+        ThreatPacket = packet
+
+
+class FeedbackEvent:
+    """
+    Lightweight labelled feedback event, as the AdaptiveEngine expects it
+    (duck-typed: event_id, layer, feedback).
+    """
+
+    __slots__ = ("event_id", "layer", "feedback")
+
+    def __init__(self, event_id: str, layer: str, feedback: str) -> None:
+        self.event_id = event_id
+        self.layer = layer
+        self.feedback = feedback
+
+    def __repr__(self) -> str:
+        return f"FeedbackEvent({self.event_id!r}, {self.layer!r}, {self.feedback!r})"
+
+
+# A label for `submit_feedback_labels`: a FeedbackEvent, a mapping with
+# event_id / feedback (and optionally layer), or an (event_id, feedback) pair.
+FeedbackLabel = Union[FeedbackEvent, Mapping[str, Any], Tuple[str, str]]
+
+
+def _to_feedback_event(label: FeedbackLabel, layer: str) -> FeedbackEvent:
+    if isinstance(label, FeedbackEvent):
+        tag = label.feedback.upper()
+        return label if tag == label.feedback else FeedbackEvent(label.event_id, label.layer, tag)
+    if isinstance(label, Mapping):
+        return FeedbackEvent(
+            str(label["event_id"]), str(label.get("layer") or layer), str(label["feedback"]).upper()
+        )
+    event_id, feedback = label
+    return FeedbackEvent(str(event_id), layer, str(feedback).upper())
 
 
 class SentinelAdaptiveCoreBridge:
@@ -30,11 +85,19 @@ class SentinelAdaptiveCoreBridge:
 
     This keeps Sentinel "adaptive-ready" without introducing a hard
     runtime dependency.
+
+    Calls into the interface are serialized, so one bridge can be shared
+    across threads (see `get_shared_bridge`). `submit_threat_nowait` queues
+    a threat for a background thread instead of submitting inline.
     """
 
+    # Threats queued by `submit_threat_nowait` beyond this are dropped.
+    MAX_PENDING = 10_000
+
     def __init__(self, interface: Optional["AdaptiveCoreInterface"] = None) -> None:
         # If AdaptiveCoreInterface is not available, this bridge becomes
         # a no-op and Sentinel can still run normally.
+        _resolve_adaptive_core()
         if AdaptiveCoreInterface is None:
             self._available = False
             self._interface = None
@@ -42,6 +105,15 @@ class SentinelAdaptiveCoreBridge:
             self._available = True
             self._interface = interface or AdaptiveCoreInterface()
 
+        # _call_lock serializes interface calls; _lock guards the queue state
+        # and counters, so queuing never waits on a slow Adaptive Core call.
+        self._call_lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._pending: Optional["queue.Queue[Any]"] = None
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._counts = {"queued": 0, "submitted": 0, "failed": 0, "dropped": 0}
+
     @property
     def is_available(self) -> bool:
         """
@@ -90,7 +162,8 @@ class SentinelAdaptiveCoreBridge:
             metadata=metadata,
         )
 
-        self._interface.submit_threat_packet(packet)  # type: ignore[arg-type]
+        with self._call_lock:
+            self._interface.submit_threat_packet(packet)  # type: ignore[arg-type]
 
     # ------------------------------------------------------------------ #
     # Feedback submission (teaching the Adaptive Core)
@@ -122,22 +195,63 @@ class SentinelAdaptiveCoreBridge:
             # No Adaptive Core present → do nothing.
             return
 
-        # Define a tiny lightweight feedback object that matches what the
-        # AdaptiveEngine expects (duck-typing).
-        class _FeedbackEvent:
-            def __init__(self, event_id: str, layer: str, feedback: str) -> None:
-                self.event_id = event_id
-                self.layer = layer
-                self.feedback = feedback
-
         # Normalise feedback tag to upper-case; the core will accept strings.
         tag = feedback.upper()
 
-        events = [_FeedbackEvent(event_id=event_id, layer=layer, feedback=tag)]
+        events = [FeedbackEvent(event_id=event_id, layer=layer, feedback=tag)]
 
         # The AdaptiveCoreInterface already exposes submit_feedback_events,
         # which forwards the iterable of events into the AdaptiveEngine.
-        self._interface.submit_feedback_events(events)  # type: ignore[arg-type]
+        with self._call_lock:
+            self._interface.submit_feedback_events(events)  # type: ignore[arg-type]
+
+    def submit_feedback_labels(
+        self,
+        labels: Iterable[FeedbackLabel],
+        *,
+        layer: str = "sentinel_ai_v2",
+        chunk_size: int = 1000,
+    ) -> Dict[str, int]:
+        """
+        Submit many feedback labels in chunks of `chunk_size` events.
+
+        `labels` may be any iterable, including a generator streaming from a
+        file (see `feedback_hooks.iter_feedback_labels`); it is consumed
+        lazily, so memory is bounded by one chunk plus the set of seen ids.
+        Labels repeating an earlier event_id are skipped (first one wins).
+        `layer` applies to labels that do not name their own. Tags are
+        upper-cased as in `submit_feedback_label`.
+
+        Returns counts: submitted, duplicates, chunks. Without Adaptive Core
+        nothing is consumed and all counts are 0.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        counts = {"submitted": 0, "duplicates": 0, "chunks": 0}
+        if not self.is_available:
+            return counts
+
+        seen: set[str] = set()
+        chunk: List[FeedbackEvent] = []
+        for label in labels:
+            event = _to_feedback_event(label, layer)
+            if event.event_id in seen:
+                counts["duplicates"] += 1
+                continue
+            seen.add(event.event_id)
+            chunk.append(event)
+            if len(chunk) == chunk_size:
+                self._send_feedback_chunk(chunk, counts)
+                chunk = []
+        if chunk:
+            self._send_feedback_chunk(chunk, counts)
+        return counts
+
+    def _send_feedback_chunk(self, chunk: List[FeedbackEvent], counts: Dict[str, int]) -> None:
+        with self._call_lock:
+            self._interface.submit_feedback_events(chunk)  # type: ignore[union-attr]
+        counts["submitted"] += len(chunk)
+        counts["chunks"] += 1
 
     # ------------------------------------------------------------------ #
     # Read-only views
@@ -151,4 +265,158 @@ class SentinelAdaptiveCoreBridge:
         if not self.is_available:
             return "Adaptive Core integration not available in this environment."
 
-        return self._interface.get_immune_report_text(min_severity=min_severity)
+        with self._call_lock:
+            return self._interface.get_immune_report_text(min_severity=min_severity)
+
+    # ------------------------------------------------------------------ #
+    # Queued submission
+    # ------------------------------------------------------------------ #
+
+    def submit_threat_nowait(
+        self,
+        source_layer: str,
+        threat_type: str,
+        severity: int,
+        description: str,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Queue a threat for the bridge's background thread and return at once.
+
+        Takes the same arguments as `submit_simple_threat`. Safe to call
+        from an event loop or a detection hot path: it never waits on the
+        Adaptive Core. Returns False (and counts a drop) when the
+        integration is unavailable, the bridge is closed or
+        `MAX_PENDING` threats are already queued.
+        """
+        if not self.is_available:
+            self._count("dropped")
+            return False
+        task = partial(self.submit_simple_threat, source_layer, threat_type, severity, description, **kwargs)
+        # Check-and-enqueue under the lock `close` takes, so nothing lands
+        # behind its stop marker (or in a queue it has already dropped).
+        with self._lock:
+            pending = self._pending_queue()
+            if pending is not None:
+                try:
+                    pending.put_nowait(task)
+                except queue.Full:
+                    pass
+                else:
+                    self._counts["queued"] += 1
+                    return True
+            self._counts["dropped"] += 1
+            return False
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[key] += n
+
+    def _pending_queue(self) -> Optional["queue.Queue[Any]"]:
+        # Caller holds self._lock. None once the bridge is closed.
+        if self._closed:
+            return None
+        if self._worker is None:
+            self._pending = queue.Queue(maxsize=self.MAX_PENDING)
+            self._worker = threading.Thread(
+                target=self._drain, args=(self._pending,), name="sentinel-adaptive-bridge", daemon=True
+            )
+            self._worker.start()
+        return self._pending
+
+    def _drain(self, pending: "queue.Queue[Any]") -> None:
+        while True:
+            item = pending.get()
+            if item is None:
+                return  # closed
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                item()
+            except Exception:
+                self._count("failed")
+            else:
+                self._count("submitted")
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued threat has been submitted (or failed)."""
+        with self._lock:
+            pending = self._pending
+        if pending is None:
+            return True
+        done = threading.Event()
+        try:
+            pending.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """Queued-submission counters: queued, submitted, failed, dropped."""
+        with self._lock:
+            return dict(self._counts)
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Submit what is still queued, stop the background thread and close
+        the interface (if it has a ``close``). The bridge is a no-op after.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending, worker = self._pending, self._worker
+        if pending is not None and worker is not None:
+            try:
+                pending.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            else:
+                worker.join(timeout)
+        with self._lock:
+            self._pending = None
+            self._available = False
+        close = getattr(self._interface, "close", None)
+        if callable(close):
+            with self._call_lock:
+                close()
+
+
+# (owner pid, bridge); a forked child builds its own, since the parent's
+# background thread does not exist there.
+_SHARED: Optional[Tuple[int, SentinelAdaptiveCoreBridge]] = None
+_SHARED_LOCK = threading.Lock()
+reset_lock_in_child(globals(), "_SHARED_LOCK")
+
+
+def get_shared_bridge(factory: Optional[Callable[[], SentinelAdaptiveCoreBridge]] = None) -> SentinelAdaptiveCoreBridge:
+    """
+    Return the process-wide bridge, creating it on first use.
+
+    Hooks that are not handed a bridge use this one, so the Adaptive Core
+    interface is constructed once per process rather than once per call.
+    `factory` (default: `SentinelAdaptiveCoreBridge`) is only used when the
+    shared bridge is created.
+    """
+    global _SHARED
+    shared = _SHARED
+    if shared is not None and shared[0] == os.getpid():
+        return shared[1]
+    with _SHARED_LOCK:
+        if _SHARED is None or _SHARED[0] != os.getpid():
+            _SHARED = (os.getpid(), (factory or SentinelAdaptiveCoreBridge)())
+        return _SHARED[1]
+
+
+def close_shared_bridge(timeout: Optional[float] = 5.0) -> None:
+    """Close and forget the shared bridge; the next `get_shared_bridge` builds a new one."""
+    global _SHARED
+    with _SHARED_LOCK:
+        shared, _SHARED = _SHARED, None
+    if shared is not None and shared[0] == os.getpid():
+        shared[1].close(timeout)
@@ -0,0 +1,277 @@
+"""
+Buffered, batched export of AdaptiveEvents.
+
+Detection code hands events to `AdaptiveEventExporter.submit`, which only
+appends to a bounded queue (never blocks, drops and counts on overflow). A
+background thread collects batches by size or age and passes them to a
+transport; events are serialized inside the transport, and only when the
+transport will actually emit them.
+
+Transports: `LogTransport`, `FileTransport` (JSON lines), `SocketTransport`
+(JSON lines over a local Unix socket) and `AdaptiveCoreTransport` (threat
+packets through `SentinelAdaptiveCoreBridge`). Any object with
+``send(events)`` and ``close()`` works.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Sequence
+
+from .adaptive_event import AdaptiveEvent
+
+if TYPE_CHECKING:
+    from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+
+_FIELDS = tuple(f.name for f in fields(AdaptiveEvent))
+
+
+def event_to_dict(event: AdaptiveEvent) -> Dict[str, Any]:
+    """Flat field dict (AdaptiveEvent has no nested dataclasses, so no deep copy)."""
+    return {name: getattr(event, name) for name in _FIELDS}
+
+
+def serialize_event(event: AdaptiveEvent) -> str:
+    """The JSON line `emit_adaptive_event` has always logged."""
+    return json.dumps(event_to_dict(event), sort_keys=True, default=str)
+
+
+class Transport(Protocol):
+    def send(self, events: Sequence[AdaptiveEvent]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class LogTransport:
+    """Log each event as one JSON line; nothing is serialized when `level` is filtered out."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or logging.getLogger("sentinel_ai_v2.adaptive_bridge")
+        self.level = level
+
+    def send(self, events: Sequence[AdaptiveEvent]) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        for event in events:
+            self.logger.log(self.level, "AdaptiveEvent %s", serialize_event(event))
+
+    def close(self) -> None:
+        pass
+
+
+class FileTransport:
+    """Append each batch to `path` as JSON lines, one write per batch."""
+
+    def __init__(self, path: "os.PathLike[str] | str") -> None:
+        self._file = open(path, "a", encoding="utf-8")
+
+    def send(self, events: Sequence[AdaptiveEvent]) -> None:
+        self._file.write("".join(serialize_event(event) + "\n" for event in events))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SocketTransport:
+    """
+    Stream JSON lines to a local Unix socket, one ``sendall`` per batch.
+
+    Connects lazily and reconnects on the next batch after an error; the
+    failed batch is reported to the exporter (and counted) rather than
+    retried.
+    """
+
+    def __init__(self, path: str, *, timeout: float = 1.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+
+    def send(self, events: Sequence[AdaptiveEvent]) -> None:
+        data = "".join(serialize_event(event) + "\n" for event in events).encode("utf-8")
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class AdaptiveCoreTransport:
+    """
+    Submit events to the Adaptive Core as threat packets.
+
+    Severity in [0, 1] maps to the packet's [0, 10] scale, as in
+    `adaptive_hooks`. A bridge without Adaptive Core drops batches silently.
+    """
+
+    def __init__(self, bridge: "SentinelAdaptiveCoreBridge", *, source_layer: str = "sentinel_ai_v2") -> None:
+        self.bridge = bridge
+        self.source_layer = source_layer
+
+    def send(self, events: Sequence[AdaptiveEvent]) -> None:
+        if not self.bridge.is_available:
+            return
+        for event in events:
+            self.bridge.submit_simple_threat(
+                source_layer=self.source_layer,
+                threat_type=event.anomaly_type,
+                severity=max(0, min(10, int(round(event.severity * 10)))),
+                description=event.details or f"{event.layer}:{event.anomaly_type}",
+                tx_id=event.txid,
+                block_height=event.block_height,
+                metadata={"qri_before": event.qri_before, "qri_after": event.qri_after,
+                          "was_mitigated": event.was_mitigated, "created_at": str(event.created_at)},
+            )
+
+    def close(self) -> None:
+        pass
+
+
+# Control markers travelling through the queue behind the queued events.
+class _Marker:
+    __slots__ = ("done", "stop")
+
+    def __init__(self, *, stop: bool = False) -> None:
+        self.done = threading.Event()
+        self.stop = stop
+
+
+class AdaptiveEventExporter:
+    """
+    Bounded queue plus background flusher in front of a `Transport`.
+
+    A batch is sent when it reaches `batch_size` events or its oldest event
+    has waited `flush_interval` seconds. `submit` never blocks: when the
+    queue holds `max_queue` events the new event is dropped and counted.
+    Transport exceptions are counted per batch and never reach the caller.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be >= 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        self.transport = transport
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._counts = {"submitted": 0, "dropped": 0, "exported": 0, "failed": 0, "batches": 0, "failed_batches": 0}
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="sentinel-adaptive-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, event: AdaptiveEvent) -> bool:
+        """Queue `event` for export; False if it was dropped (queue full or closed)."""
+        # Under the lock `close` takes to mark shutdown, so no event can be
+        # queued behind the stop marker (where it would never be exported).
+        with self._lock:
+            if self._closed:
+                self._counts["dropped"] += 1
+                return False
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self._counts["dropped"] += 1
+                return False
+            self._counts["submitted"] += 1
+        return True
+
+    def _send(self, batch: List[AdaptiveEvent]) -> None:
+        try:
+            self.transport.send(batch)
+        except Exception:
+            with self._lock:
+                self._counts["failed"] += len(batch)
+                self._counts["failed_batches"] += 1
+            return
+        with self._lock:
+            self._counts["exported"] += len(batch)
+            self._counts["batches"] += 1
+
+    def _run(self) -> None:
+        batch: List[AdaptiveEvent] = []
+        deadline = 0.0
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, AdaptiveEvent):
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                self._send(batch)
+                batch = []
+            if isinstance(item, _Marker):
+                item.done.set()
+                if item.stop:
+                    return
+
+    def _signal(self, marker: _Marker, timeout: Optional[float]) -> bool:
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Export everything queued so far; False if that did not finish within `timeout`."""
+        if self._closed:
+            return True
+        return self._signal(_Marker(), timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Export what is queued, stop the flusher and close the transport."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._signal(_Marker(stop=True), timeout):
+            self._thread.join(timeout)
+        self.transport.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters plus the current queue depth."""
+        with self._lock:
+            counts = dict(self._counts)
+        counts["queued"] = self._queue.qsize()
+        return counts
+
+    def __enter__(self) -> "AdaptiveEventExporter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
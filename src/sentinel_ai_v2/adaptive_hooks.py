@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from .adaptive_core_bridge import SentinelAdaptiveCoreBridge, get_shared_bridge
 
 
 def report_reorg_anomaly_to_adaptive(
@@ -33,11 +33,11 @@ def report_reorg_anomaly_to_adaptive(
 
         bridge:
             Optional existing SentinelAdaptiveCoreBridge instance.
-            If None, a new bridge will be created internally.
+            If None, the process-wide shared bridge is used.
     """
-    # If no bridge passed, create a default one (will be no-op if Adaptive Core
+    # If no bridge passed, use the shared one (a no-op if Adaptive Core
     # isn't available in this environment).
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_shared_bridge()
 
     if not bridge.is_available:
         # Adaptive Core not present → do nothing, don't break Sentinel.
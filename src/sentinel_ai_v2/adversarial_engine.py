@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
+
+from .config import CircuitBreakerThresholds
+from .feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+
+# Score levels at which the stateful heuristics report a pattern.
+VARIANCE_SUPPRESSION_ALERT = 0.8
+THRESHOLD_HUGGING_ALERT = 0.3
 
 
 @dataclass
@@ -13,7 +21,8 @@ class AdversarialAnalysisResult:
 
 
 def analyse_for_adversarial_patterns(
-    features: Dict[str, Any]
+    features: Dict[str, Any],
+    tracker: Optional["AdversarialStatsTracker"] = None,
 ) -> AdversarialAnalysisResult:
     """
     Inspect features for signs of adversarial behaviour, such as:
@@ -22,14 +31,234 @@ def analyse_for_adversarial_patterns(
     - long-term suppression of natural variance
     - repeated borderline behaviour just under thresholds
 
-    This function is intentionally simple. Real logic can be plugged in by
-    DigiByte security researchers and AI engineers.
+    The last two need history: pass a stateful `AdversarialStatsTracker`
+    and the snapshot is folded into it before its scores are checked.
+    Each detected pattern adds a small, fixed risk boost.
     """
     reasons: list[str] = []
+    boost = 0.0
 
     # Placeholder example: if caller passes this flag, we boost risk slightly.
     if features.get("suspicious_smoothness"):
         reasons.append("suspicious_smoothness")
-        return AdversarialAnalysisResult(risk_boost=0.1, reasons=reasons)
+        boost += 0.1
+
+    if tracker is not None:
+        stats = tracker.update(features)
+        suppressed = [
+            name
+            for name, score in stats.variance_suppression.items()
+            if score >= VARIANCE_SUPPRESSION_ALERT
+        ]
+        hugging = [
+            name
+            for name, score in stats.threshold_hugging.items()
+            if score >= THRESHOLD_HUGGING_ALERT
+        ]
+        if suppressed:
+            reasons.extend(f"variance_suppression:{name}" for name in suppressed)
+            boost += 0.1
+        if hugging:
+            reasons.extend(f"threshold_hugging:{name}" for name in hugging)
+            boost += 0.1
+
+    return AdversarialAnalysisResult(risk_boost=boost, reasons=reasons or None)
+
+
+# Features tracked by default: the shared feature layout.
+DEFAULT_TRACKED_FEATURES: tuple[str, ...] = DEFAULT_FEATURE_EXTRACTOR.names
+
+STATS_STATE_VERSION = 1
+
+
+class _FeatureStats:
+    """O(1), fixed-memory running statistics for one feature."""
+
+    __slots__ = ("count", "mean", "m2", "ewma", "ewm_var", "near", "near_pos", "near_hits")
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Welford sum of squared deviations (long-run variance)
+        self.ewma = 0.0
+        self.ewm_var = 0.0  # exponentially weighted variance (recent variance)
+        self.near = bytearray(window)  # ring of near-threshold flags
+        self.near_pos = 0
+        self.near_hits = 0
+
+    def update(self, value: float, alpha: float, near: bool) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if self.count == 1:
+            self.ewma = value
+        else:
+            diff = value - self.ewma
+            self.ewma += alpha * diff
+            self.ewm_var = (1.0 - alpha) * (self.ewm_var + alpha * diff * diff)
+
+        flag = 1 if near else 0
+        self.near_hits += flag - self.near[self.near_pos]
+        self.near[self.near_pos] = flag
+        self.near_pos = (self.near_pos + 1) % len(self.near)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+@dataclass
+class AdversarialStatsSnapshot:
+    """Per-feature scores in [0, 1] after one `AdversarialStatsTracker.update`."""
+
+    variance_suppression: Dict[str, float]
+    threshold_hugging: Dict[str, float]
+
+
+class AdversarialStatsTracker:
+    """
+    Online per-feature statistics feeding the adversarial heuristics.
+
+    For every tracked feature it keeps a Welford mean / variance (long-run),
+    an EWMA and exponentially weighted variance (recent behaviour) and a
+    ring of near-threshold flags over the last `window` snapshots. Updates
+    are O(1) per feature and memory is fixed.
+
+    - variance suppression: ``1 - sqrt(recent_var / long_run_var)``, i.e. how
+      much quieter the feature has become than its own history;
+    - threshold hugging: the share of the window in which a circuit-breaker
+      feature sat just under its threshold
+      (``threshold * (1 - near_margin) <= value < threshold``).
+
+    Both scores stay 0.0 until `min_samples` snapshots have been seen. State
+    round-trips through `to_dict` / `from_dict` (plain JSON types) so it can
+    be persisted across restarts. Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        thresholds: CircuitBreakerThresholds,
+        *,
+        features: Sequence[str] = DEFAULT_TRACKED_FEATURES,
+        alpha: float = 0.1,
+        window: int = 50,
+        near_margin: float = 0.1,
+        min_samples: int = 20,
+    ) -> None:
+        if not features or len(set(features)) != len(features):
+            raise ValueError("tracked features must be non-empty and unique")
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be positive")
+        if not 0.0 < near_margin < 1.0:
+            raise ValueError("near_margin must be in (0, 1)")
+
+        self.features = tuple(features)
+        self.alpha = float(alpha)
+        self.window = int(window)
+        self.near_margin = float(near_margin)
+        self.min_samples = int(min_samples)
+        self.thresholds: Dict[str, float] = {
+            "entropy_drop": float(thresholds.entropy_drop_threshold),
+            "mempool_anomaly": float(thresholds.mempool_anomaly_threshold),
+            "reorg_depth": float(thresholds.reorg_depth_threshold),
+        }
+        self._stats = {name: _FeatureStats(self.window) for name in self.features}
+
+    def _is_near(self, name: str, value: float) -> bool:
+        threshold = self.thresholds.get(name)
+        if threshold is None or threshold <= 0.0:
+            return False
+        return threshold * (1.0 - self.near_margin) <= value < threshold
+
+    def update(self, features: Dict[str, Any]) -> AdversarialStatsSnapshot:
+        """Fold one snapshot into the running statistics and return fresh scores."""
+        alpha = self.alpha
+        for name, stats in self._stats.items():
+            value = float(features.get(name, 0.0))
+            if not math.isfinite(value):
+                continue
+            stats.update(value, alpha, self._is_near(name, value))
+        return self.scores()
+
+    def scores(self) -> AdversarialStatsSnapshot:
+        suppression: Dict[str, float] = {}
+        hugging: Dict[str, float] = {}
+        for name, stats in self._stats.items():
+            if stats.count < self.min_samples:
+                suppression[name] = 0.0
+                hugging[name] = 0.0
+                continue
+            long_run = stats.variance
+            if long_run > 0.0:
+                ratio = math.sqrt(min(stats.ewm_var / long_run, 1.0))
+                suppression[name] = 1.0 - ratio
+            else:
+                suppression[name] = 0.0
+            filled = min(stats.count, self.window)
+            hugging[name] = stats.near_hits / filled
+        return AdversarialStatsSnapshot(
+            variance_suppression=suppression,
+            threshold_hugging=hugging,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize configuration and state to JSON-compatible types."""
+        return {
+            "version": STATS_STATE_VERSION,
+            "alpha": self.alpha,
+            "window": self.window,
+            "near_margin": self.near_margin,
+            "min_samples": self.min_samples,
+            "thresholds": dict(self.thresholds),
+            "features": {
+                name: {
+                    "count": s.count,
+                    "mean": s.mean,
+                    "m2": s.m2,
+                    "ewma": s.ewma,
+                    "ewm_var": s.ewm_var,
+                    "near": list(s.near),
+                    "near_pos": s.near_pos,
+                }
+                for name, s in self._stats.items()
+            },
+        }
 
-    return AdversarialAnalysisResult(risk_boost=0.0, reasons=reasons or None)
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "AdversarialStatsTracker":
+        """Rebuild a tracker from `to_dict` output; raises ValueError if malformed."""
+        if not isinstance(state, dict) or state.get("version") != STATS_STATE_VERSION:
+            raise ValueError("unsupported adversarial stats state")
+        try:
+            features = state["features"]
+            thresholds = state["thresholds"]
+            tracker = cls(
+                CircuitBreakerThresholds(),
+                features=tuple(features),
+                alpha=state["alpha"],
+                window=state["window"],
+                near_margin=state["near_margin"],
+                min_samples=state["min_samples"],
+            )
+            tracker.thresholds = {str(k): float(v) for k, v in thresholds.items()}
+            for name, saved in features.items():
+                stats = tracker._stats[name]
+                near = bytearray(1 if flag else 0 for flag in saved["near"])
+                near_pos = int(saved["near_pos"])
+                if len(near) != tracker.window or not 0 <= near_pos < tracker.window:
+                    raise ValueError("near-threshold ring does not match window")
+                stats.count = int(saved["count"])
+                stats.mean = float(saved["mean"])
+                stats.m2 = float(saved["m2"])
+                stats.ewma = float(saved["ewma"])
+                stats.ewm_var = float(saved["ewm_var"])
+                stats.near = near
+                stats.near_pos = near_pos
+                stats.near_hits = sum(near)
+        except (KeyError, TypeError, AttributeError) as exc:
+            raise ValueError("malformed adversarial stats state") from exc
+        return tracker
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict
+import atexit
+import copy
+import gc
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from .config import CircuitBreakerThresholds, SentinelConfig
+from .config import CircuitBreakerThresholds, SentinelConfig, load_config
+from .fork_safety import reset_lock_in_child
 from .model_loader import LoadedModel, load_and_verify_model
 from .v3 import SentinelV3
 
+if TYPE_CHECKING:
+    from .idempotency import IdempotencyTable
+    from .model_registry import ModelRegistry
+    from .profiling import StageProfiler
+    from .scoring import StreamState
+    from .verdict_log import VerdictLogWriter
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------
 # v3 Integration Entrypoint (SINGLE SUPPORTED CALL PATH)
@@ -16,6 +31,9 @@ from .v3 import SentinelV3
 # Deterministic: fixed thresholds defaults, no optional model.
 _DEFAULT_V3 = SentinelV3(thresholds=CircuitBreakerThresholds(), model=None)
 
+# Optional durable verdict history (see `attach_verdict_log`).
+_VERDICT_LOG: Optional["VerdictLogWriter"] = None
+
 
 def evaluate_v3(request: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -28,7 +46,52 @@ def evaluate_v3(request: Dict[str, Any]) -> Dict[str, Any]:
     - Output: Shield Contract v3 response dict
     - Fail-closed by design
     """
-    return _DEFAULT_V3.evaluate(request)
+    response = _DEFAULT_V3.evaluate(request)
+    verdict_log = _VERDICT_LOG
+    if verdict_log is not None:
+        _log_verdict(verdict_log, response)
+    return response
+
+
+def _log_verdict(writer: "VerdictLogWriter", response: Dict[str, Any]) -> None:
+    try:
+        writer.append_response(response)
+    except Exception:
+        # History is best-effort: never turn a verdict into an exception.
+        logger.exception("Verdict log append failed")
+
+
+def enable_idempotency(table: Optional[IdempotencyTable]) -> None:
+    """
+    Answer `evaluate_v3` retries (same request_id and telemetry) from
+    `table` instead of re-evaluating; None disables dedup.
+    """
+    global _DEFAULT_V3
+    _DEFAULT_V3 = replace(_DEFAULT_V3, idempotency=table)
+
+
+def enable_profiling(profiler: Optional[StageProfiler]) -> None:
+    """Sample `evaluate_v3` stage timings into `profiler`; None disables."""
+    global _DEFAULT_V3
+    _DEFAULT_V3 = replace(_DEFAULT_V3, profiler=profiler)
+
+
+def attach_verdict_log(writer: Optional["VerdictLogWriter"]) -> None:
+    """
+    Persist every `evaluate_v3` response to `writer`; None detaches.
+
+    The attached writer is flushed and closed at interpreter exit.
+    """
+    global _VERDICT_LOG
+    _VERDICT_LOG = writer
+
+
+def _close_verdict_log() -> None:
+    if _VERDICT_LOG is not None:
+        _VERDICT_LOG.close()
+
+
+atexit.register(_close_verdict_log)
 
 
 # -----------------------------
@@ -71,6 +134,47 @@ class SentinelClient:
         # v3 evaluator (internal)
         self._v3 = SentinelV3(thresholds=self._thresholds, model=self._model)
 
+        # Optional durable verdict history (see `attach_verdict_log`).
+        self._verdict_log: Optional["VerdictLogWriter"] = None
+
+    def attach_model_registry(self, registry: "ModelRegistry") -> None:
+        """
+        Follow `registry` for hot model reloads.
+
+        Each verified swap builds a new frozen evaluator and rebinds it in a
+        single attribute assignment; evaluations already running keep the
+        evaluator (and model) they started with.
+        """
+        registry.subscribe(self._swap_model)
+        if registry.current is not None:
+            self._swap_model(registry.current)
+
+    def attach_profiler(self, profiler: Optional[StageProfiler]) -> None:
+        """Sample per-stage evaluation timings into `profiler`; None disables."""
+        self._v3 = replace(self._v3, profiler=profiler)
+
+    def attach_stream_state(self, state: Optional[StreamState]) -> None:
+        """Score with `state`'s stream history (see `StreamState`); None disables."""
+        self._v3 = replace(self._v3, stream_state=state)
+
+    def with_stream_state(self, state: Optional[StreamState]) -> "SentinelClient":
+        """
+        A copy of this client scoring with `state`, sharing its config and
+        model; this client is left as it is. Model registry swaps seen by
+        this client do not reach the copy.
+        """
+        clone = copy.copy(self)
+        clone.attach_stream_state(state)
+        return clone
+
+    def attach_verdict_log(self, writer: Optional["VerdictLogWriter"]) -> None:
+        """Persist the v3 response behind every `evaluate_snapshot` to `writer`; None detaches."""
+        self._verdict_log = writer
+
+    def _swap_model(self, model: LoadedModel) -> None:
+        self._model = model
+        self._v3 = replace(self._v3, model=model)
+
     def evaluate_snapshot(self, raw_telemetry: Dict[str, Any]) -> SentinelResult:
         """
         Evaluate a single telemetry snapshot and return a compact public result.
@@ -87,6 +191,9 @@ class SentinelClient:
         }
 
         response_v3 = self._v3.evaluate(request_v3)
+        verdict_log = self._verdict_log
+        if verdict_log is not None:
+            _log_verdict(verdict_log, response_v3)
 
         # Fail-closed: if v3 errors, return a safe v2-shaped failure
         if response_v3.get("decision") == "ERROR":
@@ -107,3 +214,88 @@ class SentinelClient:
             risk_score=v2_risk_score,
             details=list(v2_details),
         )
+
+
+# -----------------------------
+# Process-wide default client
+# -----------------------------
+
+# (config the client was built from, client)
+_DEFAULT_CLIENT: Optional[Tuple[SentinelConfig, SentinelClient]] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+reset_lock_in_child(globals(), "_DEFAULT_CLIENT_LOCK")
+
+
+def get_default_client() -> SentinelClient:
+    """
+    Return the shared SentinelClient built from `load_config()`.
+
+    The client (and its verified, warmed model) is built once and reused
+    until the compiled config changes, so callers that do not pass their
+    own client no longer re-read and re-hash the model on every call.
+    """
+    global _DEFAULT_CLIENT
+    cfg = load_config()
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None or _DEFAULT_CLIENT[0] is not cfg:
+            _DEFAULT_CLIENT = (cfg, SentinelClient(config=cfg))
+        return _DEFAULT_CLIENT[1]
+
+
+def reset_default_client() -> None:
+    """Drop the shared client; the next `get_default_client()` rebuilds it."""
+    global _DEFAULT_CLIENT
+    with _DEFAULT_CLIENT_LOCK:
+        _DEFAULT_CLIENT = None
+
+
+# -----------------------------
+# Warm-up / pre-fork
+# -----------------------------
+
+_WARMUP_REQUEST: Dict[str, Any] = {
+    "contract_version": 3,
+    "component": "sentinel",
+    "request_id": "sentinel-warmup",
+    "telemetry": {"block_height": 1, "mempool_size": 0, "entropy": {"score": 0.0}},
+    "constraints": {"fail_closed": True},
+}
+
+
+def warm_up(client: Optional[SentinelClient] = None, *, freeze: bool = False) -> Dict[str, Any]:
+    """
+    Do the per-process startup work before serving traffic.
+
+    Compiles the config, builds the shared client (`client` defaults to
+    `get_default_client()`, which verifies the model and binds it through
+    the runtime cache) and runs one synthetic evaluation through the
+    `evaluate_v3` evaluator and through `client`, so lazy imports and caches
+    are in place before the first real request. The synthetic evaluations
+    skip idempotency, profiling, stream state and the verdict log.
+
+    Pre-fork servers call this once in the parent (e.g. gunicorn
+    ``--preload``); workers then inherit the compiled config and loaded
+    model copy-on-write instead of rebuilding them. With `freeze`,
+    `gc.freeze()` moves everything allocated so far to the permanent
+    generation so collections in the workers do not touch (and copy) those
+    pages.
+
+    Returns the synthetic decision and per-step timings in milliseconds.
+    """
+    timings: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    if client is None:
+        client = get_default_client()
+    timings["client_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    bare = {"idempotency": None, "profiler": None, "stream_state": None}
+    response = replace(_DEFAULT_V3, **bare).evaluate(dict(_WARMUP_REQUEST))
+    replace(client._v3, **bare).evaluate(dict(_WARMUP_REQUEST))
+    timings["evaluate_ms"] = (time.perf_counter() - start) * 1000
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return {"decision": response["decision"], "frozen": freeze, "timings": timings}
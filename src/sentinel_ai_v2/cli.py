@@ -3,7 +3,10 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any, Dict
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from .wrapper.sentinel_wrapper import SentinelWrapper
 
@@ -38,6 +41,85 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Pretty-print JSON output.",
     )
 
+    # sentinel-ai batch --input archive/ --output results.ndjson
+    batch = subparsers.add_parser(
+        "batch",
+        help="Evaluate JSONL/NDJSON telemetry snapshots in bulk and write NDJSON results.",
+    )
+    batch.add_argument(
+        "-i",
+        "--input",
+        metavar="PATH",
+        default="-",
+        help="JSONL file, directory of .jsonl/.ndjson/.json files (recursive), or '-' for stdin.",
+    )
+    batch.add_argument(
+        "-o",
+        "--output",
+        metavar="PATH",
+        default="-",
+        help="NDJSON output file, or '-' for stdout.",
+    )
+    batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of evaluation threads (default: 1). Pure-Python scoring "
+            "holds the GIL, so more threads only help when the model runtime "
+            "releases it (e.g. ONNX)."
+        ),
+    )
+
+    # sentinel-ai history --log-dir verdicts/ --since 1700000000 --decision BLOCK
+    history = subparsers.add_parser(
+        "history",
+        help="Query the verdict log and print matching verdicts as NDJSON.",
+    )
+    history.add_argument(
+        "--log-dir",
+        metavar="DIR",
+        required=True,
+        help="Verdict log directory to query.",
+    )
+    history.add_argument(
+        "--since",
+        type=float,
+        metavar="EPOCH_SECONDS",
+        help="Only verdicts at or after this time.",
+    )
+    history.add_argument(
+        "--until",
+        type=float,
+        metavar="EPOCH_SECONDS",
+        help="Only verdicts before this time.",
+    )
+    history.add_argument(
+        "--decision",
+        action="append",
+        metavar="DECISION",
+        help="Filter by decision (ALLOW, WARN, BLOCK, ERROR); repeatable.",
+    )
+    history.add_argument(
+        "--tier",
+        action="append",
+        metavar="TIER",
+        help="Filter by risk tier (LOW, MEDIUM, HIGH, CRITICAL); repeatable.",
+    )
+    history.add_argument(
+        "--context-hash",
+        metavar="HEX",
+        help="Return every verdict for this context_hash (ignores other filters).",
+    )
+    history.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Return at most N verdicts.",
+    )
+
     # sentinel-ai version
     subparsers.add_parser(
         "version",
@@ -89,6 +171,156 @@ def _cmd_snapshot(args: argparse.Namespace) -> int:
     return 0
 
 
+class _BatchItem:
+    """One input line: a parsed snapshot, or the reason it could not be parsed."""
+
+    __slots__ = ("source", "snapshot", "error")
+
+    def __init__(
+        self,
+        source: str,
+        snapshot: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.source = source
+        self.snapshot = snapshot
+        self.error = error
+
+
+_BATCH_SUFFIXES = (".jsonl", ".ndjson", ".json")
+
+
+def _iter_lines(path: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(source, line)`` pairs, streaming; never reads a file whole."""
+    if path == "-":
+        for number, line in enumerate(sys.stdin, 1):
+            yield f"<stdin>:{number}", line
+        return
+    root = Path(path)
+    if root.is_dir():
+        files = sorted(
+            p for p in root.rglob("*") if p.is_file() and p.suffix.lower() in _BATCH_SUFFIXES
+        )
+    else:
+        files = [root]
+    for file in files:
+        with open(file, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                yield f"{file}:{number}", line
+
+
+def _iter_batch_items(path: str) -> Iterator[_BatchItem]:
+    for source, line in _iter_lines(path):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            yield _BatchItem(source, error="invalid_json")
+            continue
+        if not isinstance(data, dict):
+            yield _BatchItem(source, error="not_object")
+            continue
+        yield _BatchItem(source, snapshot=data)
+
+
+class _BatchEvaluator:
+    """Pipeline client: evaluates one item, turning failures into error records."""
+
+    def __init__(self, wrapper: Any) -> None:
+        self._wrapper = wrapper
+
+    def evaluate_snapshot(self, item: _BatchItem) -> Dict[str, Any]:
+        if item.error is not None:
+            return {"source": item.source, "error": item.error}
+        try:
+            result = self._wrapper.evaluate(item.snapshot)
+        except Exception:
+            return {"source": item.source, "error": "evaluation_failed"}
+        return {
+            "source": item.source,
+            "status": result.status,
+            "risk_score": result.risk_score,
+            "details": result.details,
+        }
+
+
+def _cmd_batch(args: argparse.Namespace) -> int:
+    from .engine.watcher_loop import watch_stream_pipelined
+
+    if args.workers < 1:
+        raise SystemExit("[sentinel-ai] --workers must be >= 1")
+    if not args.input.strip():
+        raise SystemExit("[sentinel-ai] --input must not be empty (use '-' for stdin)")
+
+    statuses: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def write(record: Dict[str, Any]) -> None:
+        if "error" in record:
+            errors[record["error"]] += 1
+        else:
+            statuses[record["status"]] += 1
+        out.write(json.dumps(record) + "\n")
+
+    started = time.perf_counter()
+    try:
+        processed = watch_stream_pipelined(
+            _iter_batch_items(args.input),
+            client=_BatchEvaluator(SentinelWrapper()),  # type: ignore[arg-type]
+            handler=write,  # type: ignore[arg-type]
+            workers=args.workers,
+        )
+    except (OSError, UnicodeDecodeError) as exc:
+        raise SystemExit(f"[sentinel-ai] Cannot read batch input: {exc}") from exc
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "processed": processed,
+        "evaluated": sum(statuses.values()),
+        "errors": dict(errors),
+        "statuses": dict(statuses),
+        "seconds": round(elapsed, 3),
+        "per_second": round(processed / elapsed, 1) if elapsed > 0 else None,
+    }
+    # Results own stdout; the summary goes to stderr.
+    json.dump(summary, sys.stderr)
+    sys.stderr.write("\n")
+    return 0
+
+
+def _epoch_ns(seconds: float | None) -> int | None:
+    return None if seconds is None else int(seconds * 1_000_000_000)
+
+
+def _cmd_history(args: argparse.Namespace) -> int:
+    from .verdict_history import VerdictHistory, rows_to_dicts
+    from .verdict_log import VerdictLogError
+
+    try:
+        with VerdictHistory(args.log_dir) as history:
+            if args.context_hash:
+                rows = history.by_context_hash(args.context_hash, limit=args.limit)
+            else:
+                rows = history.query(
+                    _epoch_ns(args.since),
+                    _epoch_ns(args.until),
+                    decisions=args.decision,
+                    tiers=args.tier,
+                    limit=args.limit,
+                )
+    except (ValueError, VerdictLogError) as exc:
+        raise SystemExit(f"[sentinel-ai] History query failed: {exc}") from exc
+
+    for verdict in rows_to_dicts(rows):
+        sys.stdout.write(json.dumps(verdict) + "\n")
+    return 0
+
+
 def _cmd_version() -> int:
     # Keep the version info here so developers can easily update it.
     version_info = {
@@ -106,6 +338,10 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "snapshot":
         return _cmd_snapshot(args)
+    if args.command == "batch":
+        return _cmd_batch(args)
+    if args.command == "history":
+        return _cmd_history(args)
     if args.command == "version":
         return _cmd_version()
 
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict
+import importlib
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .fork_safety import reset_lock_in_child
+
+# Environment variable naming the config file used when no path is given.
+CONFIG_ENV_VAR = "SENTINEL_AI_CONFIG"
 
 
 @dataclass
@@ -30,13 +41,176 @@ class SentinelConfig:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
+class ConfigError(ValueError):
+    """Raised when a config file is missing, unparsable or fails validation."""
+
+
+_TOP_LEVEL_KEYS = frozenset(
+    {
+        "model_path",
+        "model_hash",
+        "model_signature_path",
+        "circuit_breakers",
+        "enabled_detectors",
+        "extra",
+    }
+)
+
+
+def _optional_str(doc: Dict[str, Any], key: str) -> Optional[str]:
+    value = doc.get(key)
+    if value is not None and (not isinstance(value, str) or not value.strip()):
+        raise ConfigError(f"{key} must be a non-empty string")
+    return value
+
+
+def _number(value: Any, *, key: str, integral: bool) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"circuit_breakers.{key} must be a number")
+    if integral:
+        if not isinstance(value, int) or value < 0:
+            raise ConfigError(f"circuit_breakers.{key} must be a non-negative integer")
+        return value
+    if not math.isfinite(value):
+        raise ConfigError(f"circuit_breakers.{key} must be finite")
+    return float(value)
+
+
+def _parse_thresholds(doc: Any) -> CircuitBreakerThresholds:
+    if not isinstance(doc, dict):
+        raise ConfigError("circuit_breakers must be a table/object")
+    types = {f.name: f.type for f in fields(CircuitBreakerThresholds)}
+    unknown = set(doc) - set(types)
+    if unknown:
+        raise ConfigError(f"unknown circuit_breakers keys: {sorted(unknown)}")
+    return CircuitBreakerThresholds(
+        **{
+            key: _number(value, key=key, integral=types[key] == "int")
+            for key, value in doc.items()
+        }
+    )
+
+
+def _compile_config(doc: Any, base_dir: Path) -> SentinelConfig:
+    """Validate a parsed config document into a SentinelConfig (fail-closed)."""
+    if not isinstance(doc, dict):
+        raise ConfigError("config root must be a table/object")
+    unknown = set(doc) - _TOP_LEVEL_KEYS
+    if unknown:
+        raise ConfigError(f"unknown config keys: {sorted(unknown)}")
+
+    cfg = SentinelConfig()
+
+    if "model_path" in doc:
+        model_path = _optional_str(doc, "model_path")
+        # Relative model paths are resolved against the config file location.
+        cfg.model_path = None if model_path is None else str(base_dir / model_path)  # type: ignore[assignment]
+
+    model_hash = _optional_str(doc, "model_hash")
+    if model_hash is not None:
+        if len(model_hash) != 64 or any(c not in "0123456789abcdef" for c in model_hash):
+            raise ConfigError("model_hash must be 64-character lowercase hex")
+        cfg.model_hash = model_hash
+
+    signature_path = _optional_str(doc, "model_signature_path")
+    if signature_path is not None:
+        cfg.model_signature_path = str(base_dir / signature_path)
+
+    if "circuit_breakers" in doc:
+        cfg.circuit_breakers = _parse_thresholds(doc["circuit_breakers"])
+
+    detectors = doc.get("enabled_detectors", {})
+    if not isinstance(detectors, dict) or not all(
+        isinstance(k, str) and isinstance(v, bool) for k, v in detectors.items()
+    ):
+        raise ConfigError("enabled_detectors must map names to booleans")
+    cfg.enabled_detectors = dict(detectors)
+
+    extra = doc.get("extra", {})
+    if not isinstance(extra, dict):
+        raise ConfigError("extra must be a table/object")
+    cfg.extra = dict(extra)
+
+    return cfg
+
+
+def _load_toml_module() -> Any:
+    for name in ("tomllib", "tomli"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    raise ConfigError("TOML config requires Python 3.11+ or the tomli package")
+
+
+def _parse_file(path: Path) -> Any:
+    raw = path.read_bytes()
+    try:
+        if path.suffix.lower() == ".toml":
+            return _load_toml_module().loads(raw.decode("utf-8"))
+        if path.suffix.lower() == ".json":
+            return json.loads(raw)
+    except ConfigError:
+        raise
+    except Exception as exc:
+        raise ConfigError(f"cannot parse config {path}: {exc}") from exc
+    raise ConfigError(f"unsupported config format: {path.suffix or '<none>'}")
+
+
+# resolved path -> ((mtime_ns, size), compiled config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], SentinelConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+reset_lock_in_child(globals(), "_CONFIG_CACHE_LOCK")
+_DEFAULT_CONFIG: Optional[SentinelConfig] = None
+
+
+def clear_config_cache() -> None:
+    """Forget all compiled configs (tests / explicit operator reload)."""
+    global _DEFAULT_CONFIG
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+        _DEFAULT_CONFIG = None
+
+
 def load_config(path: str | None = None) -> SentinelConfig:
     """
-    Load configuration from a file.
+    Load, validate and cache configuration from a JSON or TOML file.
+
+    With no `path`, the file named by SENTINEL_AI_CONFIG is used; if that is
+    unset too, the built-in defaults are returned.
+
+    Compiled configs are cached process-wide keyed on the resolved path and
+    the file's (mtime, size), so repeated calls cost one `stat` and return
+    the same object until the file changes. Treat the returned config as
+    read-only; it is shared.
 
-    For now this returns a default config object. In a real implementation
-    this should parse YAML/JSON and validate the structure.
+    Raises ConfigError on missing files, parse errors, unknown keys or
+    wrongly typed values.
     """
-    # Placeholder: we keep it simple and safe for now.
-    _ = path
-    return SentinelConfig()
+    global _DEFAULT_CONFIG
+
+    if path is None:
+        path = os.environ.get(CONFIG_ENV_VAR) or None
+    if path is None:
+        with _CONFIG_CACHE_LOCK:
+            if _DEFAULT_CONFIG is None:
+                _DEFAULT_CONFIG = SentinelConfig()
+            return _DEFAULT_CONFIG
+
+    resolved = Path(path).resolve()
+    try:
+        st = resolved.stat()
+    except OSError as exc:
+        raise ConfigError(f"config file not found: {path}") from exc
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    key = str(resolved)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    cfg = _compile_config(_parse_file(resolved), resolved.parent)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (stamp, cfg)
+    return cfg
@@ -14,3 +14,4 @@ class ReasonCode(str, Enum):
     SNTL_ERROR_UNKNOWN_TOP_LEVEL_KEY = "SNTL_ERROR_UNKNOWN_TOP_LEVEL_KEY"
     SNTL_ERROR_TELEMETRY_TOO_LARGE = "SNTL_ERROR_TELEMETRY_TOO_LARGE"
     SNTL_ERROR_BAD_NUMBER = "SNTL_ERROR_BAD_NUMBER"
+    SNTL_ERROR_IDEMPOTENCY_CONFLICT = "SNTL_ERROR_IDEMPOTENCY_CONFLICT"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, FrozenSet, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional
 import math
 
 from .v3_reason_codes import ReasonCode
@@ -74,7 +74,12 @@ class SentinelV3Request:
     MAX_TELEMETRY_NODES: int = 20_000      # structure nodes upper bound
 
     @staticmethod
-    def from_dict(obj: Dict[str, Any]) -> "SentinelV3Request":
+    def from_dict(
+        obj: Dict[str, Any],
+        *,
+        lap: Optional[Callable[[str], None]] = None,
+    ) -> "SentinelV3Request":
+        # `lap` is the profiling hook (see `profiling.ProfileSample.lap`).
         if not isinstance(obj, dict):
             raise ValueError(ReasonCode.SNTL_ERROR_INVALID_REQUEST.value)
 
@@ -112,9 +117,13 @@ class SentinelV3Request:
         except Exception:
             # If telemetry can't be serialized deterministically -> reject
             raise ValueError(ReasonCode.SNTL_ERROR_INVALID_REQUEST.value)
+        if lap is not None:
+            lap("parse;size_check")
 
         # NaN/Infinity + node limit guard
         rc = _walk_check_finite(tel, max_nodes=SentinelV3Request.MAX_TELEMETRY_NODES)
+        if lap is not None:
+            lap("parse;finite_walk")
         if rc is not None:
             raise ValueError(rc.value)
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, Deque, Dict, Optional, Sequence
+
+from .config import CircuitBreakerThresholds
 
 
 @dataclass
@@ -45,3 +49,176 @@ def correlate_signals(features: Dict[str, Any]) -> CorrelationResult:
         adjusted_score=adjusted,
         details=details
     )
+
+
+@dataclass(frozen=True)
+class TemporalSignal:
+    """A named feature that fires when ``features[feature] >= threshold``."""
+
+    name: str
+    feature: str
+    threshold: float
+
+
+def default_temporal_signals(
+    thresholds: CircuitBreakerThresholds,
+) -> tuple[TemporalSignal, ...]:
+    """The circuit-breaker combo as an ordered chain: entropy → mempool → reorg."""
+    return (
+        TemporalSignal("entropy_drop", "entropy_drop", thresholds.entropy_drop_threshold),
+        TemporalSignal(
+            "mempool_anomaly", "mempool_anomaly", thresholds.mempool_anomaly_threshold
+        ),
+        TemporalSignal(
+            "reorg_depth", "reorg_depth", float(thresholds.reorg_depth_threshold)
+        ),
+    )
+
+
+@dataclass
+class TemporalCorrelationResult:
+    """Windowed view of the signals after one observed snapshot."""
+
+    window_max: Dict[str, float]
+    window_hits: Dict[str, int]
+    co_occurrence: bool
+    sequence_detected: bool
+    details: list[str]
+
+
+class _SignalWindow:
+    __slots__ = ("maxima", "hits")
+
+    def __init__(self, capacity: int) -> None:
+        # (timestamp, value) pairs with strictly decreasing values: the head
+        # is always the window maximum.
+        self.maxima: Deque[tuple[float, float]] = deque()
+        # Timestamps at which the signal fired; bounded ring buffer.
+        self.hits: Deque[float] = deque(maxlen=capacity)
+
+
+class TemporalCorrelator:
+    """
+    Stateful multi-signal correlator over a sliding time window.
+
+    Every signal keeps a monotonic deque (sliding-window maximum) and a
+    bounded ring buffer of firing timestamps. Each `observe` call pushes one
+    value per signal and expires entries older than the window, so the work
+    per snapshot is O(1) amortized regardless of the snapshot rate.
+
+    Two patterns are reported:
+
+    - co-occurrence: every signal fired at least once inside the window,
+      in any order;
+    - sequence: the signals fired in their declared order (e.g. entropy
+      drop, then mempool anomaly, then reorg) with the first and last
+      firing at most `window_seconds` apart. Hits in the same snapshot
+      count as in order.
+
+    Not thread-safe; use one correlator per stream.
+    """
+
+    def __init__(
+        self,
+        thresholds: CircuitBreakerThresholds,
+        *,
+        signals: Optional[Sequence[TemporalSignal]] = None,
+        window_seconds: Optional[float] = None,
+        capacity: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if signals is None:
+            signals = default_temporal_signals(thresholds)
+        self.signals = tuple(signals)
+        if not self.signals:
+            raise ValueError("temporal signals must not be empty")
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        window = (
+            thresholds.multi_signal_window_seconds
+            if window_seconds is None
+            else window_seconds
+        )
+        if window <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.window_seconds = float(window)
+        self._clock = clock
+        self._windows = tuple(_SignalWindow(capacity) for _ in self.signals)
+        # _chain[k]: latest start time of an in-order chain reaching signal k.
+        self._chain: list[Optional[float]] = [None] * len(self.signals)
+        self._last: Optional[float] = None
+
+    def reset(self) -> None:
+        """Forget all observed history."""
+        for window in self._windows:
+            window.maxima.clear()
+            window.hits.clear()
+        self._chain = [None] * len(self.signals)
+        self._last = None
+
+    def observe(
+        self,
+        features: Dict[str, Any],
+        now: Optional[float] = None,
+    ) -> TemporalCorrelationResult:
+        """Record one snapshot at `now` (defaults to the clock) and evaluate the window."""
+        now = self._clock() if now is None else float(now)
+        if self._last is not None and now < self._last:
+            now = self._last  # never let time run backwards
+        self._last = now
+        horizon = now - self.window_seconds
+
+        window_max: Dict[str, float] = {}
+        window_hits: Dict[str, int] = {}
+        fired: list[bool] = []
+        for signal, window in zip(self.signals, self._windows):
+            value = float(features.get(signal.feature, 0.0))
+
+            maxima = window.maxima
+            while maxima and maxima[-1][1] <= value:
+                maxima.pop()
+            maxima.append((now, value))
+            while maxima[0][0] < horizon:
+                maxima.popleft()
+
+            hit = value >= signal.threshold
+            hits = window.hits
+            if hit:
+                hits.append(now)
+            while hits and hits[0] < horizon:
+                hits.popleft()
+
+            fired.append(hit)
+            window_max[signal.name] = maxima[0][1]
+            window_hits[signal.name] = len(hits)
+
+        sequence = False
+        chain = self._chain
+        last = len(chain) - 1
+        for k, hit in enumerate(fired):
+            if not hit:
+                continue
+            start = now if k == 0 else chain[k - 1]
+            if start is None or start < horizon:
+                continue
+            if chain[k] is None or start > chain[k]:
+                chain[k] = start
+            if k == last:
+                sequence = True
+
+        co_occurrence = all(window_hits.values())
+        details: list[str] = []
+        window_label = f"{self.window_seconds:g}s"
+        if co_occurrence:
+            details.append(f"temporal:co_occurrence within {window_label}")
+        if sequence:
+            order = ">".join(signal.name for signal in self.signals)
+            details.append(f"temporal:sequence {order} within {window_label}")
+
+        return TemporalCorrelationResult(
+            window_max=window_max,
+            window_hits=window_hits,
+            co_occurrence=co_occurrence,
+            sequence_detected=sequence,
+            details=details,
+        )
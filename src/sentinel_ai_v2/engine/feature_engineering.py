@@ -4,6 +4,7 @@ from dataclasses import dataclass, asdict
 from typing import Any, Dict
 
 from ..data_intake import TelemetrySnapshot
+from ..feature_extractor import DEFAULT_FEATURE_EXTRACTOR
 
 
 @dataclass
@@ -38,16 +39,9 @@ def build_feature_vector(snapshot: TelemetrySnapshot) -> FeatureVector:
 
     This is an optional helper; the current API already builds a dict directly,
     but DigiByte devs can use this structured version if they prefer.
+
+    Values are read through the shared compiled extractor, so this helper and
+    the v3 evaluator always agree on layout and casting.
     """
-    entropy = snapshot.entropy or {}
-    mempool = snapshot.mempool or {}
-    reorg = snapshot.reorg or {}
-
-    return FeatureVector(
-        entropy_score=float(entropy.get("score", 0.0)),
-        mempool_score=float(mempool.get("score", 0.0)),
-        reorg_score=float(reorg.get("score", 0.0)),
-        entropy_drop=float(entropy.get("drop", 0.0)),
-        mempool_anomaly=float(mempool.get("anomaly", 0.0)),
-        reorg_depth=int(reorg.get("depth", 0)),
-    )
+    buf = DEFAULT_FEATURE_EXTRACTOR.extract(vars(snapshot))
+    return FeatureVector(*DEFAULT_FEATURE_EXTRACTOR.row_values(buf))
@@ -1,22 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, Optional
+import asyncio
+import inspect
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
-from ..api import SentinelClient, SentinelResult
-from ..config import load_config
+from ..api import SentinelClient, SentinelResult, get_default_client
+from ..scoring import StreamState
 
 
 TelemetrySource = Iterable[Dict[str, Any]]
 ResultHandler = Callable[[SentinelResult], None]
+AsyncTelemetrySource = AsyncIterable[Dict[str, Any]]
+AsyncResultHandler = Callable[[SentinelResult], Union[None, Awaitable[None]]]
 
 
 def build_default_client() -> SentinelClient:
     """
-    Convenience helper: build a SentinelClient using the default config
-    loader. ADN or node operators can instead construct their own clients.
+    Convenience helper: return the shared SentinelClient built from the
+    default config loader. ADN or node operators can instead construct
+    their own clients.
     """
-    cfg = load_config()
-    return SentinelClient(config=cfg)
+    return get_default_client()
 
 
 def default_print_handler(result: SentinelResult) -> None:
@@ -32,23 +51,280 @@ def default_print_handler(result: SentinelResult) -> None:
     )
 
 
+def _stream_client(client: Optional[SentinelClient], stream_state: Optional[StreamState]) -> SentinelClient:
+    if client is None:
+        client = build_default_client()
+    if stream_state is not None:
+        client = client.with_stream_state(stream_state)
+    return client
+
+
 def watch_stream(
     source: TelemetrySource,
     client: Optional[SentinelClient] = None,
     handler: Optional[ResultHandler] = None,
+    *,
+    stream_state: Optional[StreamState] = None,
 ) -> None:
     """
     Consume a stream of telemetry snapshots and feed them through Sentinel AI v2.
 
-    - `source`  – iterable of dict telemetry snapshots
-    - `client`  – optional pre-configured SentinelClient
-    - `handler` – optional callback to process each SentinelResult
+    - `source`       – iterable of dict telemetry snapshots
+    - `client`       – optional pre-configured SentinelClient
+    - `handler`      – optional callback to process each SentinelResult
+    - `stream_state` – opt-in history for the stateful heuristics, e.g.
+      ``StreamState.for_thresholds(thresholds)``; scoring uses a copy of
+      `client`, which itself is left untouched
     """
-    if client is None:
-        client = build_default_client()
+    client = _stream_client(client, stream_state)
     if handler is None:
         handler = default_print_handler
 
     for snapshot in source:
         result = client.evaluate_snapshot(snapshot)
         handler(result)
+
+
+# How often blocked pipeline stages re-check for an abort (seconds).
+_POLL_SECONDS = 0.05
+_DONE = object()
+
+
+def _put(q: "queue.Queue[Any]", item: Any, abort: threading.Event) -> bool:
+    while not abort.is_set():
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _acquire(slots: threading.BoundedSemaphore, abort: threading.Event) -> bool:
+    while not abort.is_set():
+        if slots.acquire(timeout=_POLL_SECONDS):
+            return True
+    return False
+
+
+def _get(q: "queue.Queue[Any]", abort: threading.Event) -> Any:
+    while not abort.is_set():
+        try:
+            return q.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def watch_stream_pipelined(
+    source: TelemetrySource,
+    client: Optional[SentinelClient] = None,
+    handler: Optional[ResultHandler] = None,
+    *,
+    workers: int = 4,
+    queue_size: int = 64,
+    preserve_order: bool = True,
+    stop_event: Optional[threading.Event] = None,
+    stream_state: Optional[StreamState] = None,
+) -> int:
+    """
+    Pipelined variant of `watch_stream`.
+
+    Reading the source, evaluation and handler dispatch run as separate
+    stages: a reader thread feeds a queue, `workers` threads call
+    `client.evaluate_snapshot`, and the calling thread runs `handler`. A
+    slow source or a slow handler therefore no longer stalls scoring.
+
+    - `preserve_order` – dispatch results in source order (default); when
+      False results are handled as soon as they are ready
+    - `queue_size`     – at most ``queue_size + workers`` snapshots are in
+      flight, so memory stays bounded in both modes
+    - `stop_event`     – when set, no further snapshots are queued (one the
+      source yields afterwards is dropped); everything already queued is
+      still evaluated and handled (graceful drain). The call returns
+      without waiting for a reader blocked inside the source; that daemon
+      thread exits when the source next yields.
+    - `stream_state`   – as for `watch_stream`; workers share it, so with
+      several workers it sees snapshots in completion order
+
+    Threads overlap I/O with scoring but share the GIL. To spread CPU-bound
+    v3 scoring across cores, score batches on worker processes with
+    `sentinel_ai_v2.sharded_evaluator.ShardedV3Evaluator` instead::
+
+        with ShardedV3Evaluator.from_config(load_config(), processes=4) as evaluator:
+            responses = evaluator.evaluate_batch(requests)
+
+    The first exception raised by the source, the client or the handler
+    aborts the pipeline and is re-raised here right away; worker threads
+    finish their current evaluation in the background.
+    Returns the number of results handled.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if queue_size < 1:
+        raise ValueError("queue_size must be >= 1")
+    client = _stream_client(client, stream_state)
+    if handler is None:
+        handler = default_print_handler
+
+    stop = stop_event if stop_event is not None else threading.Event()
+    abort = threading.Event()
+    source_done = threading.Event()
+    errors: List[BaseException] = []
+    # The in-flight semaphore bounds the inbox, so puts never block. The gate
+    # makes "check stop, then queue" atomic with a worker's "stopped and
+    # empty, so exit": nothing is queued after the last worker has left.
+    gate = threading.Lock()
+    inbox: "queue.Queue[Any]" = queue.Queue()
+    outbox: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    in_flight = threading.BoundedSemaphore(queue_size + workers)
+
+    def fail(exc: BaseException) -> None:
+        errors.append(exc)
+        abort.set()
+
+    def read() -> None:
+        try:
+            for seq, snapshot in enumerate(source):
+                if not _acquire(in_flight, abort):
+                    return
+                with gate:
+                    if stop.is_set():
+                        return
+                    inbox.put_nowait((seq, snapshot))
+        except BaseException as exc:
+            fail(exc)
+        finally:
+            with gate:
+                source_done.set()
+
+    def next_snapshot() -> Any:
+        while not abort.is_set():
+            try:
+                return inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                with gate:
+                    if (stop.is_set() or source_done.is_set()) and inbox.empty():
+                        return _DONE
+        return _DONE
+
+    def work() -> None:
+        while True:
+            item = next_snapshot()
+            if item is _DONE:
+                _put(outbox, _DONE, abort)
+                return
+            seq, snapshot = item
+            try:
+                result = client.evaluate_snapshot(snapshot)
+            except BaseException as exc:
+                fail(exc)
+                return
+            if not _put(outbox, (seq, result), abort):
+                return
+
+    reader = threading.Thread(target=read, name="sentinel-watch-reader", daemon=True)
+    pool = [
+        threading.Thread(target=work, name=f"sentinel-watch-worker-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    reader.start()
+    for thread in pool:
+        thread.start()
+
+    handled = 0
+    pending: Dict[int, SentinelResult] = {}
+    next_seq = 0
+    finished = 0
+    try:
+        while finished < workers:
+            item = _get(outbox, abort)
+            if item is _DONE:
+                if abort.is_set():
+                    break
+                finished += 1
+                continue
+            seq, result = item
+            if not preserve_order:
+                handler(result)
+                handled += 1
+                in_flight.release()
+                continue
+            pending[seq] = result
+            while next_seq in pending:
+                handler(pending.pop(next_seq))
+                next_seq += 1
+                handled += 1
+                in_flight.release()
+    except BaseException as exc:
+        fail(exc)
+
+    if errors:
+        raise errors[0]
+    for thread in pool:
+        thread.join()
+    if source_done.is_set():
+        reader.join()
+    return handled
+
+
+async def watch_stream_async(
+    source: AsyncTelemetrySource,
+    client: Optional[SentinelClient] = None,
+    handler: Optional[AsyncResultHandler] = None,
+    *,
+    concurrency: int = 8,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+    stream_state: Optional[StreamState] = None,
+) -> int:
+    """
+    Async variant of `watch_stream` for socket / HTTP telemetry feeds.
+
+    Snapshots from the async `source` are evaluated in `executor` (the
+    loop's default executor when None), with at most `concurrency`
+    evaluations in flight per feed. Results are handed to `handler` in
+    source order; async handlers are awaited. Many feeds can share one
+    event loop and one executor.
+
+    - `timeout` – per-snapshot evaluation limit in seconds; on expiry
+      ``asyncio.TimeoutError`` is raised and the feed stops
+    - `stream_state` – as for `watch_stream`, one per feed
+
+    Cancelling the calling task cancels the evaluations still in flight.
+    Returns the number of results handled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    client = _stream_client(client, stream_state)
+    if handler is None:
+        handler = default_print_handler
+
+    loop = asyncio.get_running_loop()
+    pending: Deque["asyncio.Future[SentinelResult]"] = deque()
+    handled = 0
+
+    async def evaluate(snapshot: Dict[str, Any]) -> SentinelResult:
+        future = loop.run_in_executor(executor, client.evaluate_snapshot, snapshot)
+        return await asyncio.wait_for(future, timeout)
+
+    async def dispatch() -> None:
+        result = await pending.popleft()
+        outcome = handler(result)
+        if inspect.isawaitable(outcome):
+            await outcome
+
+    try:
+        async for snapshot in source:
+            pending.append(asyncio.ensure_future(evaluate(snapshot)))
+            if len(pending) >= concurrency:
+                await dispatch()
+                handled += 1
+        while pending:
+            await dispatch()
+            handled += 1
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return handled
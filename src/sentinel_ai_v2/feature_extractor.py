@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import importlib
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, MutableSequence, Sequence
+
+from .contracts import ReasonCode
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    One fixed slot of the feature layout.
+
+    The slot value is read from ``telemetry[section][key]``; missing sections
+    and missing keys fall back to `default`.
+    """
+
+    name: str
+    section: str
+    key: str
+    default: float = 0.0
+    integral: bool = False
+
+
+# Layout shared by the v3 evaluator, the engine helpers and batch scoring.
+# Order matters: it is the column order of every feature row.
+DEFAULT_FEATURE_SPECS: tuple[FeatureSpec, ...] = (
+    FeatureSpec("entropy_score", "entropy", "score"),
+    FeatureSpec("mempool_score", "mempool", "score"),
+    FeatureSpec("reorg_score", "reorg", "score"),
+    FeatureSpec("entropy_drop", "entropy", "drop"),
+    FeatureSpec("mempool_anomaly", "mempool", "anomaly"),
+    FeatureSpec("reorg_depth", "reorg", "depth", integral=True),
+)
+
+
+def _coerce(value: Any, integral: bool) -> float:
+    try:
+        number = float(int(value)) if integral else float(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(ReasonCode.SNTL_ERROR_BAD_NUMBER.value) from None
+    if not math.isfinite(number):
+        raise ValueError(ReasonCode.SNTL_ERROR_BAD_NUMBER.value)
+    return number
+
+
+def load_numpy(purpose: str) -> Any:
+    """Import NumPy on first use; RuntimeError naming `purpose` when it is missing."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise RuntimeError(f"numpy is required for {purpose}") from exc
+
+
+class FeatureExtractor:
+    """
+    Compiled, spec-driven feature extractor.
+
+    The spec is compiled once into a per-section read plan, so extraction is a
+    single pass over the telemetry sections that writes straight into a flat
+    float64 buffer (``array('d')`` or a NumPy row block) at fixed offsets.
+
+    Fail-closed: a non-mapping section raises ``ValueError`` carrying
+    SNTL_ERROR_INVALID_REQUEST, a non-numeric or non-finite value raises
+    ``ValueError`` carrying SNTL_ERROR_BAD_NUMBER.
+    """
+
+    def __init__(self, specs: Sequence[FeatureSpec] = DEFAULT_FEATURE_SPECS) -> None:
+        if not specs:
+            raise ValueError("feature specs must not be empty")
+        names = tuple(spec.name for spec in specs)
+        if len(set(names)) != len(names):
+            raise ValueError("feature spec names must be unique")
+
+        plan: Dict[str, list[tuple[int, str, float, bool]]] = {}
+        for index, spec in enumerate(specs):
+            plan.setdefault(spec.section, []).append(
+                (index, spec.key, float(spec.default), bool(spec.integral))
+            )
+
+        self.specs: tuple[FeatureSpec, ...] = tuple(specs)
+        self.names: tuple[str, ...] = names
+        self.width: int = len(names)
+        self._plan = tuple((section, tuple(slots)) for section, slots in plan.items())
+        self._integral = tuple(spec.integral for spec in specs)
+        self._defaults = array("d", (float(spec.default) for spec in specs))
+
+    def new_buffer(self, rows: int = 1) -> array:
+        """Allocate a buffer for `rows` feature rows, pre-filled with defaults."""
+        return self._defaults * rows
+
+    def extract_into(
+        self,
+        telemetry: Mapping[str, Any],
+        out: MutableSequence[float],
+        row: int = 0,
+    ) -> None:
+        """Write one feature row for `telemetry` into `out` at row offset `row`."""
+        base = row * self.width
+        for section_name, slots in self._plan:
+            section = telemetry.get(section_name)
+            if not section:
+                for index, _key, default, _integral in slots:
+                    out[base + index] = default
+                continue
+            if not isinstance(section, Mapping):
+                raise ValueError(ReasonCode.SNTL_ERROR_INVALID_REQUEST.value)
+            for index, key, default, integral in slots:
+                value = section.get(key)
+                out[base + index] = default if value is None else _coerce(value, integral)
+
+    def extract(self, telemetry: Mapping[str, Any]) -> array:
+        """Extract one feature row into a fresh ``array('d')``."""
+        buf = self.new_buffer()
+        self.extract_into(telemetry, buf)
+        return buf
+
+    def row_values(self, buf: Sequence[float], row: int = 0) -> tuple[Any, ...]:
+        """Return one row as a tuple, with integral slots converted back to int."""
+        base = row * self.width
+        return tuple(
+            int(buf[base + index]) if integral else float(buf[base + index])
+            for index, integral in enumerate(self._integral)
+        )
+
+    def to_features(self, buf: Sequence[float], row: int = 0) -> Dict[str, Any]:
+        """Convert one row into the flat dict expected by `compute_risk_score`."""
+        return dict(zip(self.names, self.row_values(buf, row)))
+
+    def extract_features(self, telemetry: Mapping[str, Any]) -> Dict[str, Any]:
+        """Convenience: extract one row and return it as a features dict."""
+        return self.to_features(self.extract(telemetry))
+
+    def extract_batch(self, telemetries: Sequence[Mapping[str, Any]]) -> Any:
+        """
+        Extract N telemetry mappings into an ``(N, width)`` float64 NumPy array.
+
+        Rows are written directly into one preallocated buffer that the
+        returned array views without copying.
+        """
+        np = load_numpy("batch feature rows")
+        buf = self.new_buffer(len(telemetries))
+        for row, telemetry in enumerate(telemetries):
+            self.extract_into(telemetry, buf, row)
+        return np.frombuffer(buf, dtype=np.float64).reshape(len(telemetries), self.width)
+
+
+DEFAULT_FEATURE_EXTRACTOR = FeatureExtractor()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator
+from typing import Dict, Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from .adaptive_core_bridge import FeedbackEvent, FeedbackLabel, SentinelAdaptiveCoreBridge, get_shared_bridge
 
 
 def send_feedback_to_adaptive(
@@ -31,7 +35,7 @@ def send_feedback_to_adaptive(
             feedback="TRUE_POSITIVE",
         )
     """
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_shared_bridge()
 
     if not bridge.is_available:
         # No adaptive core installed; safe no-op.
@@ -44,3 +48,54 @@ def send_feedback_to_adaptive(
         event_id=event_id,
         feedback=tag,
     )
+
+
+def send_feedback_batch_to_adaptive(
+    labels: Iterable[FeedbackLabel],
+    *,
+    layer: str = "sentinel_ai_v2",
+    chunk_size: int = 1000,
+    bridge: Optional[SentinelAdaptiveCoreBridge] = None,
+) -> Dict[str, int]:
+    """
+    Bulk variant of `send_feedback_to_adaptive` for labelling jobs.
+
+    `labels` is streamed in chunks and deduplicated by event_id (see
+    `SentinelAdaptiveCoreBridge.submit_feedback_labels`). To submit a
+    labels file:
+
+        send_feedback_batch_to_adaptive(iter_feedback_labels("labels.jsonl"))
+    """
+    bridge = bridge or get_shared_bridge()
+    return bridge.submit_feedback_labels(labels, layer=layer, chunk_size=chunk_size)
+
+
+def iter_feedback_labels(
+    path: "os.PathLike[str] | str",
+    *,
+    layer: str = "sentinel_ai_v2",
+) -> Iterator[FeedbackEvent]:
+    """
+    Stream feedback labels from a file, one at a time.
+
+    ``.csv`` files need a header with ``event_id`` and ``feedback`` columns
+    (``layer`` optional); anything else is read as JSON lines with the same
+    keys. Blank lines are skipped. A malformed row raises ValueError naming
+    the line; rows before it have already been yielded.
+    """
+    name = os.fspath(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if name.lower().endswith(".csv"):
+            rows: Iterator = enumerate(csv.DictReader(f), start=2)
+        else:
+            rows = ((lineno, line) for lineno, line in enumerate(f, start=1) if line.strip())
+        for lineno, row in rows:
+            try:
+                if isinstance(row, str):
+                    row = json.loads(row)
+                event_id, feedback = row["event_id"], row["feedback"]
+                if not event_id or not feedback:
+                    raise ValueError("empty event_id or feedback")
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"{name}:{lineno}: invalid feedback label ({exc})") from exc
+            yield FeedbackEvent(str(event_id), str(row.get("layer") or layer), str(feedback).upper())
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict
+
+
+def reset_lock_in_child(namespace: Dict[str, Any], name: str) -> None:
+    """
+    Give every forked child a fresh lock in ``namespace[name]``.
+
+    The cache a module-level lock guards is inherited as-is, copy-on-write
+    (see `api.warm_up`); the lock itself must not be, since one held by
+    another thread at fork time would stay held forever in the child.
+    A no-op where the platform cannot fork (Windows).
+    """
+    if not hasattr(os, "register_at_fork"):
+        return
+
+    def reset() -> None:
+        namespace[name] = threading.Lock()
+
+    os.register_at_fork(after_in_child=reset)
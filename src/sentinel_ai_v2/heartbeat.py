@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from .adaptive_core_bridge import SentinelAdaptiveCoreBridge, get_shared_bridge
 
 
 def shield_heartbeat(
@@ -23,7 +23,7 @@ def shield_heartbeat(
     When not available:
       - returns a simple status message
     """
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_shared_bridge()
 
     if not bridge.is_available:
         return "Shield heartbeat: Adaptive Core not available."
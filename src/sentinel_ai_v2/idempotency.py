@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass(frozen=True)
+class IdempotencyHit:
+    """Stored outcome for a `request_id` seen before."""
+
+    context_hash: str
+    response: Dict[str, Any]
+
+
+class IdempotencyTable:
+    """
+    Bounded TTL map of ``request_id -> (context_hash, response)``.
+
+    Lets `SentinelV3` answer a retried request from the stored response
+    instead of re-evaluating it. Entries expire `ttl_seconds` after they
+    were stored; beyond `max_entries` the oldest entry is evicted. Responses
+    are deep-copied on the way in and out so callers cannot mutate the
+    stored verdict. Thread-safe.
+
+    The stored context_hash binds telemetry, thresholds and model: use a
+    fresh table whenever the evaluator's thresholds or model change.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self.max_entries = max_entries
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # request_id -> (expires_at, context_hash, response); oldest first
+        self._entries: "OrderedDict[str, tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        while entries:
+            request_id, (expires_at, _, _) = next(iter(entries.items()))
+            if expires_at > now:
+                break
+            del entries[request_id]
+
+    def get(self, request_id: str) -> Optional[IdempotencyHit]:
+        """Return the live entry for `request_id`, or None."""
+        with self._lock:
+            self._expire(self._clock())
+            entry = self._entries.get(request_id)
+        if entry is None:
+            return None
+        return IdempotencyHit(context_hash=entry[1], response=copy.deepcopy(entry[2]))
+
+    def put(self, request_id: str, context_hash: str, response: Dict[str, Any]) -> None:
+        """Store the response for `request_id`; the first stored response wins."""
+        stored = copy.deepcopy(response)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            if request_id in self._entries:
+                return
+            self._entries[request_id] = (now + self.ttl_seconds, context_hash, stored)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
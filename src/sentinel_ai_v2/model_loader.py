@@ -1,66 +1,201 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+import mmap
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from .feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+from .fork_safety import reset_lock_in_child
+from .model_runtime import ModelRuntime, ModelRuntimeError, build_runtime, load_numpy
 
 
 @dataclass
 class LoadedModel:
     """
-    Placeholder container for a loaded model.
+    Container for a verified model and its bound inference runtime.
 
-    In a real implementation this would wrap an ONNX / Torch / TF runtime.
+    `runtime` is shared through the process-wide runtime cache, so loading
+    the same verified file twice reuses one session.
     """
 
     path: Path
     hash: str
+    runtime: Optional[ModelRuntime] = field(default=None, repr=False, compare=False)
 
 
 class ModelVerificationError(Exception):
     """Raised when a model fails integrity checks."""
 
 
-def compute_file_hash(path: Path, algo: str = "sha3_256") -> str:
+# 1 MiB reads keep per-call overhead negligible for multi-hundred-MB models.
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def compute_file_hash(
+    path: Path,
+    algo: str = "sha3_256",
+    chunk_size: int = HASH_CHUNK_SIZE,
+) -> str:
     """Compute a cryptographic hash of a file."""
     hasher = hashlib.new(algo)
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(chunk_size), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
 
 
+def hash_buffer(
+    buf: Any,
+    algo: str = "sha3_256",
+    chunk_size: int = HASH_CHUNK_SIZE,
+) -> str:
+    """Hash a bytes-like buffer in `chunk_size` slices without copying it."""
+    hasher = hashlib.new(algo)
+    with memoryview(buf) as view:
+        for offset in range(0, len(view), chunk_size):
+            hasher.update(view[offset:offset + chunk_size])
+    return hasher.hexdigest()
+
+
+@contextmanager
+def map_model_file(path: Path) -> Iterator[Any]:
+    """
+    Map `path` read-only and yield the mapping.
+
+    The file is opened once; hashing and runtime binding both read from
+    this mapping, so the model is read from disk a single time. JSON
+    documents are decoded from the mapping; ONNX graphs are copied out of
+    it once, since onnxruntime only accepts owned bytes (see
+    `build_runtime`). Empty files (which cannot be mapped) yield ``b""``.
+    """
+    with path.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+        with mapped:
+            yield mapped
+
+
+# (resolved path, verified hash) -> runtime. Keyed on the content hash so a
+# replaced file never reuses a stale session.
+_RUNTIME_CACHE: Dict[Tuple[str, str], ModelRuntime] = {}
+_RUNTIME_CACHE_LOCK = threading.Lock()
+reset_lock_in_child(globals(), "_RUNTIME_CACHE_LOCK")
+
+
+def clear_runtime_cache() -> None:
+    """Drop all cached runtime sessions."""
+    with _RUNTIME_CACHE_LOCK:
+        _RUNTIME_CACHE.clear()
+
+
+def evict_runtime(model: LoadedModel) -> None:
+    """
+    Drop the cached session for `model`.
+
+    Holders of `model` keep using its runtime; only future loads of the
+    same file/hash rebuild it.
+    """
+    with _RUNTIME_CACHE_LOCK:
+        _RUNTIME_CACHE.pop((str(model.path.resolve()), model.hash), None)
+
+
+def _get_runtime(path: Path, model_hash: str, model_bytes: Any, *, warmup: bool) -> ModelRuntime:
+    key = (str(path.resolve()), model_hash)
+    with _RUNTIME_CACHE_LOCK:
+        runtime = _RUNTIME_CACHE.get(key)
+        if runtime is not None:
+            return runtime
+        try:
+            runtime = build_runtime(model_bytes)
+            if warmup:
+                np = load_numpy()
+                runtime.predict(np.zeros((1, DEFAULT_FEATURE_EXTRACTOR.width)))
+        except ModelRuntimeError as exc:
+            raise ModelVerificationError(f"Model runtime unavailable: {exc}") from exc
+        _RUNTIME_CACHE[key] = runtime
+        return runtime
+
+
 def load_and_verify_model(
     model_path: str,
     expected_hash: Optional[str] = None,
+    *,
+    warmup: bool = True,
 ) -> LoadedModel:
     """
-    Load a model from disk and verify its hash if provided.
+    Load a model from disk, verify its hash if provided and bind a runtime.
 
-    This function does *not* load an actual ML runtime; it only provides a
-    safe, verifiable interface and leaves runtime binding up to the devs.
+    The file is memory-mapped once: the hash is computed over the mapping
+    and the same buffer is handed to the runtime, so verification and
+    loading share a single read. The runtime is built once per verified
+    file and cached; with `warmup` a synthetic all-defaults row is scored
+    so the first real request does not pay session initialisation.
+    """
+    path = _existing_model_path(model_path)
+    with map_model_file(path) as model_bytes:
+        actual_hash = _verified_hash(model_bytes, expected_hash)
+        runtime = _get_runtime(path, actual_hash, model_bytes, warmup=warmup)
+    return LoadedModel(path=path, hash=actual_hash, runtime=runtime)
+
+
+def verify_model_file(model_path: str, expected_hash: Optional[str] = None) -> str:
+    """
+    Hash a model file and check it against `expected_hash`, without binding
+    a runtime. Returns the hash; raises like `load_and_verify_model`.
     """
+    with map_model_file(_existing_model_path(model_path)) as model_bytes:
+        return _verified_hash(model_bytes, expected_hash)
+
+
+def _existing_model_path(model_path: str) -> Path:
     path = Path(model_path)
     if not path.exists():
         raise ModelVerificationError(f"Model file not found: {path}")
+    return path
 
-    actual_hash = compute_file_hash(path)
 
+def _verified_hash(model_bytes: Any, expected_hash: Optional[str]) -> str:
+    actual_hash = hash_buffer(model_bytes)
     if expected_hash is not None and actual_hash != expected_hash:
         raise ModelVerificationError(
             f"Model hash mismatch: expected {expected_hash}, got {actual_hash}"
         )
+    return actual_hash
+
+
+def _require_runtime(model: LoadedModel) -> ModelRuntime:
+    if model.runtime is None:
+        raise ModelVerificationError("Model has no bound runtime")
+    return model.runtime
 
-    return LoadedModel(path=path, hash=actual_hash)
+
+def run_batch_inference(model: LoadedModel, rows: Any) -> Any:
+    """
+    Score an ``(N, width)`` block of feature rows in one runtime call.
+
+    Returns a float64 array of N scores in [0.0, 1.0].
+    """
+    runtime = _require_runtime(model)
+    np = load_numpy()
+    block = np.asarray(rows, dtype=np.float64).reshape(-1, DEFAULT_FEATURE_EXTRACTOR.width)
+    return np.asarray(runtime.predict(block), dtype=np.float64)
 
 
 def run_model_inference(model: LoadedModel, features: Any) -> float:
     """
-    Placeholder for model inference.
+    Score one snapshot and return a risk score in [0.0, 1.0].
 
-    Returns a dummy risk score in [0.0, 1.0] so developers can integrate
-    their own real AI runtime without changing the rest of the code.
+    `features` is either the flat features dict or one feature row in the
+    DEFAULT_FEATURE_EXTRACTOR layout (e.g. an ``array('d')`` buffer).
     """
-    _ = (model, features)
-    return 0.5
+    if isinstance(features, Mapping):
+        features = [float(features.get(name, 0.0)) for name in DEFAULT_FEATURE_EXTRACTOR.names]
+    return float(run_batch_inference(model, features)[0])
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from .model_loader import LoadedModel, ModelVerificationError, evict_runtime, load_and_verify_model
+
+logger = logging.getLogger(__name__)
+
+ExpectedHash = Union[str, Callable[[], Optional[str]], None]
+ModelListener = Callable[[LoadedModel], None]
+
+
+class ModelRegistry:
+    """
+    Watches one model file and keeps the current verified LoadedModel.
+
+    When the file changes (mtime, size or inode), the new file is hashed,
+    verified against `expected_hash` and bound to a warmed runtime *before*
+    anything is swapped. Only then is the current model replaced and
+    listeners notified. A file that fails verification is logged and
+    skipped; the previous model stays active (fail-closed).
+
+    `expected_hash` is either a pinned hex digest or a callable returning
+    the digest to accept for the file currently on disk (e.g. read from a
+    release manifest), so a rollout publishes the model and its digest
+    together.
+
+    Usage:
+        registry = ModelRegistry(cfg.model_path, expected_hash=cfg.model_hash)
+        client.attach_model_registry(registry)
+        registry.start(poll_interval_seconds=5.0)
+    """
+
+    def __init__(self, model_path: str, expected_hash: ExpectedHash = None) -> None:
+        self.model_path = Path(model_path)
+        self._expected_hash = expected_hash
+        self._lock = threading.Lock()
+        # Serializes refresh(): a slow load finishing after a newer one must
+        # not record its (stale) fingerprint or error.
+        self._refresh_lock = threading.Lock()
+        self._model: Optional[LoadedModel] = None
+        self._fingerprint: Optional[Tuple[int, int, int]] = None
+        self._listeners: List[ModelListener] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def current(self) -> Optional[LoadedModel]:
+        """The currently active verified model, or None before the first load."""
+        return self._model
+
+    def subscribe(self, listener: ModelListener) -> None:
+        """Call `listener(model)` after every successful swap."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _resolve_expected_hash(self) -> Optional[str]:
+        if callable(self._expected_hash):
+            return self._expected_hash()
+        return self._expected_hash
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.model_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def refresh(self) -> bool:
+        """
+        Check the model file once and swap in a new model if it changed.
+
+        Returns True if a new model became current. Concurrent calls run
+        one at a time.
+        """
+        with self._refresh_lock:
+            fingerprint = self._stat()
+            if fingerprint is None or fingerprint == self._fingerprint:
+                return False
+
+            try:
+                model = load_and_verify_model(
+                    str(self.model_path),
+                    expected_hash=self._resolve_expected_hash(),
+                )
+            except ModelVerificationError as exc:
+                with self._lock:
+                    self._fingerprint = fingerprint
+                    self.last_error = str(exc)
+                logger.warning("Model reload rejected: %s", exc)
+                return False
+
+            with self._lock:
+                self._fingerprint = fingerprint
+                self.last_error = None
+                previous = self._model
+                if previous is not None and previous.hash == model.hash:
+                    return False
+                self._model = model
+                listeners = list(self._listeners)
+
+        if previous is not None:
+            evict_runtime(previous)
+        logger.info("Model swapped: %s", model.hash)
+        for listener in listeners:
+            listener(model)
+        return True
+
+    def start(self, poll_interval_seconds: float = 5.0) -> None:
+        """Load now, then keep polling the model file on a daemon thread."""
+        if self._thread is not None:
+            return
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(poll_interval_seconds,),
+            name="sentinel-model-registry",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, poll_interval_seconds: float) -> None:
+        while not self._stop.wait(poll_interval_seconds):
+            try:
+                self.refresh()
+            except Exception:  # noqa: BLE001 - keep watching; current model stays active
+                logger.exception("Model registry poll failed")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling; the current model stays active."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        self._thread = None
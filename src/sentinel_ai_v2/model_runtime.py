@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, Protocol
+
+from . import feature_extractor
+from .feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+
+LINEAR_MODEL_FORMAT = "sentinel.linear.v1"
+TREE_MODEL_FORMAT = "sentinel.trees.v1"
+SUPPORTED_LINKS = ("logistic", "identity")
+
+
+class ModelRuntimeError(Exception):
+    """Raised when a model file cannot be bound to an inference runtime."""
+
+
+class ModelRuntime(Protocol):
+    """
+    Minimal inference runtime bound to one verified model file.
+
+    `predict` takes an ``(N, width)`` float64 array laid out like
+    DEFAULT_FEATURE_EXTRACTOR and returns N scores in [0.0, 1.0].
+    """
+
+    name: str
+
+    def predict(self, rows: Any) -> Any:
+        ...
+
+
+def load_numpy() -> Any:
+    try:
+        return feature_extractor.load_numpy("model inference")
+    except RuntimeError as exc:
+        raise ModelRuntimeError(str(exc)) from exc
+
+
+def _link(np: Any, z: Any, link: str) -> Any:
+    if link == "logistic":
+        return 1.0 / (1.0 + np.exp(-z))
+    return np.clip(z, 0.0, 1.0)
+
+
+def _dense_weights(np: Any, weights: Any) -> Any:
+    names = DEFAULT_FEATURE_EXTRACTOR.names
+    if isinstance(weights, dict):
+        unknown = set(weights) - set(names)
+        if unknown:
+            raise ModelRuntimeError(f"unknown model features: {sorted(unknown)}")
+        weights = [weights.get(name, 0.0) for name in names]
+    if not isinstance(weights, list) or len(weights) != len(names):
+        raise ModelRuntimeError("weights must be a feature mapping or a full-width list")
+    try:
+        dense = np.asarray(weights, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ModelRuntimeError("weights must be numeric") from exc
+    if not np.all(np.isfinite(dense)):
+        raise ModelRuntimeError("weights must be finite")
+    return dense
+
+
+class LinearModelRuntime:
+    """
+    Pure-NumPy linear / logistic model (format ``sentinel.linear.v1``).
+
+    Serialized as JSON::
+
+        {"format": "sentinel.linear.v1",
+         "weights": {"entropy_drop": 2.5, "reorg_depth": 0.4},
+         "bias": -1.0,
+         "link": "logistic"}
+
+    `weights` may also be a full-width list in feature layout order.
+    """
+
+    name = "numpy-linear"
+
+    def __init__(self, weights: Any, bias: float = 0.0, link: str = "logistic") -> None:
+        if link not in SUPPORTED_LINKS:
+            raise ModelRuntimeError(f"unsupported link: {link}")
+        np = load_numpy()
+        self._np = np
+        self.weights = _dense_weights(np, weights)
+        self.bias = float(bias)
+        self.link = link
+
+    @classmethod
+    def from_document(cls, doc: dict[str, Any]) -> "LinearModelRuntime":
+        if doc.get("format") != LINEAR_MODEL_FORMAT:
+            raise ModelRuntimeError("unsupported model format")
+        return cls(
+            weights=doc.get("weights"),
+            bias=doc.get("bias", 0.0),
+            link=doc.get("link", "logistic"),
+        )
+
+    def predict(self, rows: Any) -> Any:
+        return _link(self._np, rows @ self.weights + self.bias, self.link)
+
+
+class OnnxModelRuntime:
+    """
+    ONNX Runtime session bound to one verified model.
+
+    The session is created once per model (see ``model_loader``'s runtime
+    cache). Scores are taken from the first output; for two-column
+    probability outputs the positive-class column is used.
+    """
+
+    name = "onnxruntime"
+
+    def __init__(self, model_bytes: bytes, ort_module: Any | None = None) -> None:
+        ort = ort_module if ort_module is not None else self._load_ort()
+        self._np = load_numpy()
+        try:
+            self._session = ort.InferenceSession(
+                model_bytes, providers=["CPUExecutionProvider"]
+            )
+            self._input_name = self._session.get_inputs()[0].name
+        except Exception as exc:
+            raise ModelRuntimeError("ONNX session creation failed") from exc
+
+    @staticmethod
+    def _load_ort() -> Any:
+        try:
+            return importlib.import_module("onnxruntime")
+        except ImportError as exc:
+            raise ModelRuntimeError("onnxruntime is required for ONNX models") from exc
+
+    def predict(self, rows: Any) -> Any:
+        np = self._np
+        feed = {self._input_name: np.ascontiguousarray(rows, dtype=np.float32)}
+        out = np.asarray(self._session.run(None, feed)[0], dtype=np.float64)
+        if out.ndim == 2 and out.shape[1] > 1:
+            out = out[:, -1]
+        return np.clip(out.reshape(len(rows)), 0.0, 1.0)
+
+
+def _int_array(np: Any, values: Any, *, field: str) -> Any:
+    if not isinstance(values, list) or not all(
+        isinstance(v, int) and not isinstance(v, bool) for v in values
+    ):
+        raise ModelRuntimeError(f"{field} must be a list of integers")
+    return np.asarray(values, dtype=np.intp)
+
+
+def _float_array(np: Any, values: Any, *, field: str) -> Any:
+    if not isinstance(values, list):
+        raise ModelRuntimeError(f"{field} must be a list of numbers")
+    try:
+        out = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ModelRuntimeError(f"{field} must be a list of numbers") from exc
+    if out.ndim != 1 or not np.all(np.isfinite(out)):
+        raise ModelRuntimeError(f"{field} must be finite numbers")
+    return out
+
+
+class TreeEnsembleRuntime:
+    """
+    Pure-NumPy tree ensemble (format ``sentinel.trees.v1``).
+
+    All trees share flat node arrays; ``roots`` holds each tree's root
+    index. A node with ``feature == -1`` is a leaf carrying ``value``;
+    otherwise rows with ``x[feature] < threshold`` go to ``left`` and the
+    rest to ``right``. The raw score is ``base_score`` plus the sum of the
+    reached leaf values, passed through ``link``::
+
+        {"format": "sentinel.trees.v1",
+         "feature":   [3, -1, -1],
+         "threshold": [0.2, 0.0, 0.0],
+         "left":      [1, -1, -1],
+         "right":     [2, -1, -1],
+         "value":     [0.0, -1.5, 2.0],
+         "roots":     [0],
+         "base_score": 0.0,
+         "link": "logistic"}
+
+    Traversal is vectorised over (rows, trees) and runs exactly
+    `depth` steps: leaves point at themselves, so finished lanes stay put.
+    """
+
+    name = "numpy-trees"
+
+    def __init__(
+        self,
+        *,
+        feature: Any,
+        threshold: Any,
+        left: Any,
+        right: Any,
+        value: Any,
+        roots: Any,
+        base_score: float = 0.0,
+        link: str = "logistic",
+    ) -> None:
+        if link not in SUPPORTED_LINKS:
+            raise ModelRuntimeError(f"unsupported link: {link}")
+        np = load_numpy()
+        self._np = np
+
+        feature_a = _int_array(np, feature, field="feature")
+        left_a = _int_array(np, left, field="left")
+        right_a = _int_array(np, right, field="right")
+        roots_a = _int_array(np, roots, field="roots")
+        threshold_a = _float_array(np, threshold, field="threshold")
+        value_a = _float_array(np, value, field="value")
+
+        n = len(feature_a)
+        if n == 0 or any(len(a) != n for a in (threshold_a, left_a, right_a, value_a)):
+            raise ModelRuntimeError("node arrays must be non-empty and equally sized")
+        if len(roots_a) == 0 or roots_a.min() < 0 or roots_a.max() >= n:
+            raise ModelRuntimeError("roots must index existing nodes")
+
+        is_leaf = feature_a == -1
+        width = DEFAULT_FEATURE_EXTRACTOR.width
+        if np.any((feature_a < -1) | (feature_a >= width)):
+            raise ModelRuntimeError("split feature out of range")
+        for children in (left_a[~is_leaf], right_a[~is_leaf]):
+            if children.size and (children.min() < 0 or children.max() >= n):
+                raise ModelRuntimeError("child index out of range")
+
+        nodes = np.arange(n, dtype=np.intp)
+        self.split_feature = np.where(is_leaf, 0, feature_a)
+        self.threshold = threshold_a
+        self.left = np.where(is_leaf, nodes, left_a)
+        self.right = np.where(is_leaf, nodes, right_a)
+        self.value = value_a
+        self.roots = roots_a
+        self.base_score = float(base_score)
+        self.link = link
+        self.depth = self._measure_depth(is_leaf)
+
+    @classmethod
+    def from_document(cls, doc: dict[str, Any]) -> "TreeEnsembleRuntime":
+        if doc.get("format") != TREE_MODEL_FORMAT:
+            raise ModelRuntimeError("unsupported model format")
+        return cls(
+            feature=doc.get("feature"),
+            threshold=doc.get("threshold"),
+            left=doc.get("left"),
+            right=doc.get("right"),
+            value=doc.get("value"),
+            roots=doc.get("roots"),
+            base_score=doc.get("base_score", 0.0),
+            link=doc.get("link", "logistic"),
+        )
+
+    def _measure_depth(self, is_leaf: Any) -> int:
+        """Longest root-to-leaf path; rejects cycles (fail-closed)."""
+        np = self._np
+        frontier = np.unique(self.roots)
+        for depth in range(len(is_leaf) + 1):
+            inner = frontier[~is_leaf[frontier]]
+            if inner.size == 0:
+                return depth
+            frontier = np.unique(np.concatenate((self.left[inner], self.right[inner])))
+        raise ModelRuntimeError("tree structure contains a cycle")
+
+    def predict(self, rows: Any) -> Any:
+        np = self._np
+        flat = np.ascontiguousarray(rows, dtype=np.float64).ravel()
+        node = np.broadcast_to(self.roots, (len(rows), len(self.roots))).copy()
+        lane = np.arange(len(rows), dtype=np.intp)[:, None] * rows.shape[1]
+        for _ in range(self.depth):
+            go_left = flat[lane + self.split_feature[node]] < self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return _link(np, self.value[node].sum(axis=1) + self.base_score, self.link)
+
+
+_DOCUMENT_RUNTIMES = {
+    LINEAR_MODEL_FORMAT: LinearModelRuntime.from_document,
+    TREE_MODEL_FORMAT: TreeEnsembleRuntime.from_document,
+}
+
+
+# Insignificant whitespace per RFC 8259.
+_JSON_WHITESPACE = frozenset(b" \t\n\r")
+
+
+def _leading_byte(model_bytes: Any) -> int | None:
+    with memoryview(model_bytes) as view:
+        for offset in range(len(view)):
+            byte = view[offset]
+            if byte not in _JSON_WHITESPACE:
+                return byte
+    return None
+
+
+def build_runtime(model_bytes: Any) -> ModelRuntime:
+    """
+    Bind verified model bytes (any bytes-like buffer, e.g. an mmap) to a runtime.
+
+    JSON documents are dispatched on their ``format`` field and decoded
+    straight from `model_bytes` (the decoded text is the only copy);
+    anything else is treated as an ONNX graph. onnxruntime only accepts
+    owned ``bytes``, so ONNX graphs are copied out of the buffer once for
+    session creation. Runtimes never keep a reference to `model_bytes`, so
+    the caller may unmap it afterwards.
+    """
+    if _leading_byte(model_bytes) == ord("{"):
+        try:
+            doc = json.loads(str(model_bytes, "utf-8"))
+        except ValueError as exc:
+            raise ModelRuntimeError("model document is not valid JSON") from exc
+        factory = _DOCUMENT_RUNTIMES.get(doc.get("format"))
+        if factory is None:
+            raise ModelRuntimeError("unsupported model format")
+        return factory(doc)
+    return OnnxModelRuntime(bytes(model_bytes))
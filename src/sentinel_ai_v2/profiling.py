@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import contextvars
+import random
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Marks a request that was considered and not sampled, so nested evaluators
+# follow the outer decision instead of rolling again.
+_SKIPPED = object()
+_CURRENT: contextvars.ContextVar[Any] = contextvars.ContextVar("sentinel_profile_sample", default=None)
+
+METRICS = ("wall", "cpu", "alloc")
+
+
+def _marks(track_allocations: bool) -> Tuple[int, int, int]:
+    alloc = tracemalloc.get_traced_memory()[0] if track_allocations else 0
+    return time.perf_counter_ns(), time.thread_time_ns(), alloc
+
+
+class ProfileSample:
+    """
+    Stage timings for one sampled request.
+
+    `lap(stage)` charges the wall time, thread CPU time and net traced
+    allocation since the previous lap to ``<prefix>;<stage>``; ``lap(None)``
+    charges it to the prefix itself (self time). Nested `StageProfiler.profile`
+    blocks extend the prefix, so stacks read like ``http.evaluate;v3.evaluate;hash``.
+    """
+
+    __slots__ = ("_profiler", "_prefix", "_marks", "_laps")
+
+    def __init__(self, profiler: "StageProfiler", root: str) -> None:
+        self._profiler = profiler
+        self._prefix: List[str] = [root]
+        self._laps: List[Tuple[str, int, int, int]] = []
+        self._marks = _marks(profiler.track_allocations)
+
+    def lap(self, stage: Optional[str] = None) -> None:
+        now = _marks(self._profiler.track_allocations)
+        path = ";".join(self._prefix)
+        if stage is not None:
+            path = f"{path};{stage}"
+        wall, cpu, alloc = self._marks
+        self._laps.append((path, now[0] - wall, now[1] - cpu, now[2] - alloc))
+        self._marks = now
+
+    def _push(self, root: str) -> None:
+        self.lap()
+        self._prefix.append(root)
+
+    def _pop(self) -> None:
+        self.lap()
+        self._prefix.pop()
+
+
+class StageProfiler:
+    """
+    Opt-in sampling profiler for evaluation stages.
+
+    Samples `sample_rate` of the requests passed through `profile`; for each
+    sampled request every stage lap (see `ProfileSample`) is aggregated by
+    stack. With `track_allocations`, tracemalloc runs only while at least one
+    sampled request is in flight (unless something else already started it);
+    allocation deltas are process-wide, so they are approximate when sampled
+    requests overlap.
+
+    Read results with `folded` (flame-graph collapsed stacks) or `stats`.
+    Evaluators without a profiler skip all of this.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        *,
+        track_allocations: bool = True,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be within [0, 1]")
+        self.sample_rate = float(sample_rate)
+        self.track_allocations = track_allocations
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._samples = 0
+        # stack -> [laps, wall_ns, cpu_ns, alloc_bytes]
+        self._stacks: Dict[str, List[int]] = {}
+        self._tracing = 0
+        self._owns_tracemalloc = False
+
+    @contextmanager
+    def profile(self, root: str) -> Iterator[Optional[ProfileSample]]:
+        """
+        Profile one request under stack root `root`.
+
+        Yields the active `ProfileSample`, or None when the request is not
+        sampled. Inside an outer `profile` block the outer decision is
+        reused and `root` nests under the outer stack.
+        """
+        current = _CURRENT.get()
+        if current is _SKIPPED:
+            yield None
+            return
+        if current is not None:
+            current._push(root)
+            try:
+                yield current
+            finally:
+                current._pop()
+            return
+
+        if self._rng() >= self.sample_rate:
+            token = _CURRENT.set(_SKIPPED)
+            try:
+                yield None
+            finally:
+                _CURRENT.reset(token)
+            return
+
+        self._start_tracing()
+        sample = ProfileSample(self, root)
+        token = _CURRENT.set(sample)
+        try:
+            yield sample
+        finally:
+            _CURRENT.reset(token)
+            sample.lap()
+            self._stop_tracing()
+            self._commit(sample._laps)
+
+    def _start_tracing(self) -> None:
+        if not self.track_allocations:
+            return
+        with self._lock:
+            if self._tracing == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            self._tracing += 1
+
+    def _stop_tracing(self) -> None:
+        if not self.track_allocations:
+            return
+        with self._lock:
+            self._tracing -= 1
+            if self._tracing == 0 and self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+
+    def _commit(self, laps: List[Tuple[str, int, int, int]]) -> None:
+        with self._lock:
+            self._samples += 1
+            for path, wall, cpu, alloc in laps:
+                totals = self._stacks.get(path)
+                if totals is None:
+                    totals = self._stacks[path] = [0, 0, 0, 0]
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+                totals[3] += alloc
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples = 0
+            self._stacks = {}
+
+    def folded(self, metric: str = "wall") -> str:
+        """
+        Aggregated stacks in collapsed ``stack value`` lines, as consumed by
+        flamegraph.pl / speedscope. `metric`: ``wall`` / ``cpu`` (microseconds)
+        or ``alloc`` (net bytes, negative deltas shown as 0).
+        """
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {', '.join(METRICS)}")
+        column = METRICS.index(metric) + 1
+        with self._lock:
+            rows = sorted((path, totals[column]) for path, totals in self._stacks.items())
+        scale = 1 if metric == "alloc" else 1000
+        return "".join(f"{path} {max(0, value) // scale}\n" for path, value in rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-stack totals and means as a JSON-ready dict."""
+        with self._lock:
+            stacks = {path: list(totals) for path, totals in self._stacks.items()}
+            samples = self._samples
+        return {
+            "sample_rate": self.sample_rate,
+            "samples": samples,
+            "stacks": {
+                path: {
+                    "laps": laps,
+                    "wall_us": wall / 1000,
+                    "cpu_us": cpu / 1000,
+                    "alloc_bytes": alloc,
+                    "mean_wall_us": wall / 1000 / laps,
+                }
+                for path, (laps, wall, cpu, alloc) in sorted(stacks.items())
+            },
+        }
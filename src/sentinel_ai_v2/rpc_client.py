@@ -1,4 +1,22 @@
-import requests
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+
+def _requests() -> Any:
+    # `requests` is imported on first use so importing this module stays
+    # cheap when no RPC call is ever made.
+    module = globals().get("requests")
+    if module is None:
+        module = globals()["requests"] = importlib.import_module("requests")
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    if name == "requests":
+        return _requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SimpleRpcClient:
@@ -18,7 +36,7 @@ class SimpleRpcClient:
             "method": method,
             "params": params or [],
         }
-        resp = requests.post(self.url, json=payload, auth=self.auth, timeout=10)
+        resp = _requests().post(self.url, json=payload, auth=self.auth, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if data.get("error"):
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
-from .adversarial_engine import analyse_for_adversarial_patterns
+from .adversarial_engine import AdversarialStatsTracker, analyse_for_adversarial_patterns
 from .circuit_breakers import CircuitBreakerOutcome, evaluate_circuit_breakers
 from .config import CircuitBreakerThresholds
-from .correlation_engine import CorrelationResult, correlate_signals
+from .correlation_engine import (
+    CorrelationResult,
+    TemporalCorrelationResult,
+    TemporalCorrelator,
+    correlate_signals,
+)
 
 
 @dataclass
@@ -18,11 +24,14 @@ class SentinelScore:
     details: list[str]
     circuit_breakers: CircuitBreakerOutcome
     correlation: CorrelationResult
+    temporal: Optional[TemporalCorrelationResult] = None
 
 
 def compute_risk_score(
     features: Dict[str, Any],
     thresholds: CircuitBreakerThresholds,
+    correlator: Optional[TemporalCorrelator] = None,
+    adversarial_stats: Optional[AdversarialStatsTracker] = None,
 ) -> SentinelScore:
     """
     Orchestrate correlation, adversarial analysis and circuit breakers
@@ -36,16 +45,36 @@ def compute_risk_score(
       - mempool_anomaly
       - reorg_depth
       - model_score (optional, from offline AI model)
+
+    With a stateful `correlator`, the snapshot is also recorded in its
+    sliding window; all signals firing within the window trips the circuit
+    breaker just like the single-snapshot combo does. A stateful
+    `adversarial_stats` tracker enables the history-based adversarial
+    heuristics (variance suppression, threshold hugging).
     """
     # 1) multi-signal correlation
     correlation = correlate_signals(features)
 
     # 2) adversarial heuristics
-    adv = analyse_for_adversarial_patterns(features)
+    if adversarial_stats is None:
+        adv = analyse_for_adversarial_patterns(features)
+    else:
+        adv = analyse_for_adversarial_patterns(features, tracker=adversarial_stats)
 
     # 3) circuit breakers (can override everything)
     cb = evaluate_circuit_breakers(features, thresholds)
 
+    # 3b) windowed multi-signal correlation (opt-in, stateful)
+    temporal = None
+    if correlator is not None:
+        temporal = correlator.observe(features)
+        if temporal.co_occurrence and not cb.triggered:
+            combo = " + ".join(signal.name for signal in correlator.signals)
+            cb = CircuitBreakerOutcome(
+                triggered=True,
+                reasons=cb.reasons + [f"windowed combo: {combo}"],
+            )
+
     # 4) base score from correlation + adversarial boost
     score = correlation.adjusted_score + adv.risk_boost
     score = max(0.0, min(score, 1.0))
@@ -62,6 +91,8 @@ def compute_risk_score(
         status = "NORMAL"
 
     details = list(correlation.details)
+    if temporal is not None:
+        details.extend(temporal.details)
     if adv.reasons:
         details.extend([f"adversarial:{r}" for r in adv.reasons])
     if cb.reasons:
@@ -73,4 +104,46 @@ def compute_risk_score(
         details=details,
         circuit_breakers=cb,
         correlation=correlation,
+        temporal=temporal,
     )
+
+
+@dataclass
+class StreamState:
+    """
+    Opt-in history for the stateful scoring heuristics of one stream.
+
+    Attach it to a `SentinelV3` (``stream_state=``), a `SentinelClient`
+    (`attach_stream_state` / `with_stream_state`) or pass it to the
+    ``watch_stream*`` loops. With a `correlator`, signals firing within
+    `multi_signal_window_seconds` of each other trip the circuit breaker;
+    with `adversarial_stats`, variance suppression and threshold hugging
+    add their risk boosts. Verdicts then depend on the stream's history,
+    not only on the snapshot. Calls are serialized, so concurrent
+    evaluations may share one state.
+    """
+
+    correlator: Optional[TemporalCorrelator] = None
+    adversarial_stats: Optional[AdversarialStatsTracker] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @classmethod
+    def for_thresholds(
+        cls,
+        thresholds: CircuitBreakerThresholds,
+        *,
+        correlate: bool = True,
+        adversarial: bool = True,
+    ) -> "StreamState":
+        """A state with both stateful heuristics (unless disabled) configured from `thresholds`."""
+        return cls(
+            correlator=TemporalCorrelator(thresholds) if correlate else None,
+            adversarial_stats=AdversarialStatsTracker(thresholds) if adversarial else None,
+        )
+
+    def score(self, features: Dict[str, Any], thresholds: CircuitBreakerThresholds) -> SentinelScore:
+        """`compute_risk_score` with this state's history."""
+        with self._lock:
+            return compute_risk_score(
+                features, thresholds, correlator=self.correlator, adversarial_stats=self.adversarial_stats
+            )
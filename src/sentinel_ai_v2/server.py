@@ -1,25 +1,136 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import hmac
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Annotated, Any, AsyncIterator, Dict, List, Literal, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
+from .api import SentinelClient
+from .config import load_config
+from .profiling import StageProfiler
 from .wrapper.sentinel_wrapper import SentinelWrapper
 
+if TYPE_CHECKING:
+    from .shared_status import SharedStatusStore
+    from .verdict_log import VerdictLogWriter
+
 
 # -----------------------------
 # FastAPI app & global wrapper
 # -----------------------------
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Write out verdicts still buffered when the server stops.
+    if verdict_log is not None:
+        verdict_log.close()
+
+
 app = FastAPI(
     title="Sentinel AI v3 API",
     description="External analysis layer enforcing DigiByte Quantum Shield Contract v3.",
     version="3.2.0",
+    lifespan=_lifespan,
 )
 
-# Single shared wrapper instance – stores the last result in Monitor
-wrapper = SentinelWrapper()
+# Shared-memory status file for multi-worker deployments, e.g.
+# /dev/shm/sentinel-status (unset = each worker reports only its own
+# results, /status/aggregate disabled).
+SHARED_STATUS_ENV_VAR = "SENTINEL_SHARED_STATUS_PATH"
+
+
+def _status_store_from_env() -> Optional[SharedStatusStore]:
+    path = os.environ.get(SHARED_STATUS_ENV_VAR)
+    if not path:
+        return None
+    from .shared_status import SharedStatusStore
+
+    return SharedStatusStore(path)
+
+
+status_store = _status_store_from_env()
+
+# Single shared wrapper instance – stores the last result in Monitor. It
+# owns its client, so the profiler and verdict log attached below do not
+# leak into `get_default_client()` users in the same process.
+wrapper = SentinelWrapper(client=SentinelClient(load_config()), status_store=status_store)
+
+# Directory of the verdict log: every /evaluate verdict is appended to it and
+# /history serves it (unset = no history, endpoint disabled). A directory
+# has a single writer, so use it with single-worker servers.
+VERDICT_LOG_ENV_VAR = "SENTINEL_VERDICT_LOG_DIR"
+
+
+def _verdict_log_from_env(target: SentinelWrapper) -> Optional[VerdictLogWriter]:
+    """Open the verdict log configured in the environment and attach it to `target`."""
+    log_dir = os.environ.get(VERDICT_LOG_ENV_VAR)
+    if not log_dir:
+        return None
+    from .verdict_log import VerdictLogWriter
+
+    built = VerdictLogWriter(log_dir)
+    target.attach_verdict_log(built)
+    return built
+
+
+verdict_log = _verdict_log_from_env(wrapper)
+
+# Fraction of /evaluate requests to stage-profile (unset = profiling off,
+# /admin/profile disabled). Set SENTINEL_PROFILE_ALLOCATIONS=0 to skip
+# tracemalloc allocation deltas.
+PROFILE_SAMPLE_RATE_ENV_VAR = "SENTINEL_PROFILE_SAMPLE_RATE"
+PROFILE_ALLOCATIONS_ENV_VAR = "SENTINEL_PROFILE_ALLOCATIONS"
+
+
+def _profiler_from_env(target: SentinelWrapper) -> Optional[StageProfiler]:
+    """Build the profiler configured in the environment and attach it to `target`."""
+    rate = os.environ.get(PROFILE_SAMPLE_RATE_ENV_VAR)
+    if not rate:
+        return None
+    built = StageProfiler(
+        float(rate),
+        track_allocations=os.environ.get(PROFILE_ALLOCATIONS_ENV_VAR, "1") != "0",
+    )
+    target.attach_profiler(built)
+    return built
+
+
+profiler = _profiler_from_env(wrapper)
+
+# /admin/* endpoints are off unless this is set, and then answer only
+# requests that send the same value in the X-Sentinel-Admin-Token header.
+ADMIN_TOKEN_ENV_VAR = "SENTINEL_ADMIN_TOKEN"
+
+
+def _require_admin(token: Optional[str]) -> None:
+    expected = os.environ.get(ADMIN_TOKEN_ENV_VAR)
+    if not expected:
+        raise HTTPException(status_code=404, detail="admin_not_enabled")
+    if token is None or not hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="forbidden")
+
+# Warm the evaluator at import: "1" loads and exercises it, "prefork" also
+# freezes the heap for copy-on-write sharing. Use "prefork" when the app is
+# imported once in a parent that forks workers (gunicorn --preload).
+WARMUP_ENV_VAR = "SENTINEL_WARMUP"
+
+
+def _warm_up_from_env(target: SentinelWrapper) -> Optional[Dict[str, Any]]:
+    """Run the warm-up configured in the environment on `target`."""
+    mode = os.environ.get(WARMUP_ENV_VAR, "0")
+    if mode in ("", "0"):
+        return None
+    if mode not in ("1", "prefork"):
+        raise ValueError(f"{WARMUP_ENV_VAR} must be 0, 1 or prefork")
+    return target.warm_up(freeze=mode == "prefork")
+
+
+warmup = _warm_up_from_env(wrapper)
 
 
 # -----------------------------
@@ -55,6 +166,11 @@ class HealthResponse(BaseModel):
     status: str
 
 
+class HistoryResponse(BaseModel):
+    count: int
+    verdicts: List[Dict[str, Any]]
+
+
 # -----------------------------
 # Endpoints
 # -----------------------------
@@ -79,7 +195,11 @@ async def evaluate(req: EvaluateRequest) -> EvaluateResponse:
     This is what dashboards, bots, and ADN nodes typically call.
     """
     try:
-        result = wrapper.evaluate(req.telemetry)
+        if profiler is None:
+            result = wrapper.evaluate(req.telemetry)
+        else:
+            with profiler.profile("http.evaluate"):
+                result = wrapper.evaluate(req.telemetry)
     except Exception as exc:  # noqa: BLE001 – simplified for reference implementation
         # Fail-closed: do not leak internal exception strings to clients by default.
         # (Operators can inspect server logs in a real deployment.)
@@ -108,3 +228,86 @@ async def status() -> StatusResponse:
         risk_score=float(last.get("risk_score", 0.0)),
         details=last.get("details", []),
     )
+
+
+@app.get("/status/aggregate")
+async def status_aggregate() -> Dict[str, Any]:
+    """
+    Latest status, totals, risk mean / stddev / max and the last-minute
+    evaluation window across every worker sharing the status store.
+    """
+    if status_store is None:
+        raise HTTPException(status_code=404, detail="shared_status_not_configured")
+    return status_store.snapshot()
+
+
+@app.get("/history", response_model=HistoryResponse)
+def history(
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    decision: Optional[List[str]] = Query(None),
+    tier: Optional[List[str]] = Query(None),
+    context_hash: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=100_000),
+) -> HistoryResponse:
+    """
+    Query persisted verdicts (see `verdict_log`).
+
+    Filter by time range (epoch seconds, `until` exclusive), decision and
+    tier, or fetch every verdict for one `context_hash`. A plain ``def``:
+    FastAPI runs it in its threadpool, so file mapping and scanning do not
+    block the event loop.
+    """
+    from .verdict_history import VerdictHistory, rows_to_dicts
+    from .verdict_log import VerdictLogError
+
+    log_dir = os.environ.get(VERDICT_LOG_ENV_VAR)
+    if not log_dir:
+        raise HTTPException(status_code=404, detail="verdict_log_not_configured")
+
+    try:
+        with VerdictHistory(log_dir) as log:
+            if context_hash:
+                rows = log.by_context_hash(context_hash, limit=limit)
+            else:
+                rows = log.query(
+                    None if since is None else int(since * 1_000_000_000),
+                    None if until is None else int(until * 1_000_000_000),
+                    decisions=decision,
+                    tiers=tier,
+                    limit=limit,
+                )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="invalid_query") from exc
+    except (VerdictLogError, RuntimeError) as exc:
+        raise HTTPException(status_code=500, detail="internal_error") from exc
+
+    verdicts = rows_to_dicts(rows)
+    return HistoryResponse(count=len(verdicts), verdicts=verdicts)
+
+
+@app.get("/admin/profile", response_model=None)
+async def profile(
+    format: Literal["folded", "json"] = "folded",
+    metric: Literal["wall", "cpu", "alloc"] = "wall",
+    reset: bool = False,
+    x_sentinel_admin_token: Annotated[Optional[str], Header()] = None,
+) -> Any:
+    """
+    Aggregated stage profile of sampled /evaluate requests.
+
+    `folded` returns flame-graph collapsed stacks (flamegraph.pl, speedscope)
+    weighted by `metric`; `json` returns per-stack totals. `reset` clears
+    the aggregate after reading it. Requires the admin token (see
+    `ADMIN_TOKEN_ENV_VAR`) and an enabled profiler; 404 otherwise.
+    """
+    _require_admin(x_sentinel_admin_token)
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="profiling_not_enabled")
+    if format == "folded":
+        body: Any = PlainTextResponse(profiler.folded(metric))
+    else:
+        body = profiler.stats()
+    if reset:
+        profiler.reset()
+    return body
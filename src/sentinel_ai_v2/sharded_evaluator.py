@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import CircuitBreakerThresholds, SentinelConfig
+from .model_loader import load_and_verify_model, verify_model_file
+from .v3 import SentinelV3
+
+# Per-process evaluator, built once by `_init_worker` in each worker process.
+_WORKER_V3: Optional[SentinelV3] = None
+
+
+def _init_worker(
+    thresholds: CircuitBreakerThresholds,
+    model_path: Optional[str],
+    model_hash: Optional[str],
+) -> None:
+    global _WORKER_V3
+    model = None
+    if model_path is not None:
+        model = load_and_verify_model(model_path, expected_hash=model_hash)
+    _WORKER_V3 = SentinelV3(thresholds=thresholds, model=model)
+
+
+def _evaluate_chunk(requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    assert _WORKER_V3 is not None, "worker not initialised"
+    return _WORKER_V3.evaluate_batch(requests)
+
+
+class ShardedV3Evaluator:
+    """
+    Shield Contract v3 evaluation sharded across worker processes.
+
+    Each of the `processes` workers loads and warms its own `SentinelV3`
+    (and model runtime) once, then evaluates pickled chunks of up to
+    `chunk_size` requests with `SentinelV3.evaluate_batch`, so scoring and
+    hashing run outside the parent's GIL.
+
+    The model file is hashed (and checked against `expected_hash`) in the
+    parent, without binding a runtime there, and workers load it pinned to
+    that hash: every shard scores with the same bytes, and a missing or
+    tampered file fails here rather than inside a worker.
+
+    Exposes the same `evaluate` / `evaluate_batch` API as `SentinelV3`;
+    responses come back in request order. Use as a context manager or call
+    `close()` to stop the workers.
+    """
+
+    def __init__(
+        self,
+        thresholds: CircuitBreakerThresholds,
+        *,
+        model_path: Optional[str] = None,
+        expected_hash: Optional[str] = None,
+        processes: Optional[int] = None,
+        chunk_size: int = 64,
+        mp_context: Any = None,
+    ) -> None:
+        processes = processes if processes is not None else (os.cpu_count() or 1)
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        model_hash = None
+        if model_path is not None:
+            model_hash = verify_model_file(model_path, expected_hash)
+
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.model_hash = model_hash
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(thresholds, model_path, model_hash),
+        )
+
+    @classmethod
+    def from_config(cls, config: SentinelConfig, **kwargs: Any) -> "ShardedV3Evaluator":
+        """Build from a `SentinelConfig`; unlike `SentinelClient`, a bad model fails loudly."""
+        return cls(
+            config.circuit_breakers,
+            model_path=config.model_path or None,
+            expected_hash=config.model_hash,
+            **kwargs,
+        )
+
+    def evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.evaluate_batch([request])[0]
+
+    def evaluate_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Split `requests` into chunks, score them on the workers, keep order."""
+        size = self.chunk_size
+        chunks = [list(requests[i:i + size]) for i in range(0, len(requests), size)]
+        responses: List[Dict[str, Any]] = []
+        for chunk in self._pool.map(_evaluate_chunk, chunks):
+            responses.extend(chunk)
+        return responses
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "ShardedV3Evaluator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
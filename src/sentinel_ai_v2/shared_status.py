@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# -----------------------------
+# Shared layout (version 1)
+# -----------------------------
+#
+# One file, normally under /dev/shm, mapped by every worker process:
+#
+#   header  magic, version, slot count, slot size, window seconds (64 bytes)
+#   slots   `slot_count` fixed-size, 64-byte aligned slots
+#
+# Each worker process claims one slot and is its only writer, so a seqlock
+# per slot is enough: the writer bumps the slot's sequence to odd, updates
+# the slot and bumps it back to even; readers copy the slot and retry while
+# the sequence was odd or changed. Updates are plain memory writes and reads
+# never block writers, so there is no per-request IPC. Slot claims (once
+# per process) take an flock on the file.
+#
+# Slot: sequence, owner pid, latest status, counters, risk aggregates, a
+# ring of per-second window buckets and the latest details as JSON.
+
+MAGIC = b"SNTLSHS1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHII")
+HEADER_SIZE = 64
+SLOT_HEAD = struct.Struct("<QIBxHdqQ5Q3d")
+WINDOW_BUCKET = struct.Struct("<qII")
+WINDOW_SECONDS = 60
+DETAILS_BYTES = 512
+
+_WINDOW_OFFSET = SLOT_HEAD.size
+_DETAILS_OFFSET = _WINDOW_OFFSET + WINDOW_SECONDS * WINDOW_BUCKET.size
+SLOT_SIZE = -(-(_DETAILS_OFFSET + DETAILS_BYTES) // 64) * 64
+
+# Status codes are stored as small integers; index 0 means "unknown".
+STATUSES: Tuple[str, ...] = ("NORMAL", "ELEVATED", "HIGH", "CRITICAL", "ERROR")
+
+# Reader gives up on a slot whose writer keeps it busy (or died mid-write).
+MAX_READ_RETRIES = 1000
+
+
+class SharedStatusError(Exception):
+    """Raised when the shared status file is malformed or has no free slot."""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _encode_details(details: Sequence[Any]) -> bytes:
+    items = [str(d) for d in details]
+    while True:
+        raw = json.dumps(items, separators=(",", ":")).encode("utf-8")
+        if len(raw) <= DETAILS_BYTES:
+            return raw
+        items.pop()  # keep the leading (most relevant) details that fit
+
+
+class SharedStatusStore:
+    """
+    Cross-process store for the latest status, rolling risk aggregates and
+    a per-second window of evaluation counts.
+
+    Every process that calls `record` claims its own slot on first use (a
+    forked child claims a new one); a slot left by a dead process is adopted
+    with its counters, so totals survive worker restarts. `latest` and
+    `snapshot` merge all claimed slots. Thread-safe within a process.
+    """
+
+    def __init__(
+        self,
+        path: "os.PathLike[str] | str",
+        *,
+        slots: int = 64,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        if not 1 <= slots <= 0xFFFF:
+            raise ValueError("slots must be within [1, 65535]")
+        self.path = os.fspath(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pid = 0
+        self._slot = -1
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self.slots = self._init_file(slots)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._mm = mmap.mmap(self._fd, HEADER_SIZE + self.slots * SLOT_SIZE)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._words = memoryview(self._mm).cast("Q")
+
+    def _init_file(self, slots: int) -> int:
+        size = os.fstat(self._fd).st_size
+        if size == 0:
+            os.ftruncate(self._fd, HEADER_SIZE + slots * SLOT_SIZE)
+            os.pwrite(self._fd, HEADER.pack(MAGIC, FORMAT_VERSION, slots, SLOT_SIZE, WINDOW_SECONDS), 0)
+            return slots
+        if size < HEADER_SIZE:
+            raise SharedStatusError(f"truncated shared status file: {self.path}")
+        magic, version, count, slot_size, window = HEADER.unpack(os.pread(self._fd, HEADER.size, 0))
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise SharedStatusError(f"not a shared status file (or unsupported version): {self.path}")
+        if slot_size != SLOT_SIZE or window != WINDOW_SECONDS or size < HEADER_SIZE + count * SLOT_SIZE:
+            raise SharedStatusError(f"shared status layout mismatch: {self.path}")
+        return count
+
+    # --- writer side ---
+
+    def _claim(self) -> int:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for index in range(self.slots):
+                offset = HEADER_SIZE + index * SLOT_SIZE
+                owner = struct.unpack_from("<I", self._mm, offset + 8)[0]
+                if owner == 0 or not _pid_alive(owner):
+                    seq = offset // 8
+                    if self._words[seq] % 2:
+                        self._words[seq] += 1  # previous owner died mid-write
+                    struct.pack_into("<I", self._mm, offset + 8, os.getpid())
+                    return index
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        raise SharedStatusError(f"no free slot in {self.path} ({self.slots} slots)")
+
+    def record(self, status: str, risk_score: float, details: Sequence[Any] = ()) -> None:
+        """Publish one evaluation result from this process."""
+        now = self._clock()
+        encoded = _encode_details(details)
+        code = STATUSES.index(status) + 1 if status in STATUSES else 0
+        risk = float(risk_score)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._slot = self._claim()
+                self._pid = os.getpid()
+            offset = HEADER_SIZE + self._slot * SLOT_SIZE
+            head = list(SLOT_HEAD.unpack_from(self._mm, offset))
+            second = now // 1_000_000_000
+            bucket_offset = offset + _WINDOW_OFFSET + (second % WINDOW_SECONDS) * WINDOW_BUCKET.size
+            bucket_second, count, alerts = WINDOW_BUCKET.unpack_from(self._mm, bucket_offset)
+            if bucket_second != second:
+                count = alerts = 0
+
+            head[2] = code
+            head[3] = len(encoded)
+            head[4] = risk
+            head[5] = now
+            head[6] += 1
+            if code:
+                head[6 + code] += 1
+            if math.isfinite(risk):
+                head[12] += risk
+                head[13] += risk * risk
+                head[14] = max(head[14], risk)
+
+            seq = offset // 8
+            head[0] = self._words[seq] + 1
+            self._words[seq] = head[0]  # odd: readers retry until the update is complete
+            SLOT_HEAD.pack_into(self._mm, offset, *head)
+            WINDOW_BUCKET.pack_into(
+                self._mm, bucket_offset, second, count + 1, alerts + (status != "NORMAL")
+            )
+            self._mm[offset + _DETAILS_OFFSET:offset + _DETAILS_OFFSET + len(encoded)] = encoded
+            self._words[seq] = head[0] + 1
+
+    # --- reader side ---
+
+    def _read_slot(self, index: int) -> Optional[bytes]:
+        offset = HEADER_SIZE + index * SLOT_SIZE
+        seq = offset // 8
+        for _ in range(MAX_READ_RETRIES):
+            before = self._words[seq]
+            if before % 2:
+                continue
+            raw = self._mm[offset:offset + SLOT_SIZE]
+            if self._words[seq] == before:
+                return raw
+        return None
+
+    def _slots(self) -> List[bytes]:
+        found = []
+        for index in range(self.slots):
+            if struct.unpack_from("<I", self._mm, HEADER_SIZE + index * SLOT_SIZE + 8)[0]:
+                raw = self._read_slot(index)
+                if raw is not None:
+                    found.append(raw)
+        return found
+
+    @staticmethod
+    def _latest_of(raws: List[bytes]) -> Optional[Dict[str, Any]]:
+        best: Optional[Tuple[int, bytes]] = None
+        for raw in raws:
+            updated = SLOT_HEAD.unpack_from(raw)[5]
+            if updated and (best is None or updated > best[0]):
+                best = (updated, raw)
+        if best is None:
+            return None
+        head = SLOT_HEAD.unpack_from(best[1])
+        details = json.loads(best[1][_DETAILS_OFFSET:_DETAILS_OFFSET + head[3]] or b"[]")
+        return {
+            "status": STATUSES[head[2] - 1] if head[2] else "UNKNOWN",
+            "risk_score": head[4],
+            "details": details,
+            "updated_at": head[5] / 1e9,
+        }
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """The most recent status recorded by any process, or None."""
+        return self._latest_of(self._slots())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest status plus totals, risk aggregates and window counts across all processes."""
+        raws = self._slots()
+        now_second = self._clock() // 1_000_000_000
+        evaluations = 0
+        by_status = [0] * len(STATUSES)
+        risk_sum = risk_sq_sum = 0.0
+        risk_max = 0.0
+        window_count = window_alerts = 0
+        for raw in raws:
+            head = SLOT_HEAD.unpack_from(raw)
+            evaluations += head[6]
+            for i in range(len(STATUSES)):
+                by_status[i] += head[7 + i]
+            risk_sum += head[12]
+            risk_sq_sum += head[13]
+            risk_max = max(risk_max, head[14])
+            for second, count, alerts in WINDOW_BUCKET.iter_unpack(raw[_WINDOW_OFFSET:_DETAILS_OFFSET]):
+                if now_second - WINDOW_SECONDS < second <= now_second:
+                    window_count += count
+                    window_alerts += alerts
+
+        mean = risk_sum / evaluations if evaluations else 0.0
+        variance = max(0.0, risk_sq_sum / evaluations - mean * mean) if evaluations else 0.0
+        return {
+            "latest": self._latest_of(raws),
+            "slots": len(raws),
+            "evaluations": evaluations,
+            "by_status": dict(zip(STATUSES, by_status)),
+            "risk": {"mean": mean, "stddev": math.sqrt(variance), "max": risk_max},
+            "window": {
+                "seconds": WINDOW_SECONDS,
+                "evaluations": window_count,
+                "alerts": window_alerts,
+                "per_second": window_count / WINDOW_SECONDS,
+            },
+        }
+
+    def close(self) -> None:
+        self._words.release()
+        self._mm.close()
+        os.close(self._fd)
+
+    def __enter__(self) -> "SharedStatusStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, MutableSequence, Optional, Sequence, Tuple, Union
+import copy
 import time
 
 from .config import CircuitBreakerThresholds
-from .data_intake import TelemetrySnapshot, normalize_raw_telemetry
-from .model_loader import LoadedModel, run_model_inference
-from .scoring import SentinelScore, compute_risk_score
+from .feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+from .model_loader import LoadedModel, run_batch_inference, run_model_inference
+from .scoring import SentinelScore, StreamState, compute_risk_score
 
 from .contracts import ReasonCode, SentinelV3Request, canonical_hash_v3
 
+if TYPE_CHECKING:
+    from .idempotency import IdempotencyTable
+    from .profiling import StageProfiler
+
 
 @dataclass(frozen=True)
 class SentinelV3:
@@ -20,9 +25,127 @@ class SentinelV3:
     COMPONENT: str = "sentinel"
     CONTRACT_VERSION: int = 3
 
+    # Optional retry dedup by request_id (see `IdempotencyTable`).
+    idempotency: Optional[IdempotencyTable] = field(default=None, compare=False)
+
+    # Optional per-stage sampling profiler (see `StageProfiler`).
+    profiler: Optional[StageProfiler] = field(default=None, compare=False)
+
+    # Optional stream history for the stateful heuristics (see `StreamState`).
+    stream_state: Optional[StreamState] = field(default=None, compare=False)
+
     def evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.profiler is None:
+            return self._evaluate(request, None)
+        with self.profiler.profile("v3.evaluate") as sample:
+            return self._evaluate(request, None if sample is None else sample.lap)
+
+    def _evaluate(
+        self,
+        request: Dict[str, Any],
+        lap: Optional[Callable[[str], None]],
+    ) -> Dict[str, Any]:
         start = time.time()
 
+        parsed = self._parse(request, start, lap)
+        if isinstance(parsed, dict):
+            return parsed
+        if lap is not None:
+            lap("parse;gates")
+
+        context_hash = None
+        if self.idempotency is not None:
+            context_hash = self._context_hash(parsed, model_used=self.model is not None)
+            if lap is not None:
+                lap("hash")
+            replayed = self._replay(parsed, context_hash, start)
+            if lap is not None:
+                lap("idempotency")
+            if replayed is not None:
+                return replayed
+
+        buf = DEFAULT_FEATURE_EXTRACTOR.new_buffer()
+        failed = self._extract(parsed, buf, 0, start)
+        if lap is not None:
+            lap("extract")
+        if failed is not None:
+            return failed
+
+        model_score = None
+        if self.model is not None:
+            model_score = run_model_inference(self.model, buf)
+            if lap is not None:
+                lap("model")
+
+        return self._respond(parsed, buf, 0, model_score, start, context_hash, lap)
+
+    def evaluate_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate N requests with one batched model call.
+
+        Each response is identical to what `evaluate` returns for the same
+        requests in order; only model inference is amortised across the
+        batch. With idempotency on, a request_id repeated within the batch
+        gets a copy of its first response (same context) or a conflict
+        error (different context), exactly as sequential calls would.
+        """
+        start = time.time()
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        parsed: List[Optional[SentinelV3Request]] = [None] * len(requests)
+        buf = DEFAULT_FEATURE_EXTRACTOR.new_buffer(len(requests))
+
+        context_hashes: List[Optional[str]] = [None] * len(requests)
+        # request_id -> (first row, context_hash); (row, first row) repeats
+        first_seen: Dict[str, Tuple[int, str]] = {}
+        repeats: List[Tuple[int, int]] = []
+
+        for row, request in enumerate(requests):
+            req = self._parse(request, start)
+            if isinstance(req, dict):
+                responses[row] = req
+                continue
+            if self.idempotency is not None:
+                context_hash = self._context_hash(req, model_used=self.model is not None)
+                context_hashes[row] = context_hash
+                replayed = self._replay(req, context_hash, start)
+                if replayed is not None:
+                    responses[row] = replayed
+                    continue
+                first_row, first_hash = first_seen.setdefault(req.request_id, (row, context_hash))
+                if first_row != row:
+                    if first_hash == context_hash:
+                        repeats.append((row, first_row))
+                    else:
+                        responses[row] = self._conflict(req, start)
+                    continue
+            failed = self._extract(req, buf, row, start)
+            if failed is not None:
+                responses[row] = failed
+                continue
+            parsed[row] = req
+
+        model_scores = None
+        if self.model is not None and any(req is not None for req in parsed):
+            model_scores = run_batch_inference(self.model, buf)
+
+        for row, req in enumerate(parsed):
+            if req is not None:
+                model_score = None if model_scores is None else float(model_scores[row])
+                responses[row] = self._respond(
+                    req, buf, row, model_score, start, context_hashes[row]
+                )
+        for row, first_row in repeats:
+            responses[row] = copy.deepcopy(responses[first_row])
+
+        return [resp for resp in responses if resp is not None]
+
+    def _parse(
+        self,
+        request: Any,
+        start: float,
+        lap: Optional[Callable[[str], None]] = None,
+    ) -> Union[SentinelV3Request, Dict[str, Any]]:
+        """Contract gates; returns the parsed request or an ERROR response."""
         # --- Hard version gate FIRST (outermost contract rule) ---
         if not isinstance(request, dict):
             return self._error_response(
@@ -42,7 +165,7 @@ class SentinelV3:
 
         # Strict contract parsing (fail-closed)
         try:
-            req = SentinelV3Request.from_dict(request)
+            req = SentinelV3Request.from_dict(request, lap=lap)
         except ValueError as e:
             reason = str(e) or ReasonCode.SNTL_ERROR_INVALID_REQUEST.value
             return self._error_response(
@@ -68,37 +191,100 @@ class SentinelV3:
                 latency_ms=self._latency_ms(start),
             )
 
-        # Existing v2 pipeline (unchanged behavior)
-        snapshot: TelemetrySnapshot = normalize_raw_telemetry(req.telemetry)
+        return req
+
+    def _replay(
+        self,
+        req: SentinelV3Request,
+        context_hash: str,
+        start: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stored response for a retried request_id, or None when unseen.
+
+        Reusing a request_id with a different context (telemetry) is a
+        deterministic fail-closed error, which doubles as replay detection.
+        """
+        assert self.idempotency is not None
+        hit = self.idempotency.get(req.request_id)
+        if hit is None:
+            return None
+        if hit.context_hash == context_hash:
+            return hit.response
+        return self._conflict(req, start)
 
-        features: Dict[str, Any] = {
-            "entropy_score": (snapshot.entropy or {}).get("score", 0.0),
-            "mempool_score": (snapshot.mempool or {}).get("score", 0.0),
-            "reorg_score": (snapshot.reorg or {}).get("score", 0.0),
-            "entropy_drop": (snapshot.entropy or {}).get("drop", 0.0),
-            "mempool_anomaly": (snapshot.mempool or {}).get("anomaly", 0.0),
-            "reorg_depth": (snapshot.reorg or {}).get("depth", 0),
+    def _conflict(self, req: SentinelV3Request, start: float) -> Dict[str, Any]:
+        return self._error_response(
+            request_id=req.request_id,
+            reason_code=ReasonCode.SNTL_ERROR_IDEMPOTENCY_CONFLICT.value,
+            details={"error": "request_id reused with different context"},
+            latency_ms=self._latency_ms(start),
+        )
+
+    def _context_hash(self, req: SentinelV3Request, *, model_used: bool) -> str:
+        hashed_context: Dict[str, Any] = {
+            "component": self.COMPONENT,
+            "contract_version": self.CONTRACT_VERSION,
+            "telemetry": req.telemetry,
+            "thresholds": self._thresholds_fingerprint(self.thresholds),
+            "model_used": bool(model_used),
         }
+        if model_used:
+            # Bind the verdict to the exact model file that produced it.
+            hashed_context["model_hash"] = getattr(self.model, "hash", None)
+        return canonical_hash_v3(hashed_context)
+
+    def _extract(
+        self,
+        req: SentinelV3Request,
+        buf: MutableSequence[float],
+        row: int,
+        start: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Existing v2 feature set, read straight from telemetry through the
+        compiled fixed-layout extractor. Returns an ERROR response on failure.
+        """
+        try:
+            DEFAULT_FEATURE_EXTRACTOR.extract_into(req.telemetry, buf, row)
+        except ValueError as e:
+            return self._error_response(
+                request_id=req.request_id,
+                reason_code=str(e),
+                details={"error": str(e)},
+                latency_ms=self._latency_ms(start),
+            )
+        return None
+
+    def _respond(
+        self,
+        req: SentinelV3Request,
+        buf: MutableSequence[float],
+        row: int,
+        model_score: Optional[float],
+        start: float,
+        context_hash: Optional[str] = None,
+        lap: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        features: Dict[str, Any] = DEFAULT_FEATURE_EXTRACTOR.to_features(buf, row)
 
         model_used = False
-        if self.model is not None:
-            features["model_score"] = run_model_inference(self.model, features)
+        if model_score is not None:
+            features["model_score"] = model_score
             model_used = True
 
-        sentinel_score: SentinelScore = compute_risk_score(
-            features=features,
-            thresholds=self.thresholds,
-        )
+        sentinel_score: SentinelScore
+        if self.stream_state is None:
+            sentinel_score = compute_risk_score(features=features, thresholds=self.thresholds)
+        else:
+            sentinel_score = self.stream_state.score(features, self.thresholds)
+        if lap is not None:
+            lap("scoring")
 
-        context_hash = canonical_hash_v3(
-            {
-                "component": self.COMPONENT,
-                "contract_version": self.CONTRACT_VERSION,
-                "telemetry": req.telemetry,
-                "thresholds": self._thresholds_fingerprint(self.thresholds),
-                "model_used": bool(model_used),
-            }
-        )
+        if context_hash is None:
+            context_hash = self._context_hash(req, model_used=model_used)
+            if lap is not None:
+                lap("hash")
 
         decision = self._map_status_to_decision(sentinel_score.status)
 
@@ -109,7 +295,7 @@ class SentinelV3:
             else [ReasonCode.SNTL_V2_SIGNAL.value]
         )
 
-        return {
+        response = {
             "contract_version": self.CONTRACT_VERSION,
             "component": self.COMPONENT,
             "request_id": req.request_id,
@@ -134,6 +320,11 @@ class SentinelV3:
                 "fail_closed": True,
             },
         }
+        if self.idempotency is not None:
+            self.idempotency.put(req.request_id, context_hash, response)
+        if lap is not None:
+            lap("respond")
+        return response
 
     @staticmethod
     def _latency_ms(start: float) -> int:
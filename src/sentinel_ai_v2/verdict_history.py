@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .feature_extractor import load_numpy
+from .verdict_log import (
+    DECISIONS,
+    HEADER,
+    REASON_CODES,
+    RECORD,
+    TIERS,
+    VerdictLogError,
+    list_segments,
+    read_header,
+)
+
+
+def record_dtype(np: Any) -> Any:
+    """NumPy structured dtype laid out exactly like `verdict_log.RECORD`."""
+    dtype = np.dtype(
+        [
+            ("timestamp_ns", "<i8"),
+            ("risk_score", "<f8"),
+            ("latency_ms", "<u4"),
+            ("context_hash", "S32"),
+            ("request_id", "S64"),
+            ("decision", "u1"),
+            ("tier", "u1"),
+            ("model_used", "u1"),
+            ("reason_count", "u1"),
+            ("reason_codes", "<u2", (4,)),
+        ]
+    )
+    assert dtype.itemsize == RECORD.size
+    return dtype
+
+
+def _codes(table: tuple, names: Optional[Iterable[str]]) -> Optional[List[int]]:
+    if names is None:
+        return None
+    codes = []
+    for name in names:
+        if name not in table:
+            raise ValueError(f"unknown value: {name}")
+        codes.append(table.index(name) + 1)
+    return codes
+
+
+class _Segment:
+    __slots__ = ("path", "records", "time_index", "hash_index", "_maps")
+
+    def __init__(self, np: Any, path: Path, dtype: Any) -> None:
+        self.path = path
+        self._maps: List[mmap.mmap] = []
+        data = self._map_file(path)
+        count = 0
+        self.records = np.empty(0, dtype=dtype)
+        if data:  # a just-created segment may not have its header on disk yet
+            read_header(data[: HEADER.size], path)
+            # Ignore a partially written tail record of the active segment.
+            count = (len(data) - HEADER.size) // RECORD.size
+            self.records = np.frombuffer(data, dtype=dtype, count=count, offset=HEADER.size)
+
+        tidx = path.with_suffix(".tidx")
+        raw = tidx.read_bytes() if tidx.exists() else b""
+        entries = np.frombuffer(raw[: len(raw) - len(raw) % 16], dtype="<i8").reshape(-1, 2)
+        self.time_index = entries[entries[:, 1] < count]
+
+        hidx = path.with_suffix(".hidx")
+        self.hash_index = None
+        if hidx.exists():
+            entry = np.dtype([("context_hash", "S32"), ("record_no", "<u4")])
+            self.hash_index = np.frombuffer(self._map_file(hidx), dtype=entry)
+
+    def _map_file(self, path: Path) -> Any:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return mapped
+
+    def time_range(self, np: Any, start: Optional[int], end: Optional[int]) -> Any:
+        """Records with ``start <= timestamp_ns < end`` as a view."""
+        ts = self.records["timestamp_ns"]
+        lo, hi = 0, len(ts)
+        if start is not None:
+            lo = self._bound(np, ts, start)
+        if end is not None:
+            hi = self._bound(np, ts, end)
+        return self.records[lo:hi]
+
+    def _bound(self, np: Any, ts: Any, value: int) -> int:
+        # Narrow to one index stride via the sparse time index, then search it.
+        index_ts = self.time_index[:, 0]
+        block = int(np.searchsorted(index_ts, value, side="left"))
+        lo = int(self.time_index[block - 1, 1]) if block > 0 else 0
+        hi = int(self.time_index[block, 1]) + 1 if block < len(index_ts) else len(ts)
+        return lo + int(np.searchsorted(ts[lo:hi], value, side="left"))
+
+    def by_hash(self, np: Any, digest: bytes) -> Any:
+        if self.hash_index is None:
+            return self.records[self.records["context_hash"] == digest]
+        keys = self.hash_index["context_hash"]
+        lo = int(np.searchsorted(keys, digest, side="left"))
+        hi = int(np.searchsorted(keys, digest, side="right"))
+        return self.records[np.sort(self.hash_index["record_no"][lo:hi])]
+
+    def close(self) -> None:
+        self.records = self.hash_index = None
+        for mapped in self._maps:
+            mapped.close()
+
+
+class VerdictHistory:
+    """
+    Read-only query engine over a `VerdictLogWriter` directory.
+
+    Segments are memory-mapped and viewed as NumPy structured arrays (see
+    `record_dtype`), so no record is deserialized to answer a query. Time
+    ranges are found by binary search over each segment's sparse time index
+    and segments entirely outside the range are skipped; context_hash
+    lookups binary-search the sealed segments' hash index and scan only the
+    active segment.
+
+    Results are copied out of the mappings and stay valid after `close`.
+    Call `refresh` to pick up records written since the history was opened.
+    """
+
+    def __init__(self, directory: "os.PathLike[str] | str") -> None:
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise VerdictLogError(f"verdict log directory not found: {self.directory}")
+        self._np = load_numpy("verdict history queries")
+        self.dtype = record_dtype(self._np)
+        self._segments: List[_Segment] = []
+        self.refresh()
+
+    def refresh(self) -> None:
+        self.close()
+        self._segments = [
+            _Segment(self._np, path, self.dtype) for _, path in list_segments(self.directory)
+        ]
+
+    def __len__(self) -> int:
+        return sum(len(segment.records) for segment in self._segments)
+
+    def _empty(self) -> Any:
+        return self._np.empty(0, dtype=self.dtype)
+
+    def _finish(self, parts: List[Any], limit: Optional[int]) -> Any:
+        out = self._np.concatenate(parts) if parts else self._empty()
+        return out[:limit] if limit is not None else out
+
+    def query(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+        *,
+        decisions: Optional[Iterable[str]] = None,
+        tiers: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Any:
+        """
+        Verdicts with ``start_ns <= timestamp_ns < end_ns`` (either bound
+        optional), optionally filtered by decision and tier names, oldest
+        first, at most `limit` rows.
+        """
+        np = self._np
+        decision_codes = _codes(DECISIONS, decisions)
+        tier_codes = _codes(TIERS, tiers)
+        parts: List[Any] = []
+        remaining = limit
+        for segment in self._segments:
+            records = segment.records
+            if not len(records):
+                continue
+            if end_ns is not None and records[0]["timestamp_ns"] >= end_ns:
+                break
+            if start_ns is not None and records[-1]["timestamp_ns"] < start_ns:
+                continue
+            rows = segment.time_range(np, start_ns, end_ns)
+            if decision_codes is not None:
+                rows = rows[np.isin(rows["decision"], decision_codes)]
+            if tier_codes is not None:
+                rows = rows[np.isin(rows["tier"], tier_codes)]
+            if remaining is not None:
+                rows = rows[:remaining]
+                remaining -= len(rows)
+            parts.append(rows)
+            if remaining == 0:
+                break
+        return self._finish(parts, limit)
+
+    def by_context_hash(self, context_hash: str, *, limit: Optional[int] = None) -> Any:
+        """Every verdict recorded for `context_hash` (64 hex chars), oldest first."""
+        try:
+            digest = bytes.fromhex(context_hash)
+        except ValueError:
+            raise ValueError("context_hash must be hex") from None
+        if len(digest) != 32:
+            raise ValueError("context_hash must be 32 bytes")
+        parts = [segment.by_hash(self._np, digest) for segment in self._segments]
+        return self._finish(parts, limit)
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self) -> "VerdictHistory":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _decode(table: tuple, code: int) -> str:
+    return table[code - 1] if 1 <= code <= len(table) else "UNKNOWN"
+
+
+def rows_to_dicts(rows: Any) -> List[Dict[str, Any]]:
+    """Decode structured rows into JSON-ready dicts (for CLI / HTTP output)."""
+    out = []
+    for row in rows:
+        count = int(row["reason_count"])
+        out.append(
+            {
+                "timestamp_ns": int(row["timestamp_ns"]),
+                "request_id": row["request_id"].decode("utf-8", errors="replace"),
+                "context_hash": row["context_hash"].ljust(32, b"\0").hex(),
+                "decision": _decode(DECISIONS, int(row["decision"])),
+                "tier": _decode(TIERS, int(row["tier"])),
+                "risk_score": float(row["risk_score"]),
+                "reason_codes": [
+                    _decode(REASON_CODES, int(code)) for code in row["reason_codes"][:count]
+                ],
+                "latency_ms": int(row["latency_ms"]),
+                "model_used": bool(row["model_used"]),
+            }
+        )
+    return out
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
+
+from .contracts import ReasonCode
+
+# -----------------------------
+# On-disk format (version 1)
+# -----------------------------
+#
+# A log is a directory of segments ``verdicts-<seq>.log``. Each segment is a
+# 16-byte header followed by fixed-width little-endian records appended in
+# non-decreasing timestamp order. Side files per segment:
+#
+#   .tidx  sparse time index: (timestamp_ns int64, record_no int64) for every
+#          `index_stride`-th record, appended as records are written
+#   .hidx  context_hash index: (context_hash 32 bytes, record_no uint32)
+#          sorted by hash; written once when the segment is sealed
+#
+# A segment without .hidx is the active (unsealed) one.
+
+MAGIC = b"SNTLVLG1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHI")
+RECORD = struct.Struct("<qdI32s64sBBBB4H")
+TIME_INDEX_ENTRY = struct.Struct("<qq")
+HASH_INDEX_ENTRY = struct.Struct("<32sI")
+
+REQUEST_ID_BYTES = 64
+MAX_REASON_CODES = 4
+
+# Enum codes are stored as small integers; index 0 means "no code".
+# ReasonCode members must only ever be appended, never reordered.
+DECISIONS: Tuple[str, ...] = ("ALLOW", "WARN", "BLOCK", "ERROR")
+TIERS: Tuple[str, ...] = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+REASON_CODES: Tuple[str, ...] = tuple(code.value for code in ReasonCode)
+UNKNOWN_CODE = 0xFF
+UNKNOWN_REASON = 0xFFFF
+
+_SEGMENT_RE = re.compile(r"^verdicts-(\d{8})\.log$")
+
+
+class VerdictLogError(Exception):
+    """Raised when a verdict log segment is malformed or cannot be written."""
+
+
+def segment_path(directory: Path, seq: int) -> Path:
+    return directory / f"verdicts-{seq:08d}.log"
+
+
+def list_segments(directory: Path) -> List[Tuple[int, Path]]:
+    """Return ``(seq, path)`` for every segment in `directory`, oldest first."""
+    found = []
+    for entry in directory.iterdir():
+        match = _SEGMENT_RE.match(entry.name)
+        if match:
+            found.append((int(match.group(1)), entry))
+    return sorted(found)
+
+
+def _encode_code(table: Tuple[str, ...], value: Any, unknown: int) -> int:
+    try:
+        return table.index(str(value)) + 1
+    except ValueError:
+        return unknown
+
+
+def _decode_code(table: Tuple[str, ...], code: int) -> Optional[str]:
+    if 1 <= code <= len(table):
+        return table[code - 1]
+    return None
+
+
+def _hash_bytes(context_hash: str) -> bytes:
+    try:
+        raw = bytes.fromhex(context_hash)
+    except (TypeError, ValueError):
+        return bytes(32)
+    return raw if len(raw) == 32 else bytes(32)
+
+
+def _request_id_bytes(request_id: str) -> bytes:
+    raw = str(request_id).encode("utf-8")[:REQUEST_ID_BYTES]
+    # never split a multi-byte character
+    return raw.decode("utf-8", errors="ignore").encode("utf-8")
+
+
+@dataclass(frozen=True)
+class VerdictRecord:
+    """
+    One persisted verdict.
+
+    `request_id` is stored truncated to 64 UTF-8 bytes; at most four reason
+    codes are kept, codes outside `ReasonCode` are stored as unknown.
+    """
+
+    timestamp_ns: int
+    request_id: str
+    context_hash: str
+    decision: str
+    tier: str
+    risk_score: float
+    reason_codes: Tuple[str, ...]
+    latency_ms: int
+    model_used: bool = False
+
+    @classmethod
+    def from_response(
+        cls, response: Mapping[str, Any], timestamp_ns: int
+    ) -> "VerdictRecord":
+        """Build a record from a Shield Contract v3 response dict."""
+        risk = response.get("risk") or {}
+        meta = response.get("meta") or {}
+        return cls(
+            timestamp_ns=int(timestamp_ns),
+            request_id=str(response.get("request_id", "unknown")),
+            context_hash=str(response.get("context_hash", "")),
+            decision=str(response.get("decision", "")),
+            tier=str(risk.get("tier", "")),
+            risk_score=float(risk.get("score", 0.0)),
+            reason_codes=tuple(str(c) for c in response.get("reason_codes") or ()),
+            latency_ms=int(meta.get("latency_ms", 0)),
+            model_used=bool(meta.get("model_used", False)),
+        )
+
+    def pack(self) -> bytes:
+        reasons = [
+            _encode_code(REASON_CODES, code, UNKNOWN_REASON)
+            for code in self.reason_codes[:MAX_REASON_CODES]
+        ]
+        count = len(reasons)
+        reasons += [0] * (MAX_REASON_CODES - count)
+        return RECORD.pack(
+            self.timestamp_ns,
+            self.risk_score,
+            max(0, min(self.latency_ms, 0xFFFFFFFF)),
+            _hash_bytes(self.context_hash),
+            _request_id_bytes(self.request_id),
+            _encode_code(DECISIONS, self.decision, UNKNOWN_CODE),
+            _encode_code(TIERS, self.tier, UNKNOWN_CODE),
+            1 if self.model_used else 0,
+            count,
+            *reasons,
+        )
+
+    @classmethod
+    def unpack(cls, raw: bytes) -> "VerdictRecord":
+        (ts, score, latency, chash, rid, decision, tier, model_used, count, *reasons) = (
+            RECORD.unpack(raw)
+        )
+        return cls(
+            timestamp_ns=ts,
+            request_id=rid.rstrip(b"\0").decode("utf-8"),
+            context_hash=chash.hex(),
+            decision=_decode_code(DECISIONS, decision) or "UNKNOWN",
+            tier=_decode_code(TIERS, tier) or "UNKNOWN",
+            risk_score=score,
+            reason_codes=tuple(
+                _decode_code(REASON_CODES, code) or "UNKNOWN" for code in reasons[:count]
+            ),
+            latency_ms=latency,
+            model_used=bool(model_used),
+        )
+
+
+def read_header(raw: bytes, path: Path) -> None:
+    """Validate a segment header; raises VerdictLogError on mismatch."""
+    if len(raw) < HEADER.size:
+        raise VerdictLogError(f"truncated segment header: {path}")
+    magic, version, record_size, _ = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+        raise VerdictLogError(f"unsupported verdict log segment: {path}")
+
+
+class VerdictLogWriter:
+    """
+    Append-only, segment-rotated verdict log.
+
+    Records are buffered and written in batches of `batch_size`, or once
+    the oldest buffered record has waited `flush_interval` seconds; a
+    background thread applies that deadline (and the fsync cadence) while
+    no appends arrive. `flush` writes the batch now, and the file is
+    fsynced at most every `fsync_interval` seconds (``0`` fsyncs on every
+    write). A segment is sealed after `segment_records` records: its
+    context_hash index is written and a new segment is started.
+
+    Reopening a directory resumes the last unsealed segment. A torn record
+    left by a crash is truncated away and the segment's time index is
+    rebuilt. Timestamps are clamped to be non-decreasing so each segment
+    stays sorted by time. Thread-safe; one process writes a directory.
+    `close` stops the flusher and must be called to release the writer.
+    """
+
+    def __init__(
+        self,
+        directory: "os.PathLike[str] | str",
+        *,
+        segment_records: int = 1 << 18,
+        batch_size: int = 256,
+        fsync_interval: float = 1.0,
+        flush_interval: float = 1.0,
+        index_stride: int = 1024,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        if segment_records < 1 or batch_size < 1 or index_stride < 1:
+            raise ValueError("segment_records, batch_size and index_stride must be >= 1")
+        if fsync_interval < 0:
+            raise ValueError("fsync_interval must be >= 0")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.flush_interval = flush_interval
+        self.index_stride = index_stride
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._pending_since = 0.0
+        self._last_ts = 0
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+        self._closed = False
+        self._open_active()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="sentinel-verdict-log", daemon=True)
+        self._flusher.start()
+
+    # --- segment management ---
+
+    def _open_active(self) -> None:
+        segments = list_segments(self.directory)
+        if segments and not segments[-1][1].with_suffix(".hidx").exists():
+            self._seq, path = segments[-1]
+            self._recover(path)
+        else:
+            self._seq = segments[-1][0] + 1 if segments else 0
+            self._start_segment()
+
+    def _start_segment(self) -> None:
+        path = segment_path(self.directory, self._seq)
+        self._data = open(path, "xb")
+        self._data.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, 0))
+        self._data.flush()  # readers may map the segment right away
+        self._tidx = open(path.with_suffix(".tidx"), "wb")
+        self._count = 0
+
+    def _recover(self, path: Path) -> None:
+        self._data = open(path, "r+b")
+        read_header(self._data.read(HEADER.size), path)
+        size = self._data.seek(0, os.SEEK_END)
+        count = (size - HEADER.size) // RECORD.size
+        self._data.truncate(HEADER.size + count * RECORD.size)
+        self._tidx = open(path.with_suffix(".tidx"), "wb")
+        for record_no in range(0, count, self.index_stride):
+            self._tidx.write(TIME_INDEX_ENTRY.pack(self._read_ts(record_no), record_no))
+        if count:
+            self._last_ts = self._read_ts(count - 1)
+        self._data.seek(0, os.SEEK_END)
+        self._count = count
+
+    def _read_ts(self, record_no: int) -> int:
+        self._data.seek(HEADER.size + record_no * RECORD.size)
+        return struct.unpack("<q", self._data.read(8))[0]
+
+    def _seal(self) -> None:
+        self._sync(force=True)
+        self._data.close()
+        self._tidx.close()
+        path = segment_path(self.directory, self._seq)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offsets = range(HEADER.size + 20, HEADER.size + self._count * RECORD.size, RECORD.size)
+            entries = sorted((mm[o:o + 32], n) for n, o in enumerate(offsets))
+        tmp = path.with_suffix(".hidx.tmp")
+        with open(tmp, "wb") as f:
+            f.write(b"".join(HASH_INDEX_ENTRY.pack(h, n) for h, n in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path.with_suffix(".hidx"))
+        self._seq += 1
+        self._start_segment()
+
+    # --- writing ---
+
+    def append(self, record: VerdictRecord) -> None:
+        with self._lock:
+            if self._closed:
+                raise VerdictLogError("verdict log is closed")
+            ts = max(int(record.timestamp_ns), self._last_ts)
+            self._last_ts = ts
+            now = time.monotonic()
+            if not self._pending:
+                self._pending_since = now
+            self._pending.append(replace(record, timestamp_ns=ts).pack())
+            if len(self._pending) >= self.batch_size or now - self._pending_since >= self.flush_interval:
+                self._write_pending()
+
+    def append_response(self, response: Mapping[str, Any]) -> None:
+        """Record a v3 response, timestamped now."""
+        self.append(VerdictRecord.from_response(response, self._clock()))
+
+    def _write_pending(self) -> None:
+        for raw in self._pending:
+            if self._count % self.index_stride == 0:
+                ts = struct.unpack_from("<q", raw)[0]
+                self._tidx.write(TIME_INDEX_ENTRY.pack(ts, self._count))
+            self._data.write(raw)
+            self._count += 1
+            if self._count >= self.segment_records:
+                self._seal()
+        self._pending.clear()
+        self._sync(force=False)
+
+    def _sync(self, *, force: bool) -> None:
+        self._data.flush()
+        self._tidx.flush()
+        now = time.monotonic()
+        if force or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._data.fileno())
+            os.fsync(self._tidx.fileno())
+            self._last_fsync = now
+            self._unsynced = False
+        else:
+            self._unsynced = True
+
+    def _run(self) -> None:
+        # Idle-time deadlines: appends check them too, but a quiet writer
+        # would otherwise hold a partial batch (or skip an fsync) forever.
+        while not self._stop.wait(self.flush_interval / 2):
+            with self._lock:  # after close nothing is pending or unsynced
+                if self._pending and time.monotonic() - self._pending_since >= self.flush_interval:
+                    self._write_pending()
+                elif self._unsynced:
+                    self._sync(force=False)
+
+    def flush(self, *, fsync: bool = False) -> None:
+        """Write buffered records; fsync now if `fsync`, else on the configured cadence."""
+        with self._lock:
+            if self._closed:
+                return
+            self._write_pending()
+            if fsync:
+                self._sync(force=True)
+
+    def close(self) -> None:
+        """Flush, fsync and close. The active segment stays open for appends on reopen."""
+        with self._lock:
+            if self._closed:
+                return
+            self._write_pending()
+            self._sync(force=True)
+            self._data.close()
+            self._tidx.close()
+            self._closed = True
+        self._stop.set()
+        self._flusher.join()
+
+    def __enter__(self) -> "VerdictLogWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def iter_records(path: "os.PathLike[str] | str") -> Iterator[VerdictRecord]:
+    """Decode every complete record of one segment (pure Python, no NumPy)."""
+    path = Path(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    read_header(raw, path)
+    for offset in range(HEADER.size, len(raw) - RECORD.size + 1, RECORD.size):
+        yield VerdictRecord.unpack(raw[offset:offset + RECORD.size])
@@ -1,26 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from ..api import SentinelResult
 
+if TYPE_CHECKING:
+    from ..shared_status import SharedStatusStore
+
 
 @dataclass
 class Monitor:
     """
     Simple in-memory monitor storing the last SentinelResult.
+
+    With a `store`, every result is also published to it and `last_status`
+    reports the most recent result of any process sharing the store.
     """
 
     last_result: Optional[SentinelResult] = None
+    store: Optional[SharedStatusStore] = field(default=None, compare=False, repr=False)
 
     def update(self, result: SentinelResult) -> None:
         self.last_result = result
+        if self.store is not None:
+            self.store.record(result.status, result.risk_score, result.details)
 
     def last_status(self) -> Dict[str, Any]:
         """
         Return a compact status snapshot suitable for health checks / dashboards.
         """
+        if self.store is not None:
+            latest = self.store.latest()
+            if latest is not None:
+                return {k: latest[k] for k in ("status", "risk_score", "details")}
+
         if self.last_result is None:
             return {"status": "NO_DATA", "risk_score": 0.0, "details": []}
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from ..api import SentinelClient, SentinelResult
-from ..config import load_config
+from ..api import SentinelClient, SentinelResult, get_default_client, warm_up
 from .workflow import run_full_workflow
 from .monitor import Monitor
 
+if TYPE_CHECKING:
+    from ..profiling import StageProfiler
+    from ..shared_status import SharedStatusStore
+    from ..verdict_log import VerdictLogWriter
+
 
 class SentinelWrapper:
     """
@@ -19,13 +23,16 @@ class SentinelWrapper:
         status = wrapper.last_status()
     """
 
-    def __init__(self, client: Optional[SentinelClient] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[SentinelClient] = None,
+        status_store: Optional[SharedStatusStore] = None,
+    ) -> None:
         if client is None:
-            cfg = load_config()
-            client = SentinelClient(config=cfg)
+            client = get_default_client()
 
         self._client = client
-        self._monitor = Monitor()
+        self._monitor = Monitor(store=status_store)
 
     def evaluate(self, raw_telemetry: Dict[str, Any]) -> SentinelResult:
         """
@@ -35,6 +42,18 @@ class SentinelWrapper:
         self._monitor.update(result)
         return result
 
+    def attach_profiler(self, profiler: Optional[StageProfiler]) -> None:
+        """Sample per-stage evaluation timings into `profiler`; None disables."""
+        self._client.attach_profiler(profiler)
+
+    def attach_verdict_log(self, writer: Optional[VerdictLogWriter]) -> None:
+        """Persist every evaluation's v3 verdict to `writer`; None detaches."""
+        self._client.attach_verdict_log(writer)
+
+    def warm_up(self, *, freeze: bool = False) -> Dict[str, Any]:
+        """Warm this wrapper's client before serving (see `api.warm_up`)."""
+        return warm_up(self._client, freeze=freeze)
+
     def last_status(self) -> Dict[str, Any]:
         """
         Get last known status summary (for dashboards / health checks).
@@ -2,16 +2,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from ..api import SentinelClient, SentinelResult
-from ..config import load_config
+from ..api import SentinelClient, SentinelResult, get_default_client
 
 
 def _get_client(client: Optional[SentinelClient] = None) -> SentinelClient:
-    """Return provided client or build a default one from config."""
+    """Return provided client or the shared default one built from config."""
     if client is not None:
         return client
-    cfg = load_config()
-    return SentinelClient(config=cfg)
+    return get_default_client()
 
 
 def run_full_workflow(
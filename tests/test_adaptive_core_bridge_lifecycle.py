@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import threading
+import types
+
+import pytest
+
+import sentinel_ai_v2.adaptive_core_bridge as acb
+from sentinel_ai_v2.adaptive_hooks import report_reorg_anomaly_to_adaptive
+from sentinel_ai_v2.feedback_hooks import send_feedback_to_adaptive
+from sentinel_ai_v2.heartbeat import shield_heartbeat
+
+
+class Packet:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class Interface:
+    def __init__(self) -> None:
+        self.packets = []
+        self.closed = False
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def submit_threat_packet(self, packet):
+        self.entered.set()
+        self.gate.wait(5)
+        if packet.kwargs["threat_type"] == "boom":
+            raise RuntimeError("rejected")
+        self.packets.append(packet.kwargs["threat_type"])
+
+    def submit_feedback_events(self, events):
+        self.feedback = [e.feedback for e in events]
+
+    def get_immune_report_text(self, min_severity=0):
+        return f"REPORT:{min_severity}"
+
+    def get_adaptive_state(self):
+        return types.SimpleNamespace(global_threshold=0.5, layer_weights={})
+
+    def get_last_update_metadata(self):
+        return {}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def core(monkeypatch):
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", Interface)
+    monkeypatch.setattr(acb, "ThreatPacket", Packet)
+    acb.close_shared_bridge()
+    yield
+    acb.close_shared_bridge()
+
+
+def test_shared_bridge_is_built_once_across_threads(core):
+    built = []
+
+    def factory():
+        built.append(1)
+        return acb.SentinelAdaptiveCoreBridge()
+
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(acb.get_shared_bridge(factory))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1 and len({id(b) for b in seen}) == 1
+    assert acb.get_shared_bridge() is seen[0]
+
+
+def test_hooks_default_to_the_shared_bridge(core):
+    bridge = acb.get_shared_bridge()
+
+    report_reorg_anomaly_to_adaptive(100, 0.5)
+    report_reorg_anomaly_to_adaptive(101, 0.7)
+    send_feedback_to_adaptive(layer="sentinel", event_id="e", feedback="true_positive")
+    assert "REPORT:0" in shield_heartbeat()
+
+    assert bridge._interface.packets == ["reorg_pattern", "reorg_pattern"]
+    assert bridge._interface.feedback == ["TRUE_POSITIVE"]
+    assert acb.get_shared_bridge() is bridge
+
+
+def test_close_shared_bridge_closes_and_forgets_it(core):
+    bridge = acb.get_shared_bridge()
+    acb.close_shared_bridge()
+
+    assert bridge._interface.closed and bridge.is_available is False
+    assert acb.get_shared_bridge() is not bridge
+
+    foreign = acb.SentinelAdaptiveCoreBridge()
+    acb._SHARED = (os.getpid() + 1, foreign)  # inherited from a parent process
+    acb.close_shared_bridge()
+    assert foreign.is_available  # the parent's bridge is not ours to close
+
+
+def test_forked_child_builds_its_own_bridge(core):
+    parent = acb.get_shared_bridge()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        os._exit(0 if acb.get_shared_bridge() is not parent else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_submit_threat_nowait_queues_and_counts(core):
+    bridge = acb.SentinelAdaptiveCoreBridge()
+    assert bridge.flush() is True  # nothing queued yet
+
+    assert bridge.submit_threat_nowait("sentinel", "reorg", 5, "d", block_height=7)
+    assert bridge.submit_threat_nowait("sentinel", "boom", 5, "d")
+    assert bridge.flush()
+
+    assert bridge._interface.packets == ["reorg"]
+    assert bridge.stats() == {"queued": 2, "submitted": 1, "failed": 1, "dropped": 0}
+
+    bridge.close()
+    bridge.close()
+    assert bridge.flush() is True
+    assert bridge.submit_threat_nowait("sentinel", "late", 1, "d") is False
+    assert bridge.stats()["dropped"] == 1 and bridge._interface.closed
+
+
+def test_submit_threat_nowait_drops_when_full_or_unavailable(core, monkeypatch):
+    bridge = acb.SentinelAdaptiveCoreBridge()
+    bridge.MAX_PENDING = 1
+    bridge._interface.gate.clear()
+    try:
+        bridge.submit_threat_nowait("s", "a", 1, "d")
+        assert bridge._interface.entered.wait(5)  # worker is stuck on "a"
+        assert bridge.submit_threat_nowait("s", "b", 1, "d")
+        assert bridge.submit_threat_nowait("s", "c", 1, "d") is False
+        assert bridge.flush(timeout=0.02) is False
+        threading.Timer(0.05, bridge._interface.gate.set).start()
+        bridge.close(timeout=0.02)  # no room to signal the worker; closes after the in-flight call
+        assert bridge._interface.closed
+    finally:
+        bridge._interface.gate.set()
+
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", None)
+    unavailable = acb.SentinelAdaptiveCoreBridge()
+    assert unavailable.submit_threat_nowait("s", "a", 1, "d") is False
+    unavailable.close()
+
+
+def test_submit_racing_close_is_a_counted_drop(core):
+    bridge = acb.SentinelAdaptiveCoreBridge()
+    assert bridge.submit_threat_nowait("s", "a", 1, "d")
+    bridge.close()
+    bridge._available = True  # a submitter that passed the availability check before close
+    assert bridge.submit_threat_nowait("s", "late", 1, "d") is False
+    assert bridge.stats()["dropped"] == 1 and bridge._pending is None
+
+    never_started = acb.SentinelAdaptiveCoreBridge()
+    never_started.close()
+    never_started._available = True
+    assert never_started.submit_threat_nowait("s", "late", 1, "d") is False
+    assert never_started._worker is None  # close is final: no worker is started afterwards
+
+
+def test_adaptive_core_is_resolved_by_the_first_bridge_not_at_import(monkeypatch):
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", acb._UNRESOLVED)
+    monkeypatch.setattr(acb, "ThreatPacket", acb._UNRESOLVED)
+    imported = []
+
+    def missing(name):
+        imported.append(name)
+        raise ImportError(name)
+
+    monkeypatch.setattr(acb.importlib, "import_module", missing)
+    assert acb.SentinelAdaptiveCoreBridge().is_available is False
+    assert acb.SentinelAdaptiveCoreBridge().is_available is False
+    assert imported == ["adaptive_core.interface"]  # resolved once, then cached
+    assert acb.AdaptiveCoreInterface is None and acb.ThreatPacket is None
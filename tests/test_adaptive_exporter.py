@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import logging
+import socket
+import threading
+import time
+
+import pytest
+
+import sentinel_ai_v2.adaptive_bridge as ab
+import sentinel_ai_v2.adaptive_exporter as ax
+from sentinel_ai_v2.adaptive_exporter import (
+    AdaptiveCoreTransport,
+    AdaptiveEventExporter,
+    FileTransport,
+    LogTransport,
+    SocketTransport,
+)
+
+
+def _event(n: int = 0, **kwargs):
+    return ab.build_adaptive_event(anomaly_type=f"a{n}", severity=0.5, **kwargs)
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.batches = []
+        self.closed = False
+
+    def send(self, events):
+        self.batches.append([e.anomaly_type for e in events])
+
+    def close(self):
+        self.closed = True
+
+
+class Blocking(Recorder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def send(self, events):
+        self.entered.set()
+        self.release.wait(5)
+        super().send(events)
+
+
+def test_batches_by_size_and_flushes_the_rest():
+    transport = Recorder()
+    with AdaptiveEventExporter(transport, batch_size=3, flush_interval=60) as exporter:
+        for n in range(7):
+            assert exporter.submit(_event(n))
+        assert exporter.flush()
+        stats = exporter.stats()
+
+    assert transport.batches == [["a0", "a1", "a2"], ["a3", "a4", "a5"], ["a6"]]
+    assert stats == {"submitted": 7, "dropped": 0, "exported": 7, "failed": 0,
+                     "batches": 3, "failed_batches": 0, "queued": 0}
+    assert transport.closed
+
+
+def test_partial_batch_is_sent_after_flush_interval():
+    transport = Recorder()
+    with AdaptiveEventExporter(transport, batch_size=100, flush_interval=0.02) as exporter:
+        exporter.submit(_event())
+        deadline = time.monotonic() + 5
+        while not transport.batches and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert transport.batches == [["a0"]]
+
+
+def test_full_queue_drops_without_blocking_and_counts():
+    transport = Blocking()
+    exporter = AdaptiveEventExporter(transport, max_queue=2, batch_size=1)
+    try:
+        exporter.submit(_event(0))
+        assert transport.entered.wait(5)  # flusher is stuck sending a0
+        assert exporter.submit(_event(1)) and exporter.submit(_event(2))
+        assert exporter.submit(_event(3)) is False
+        assert exporter.flush(timeout=0.02) is False  # no room for the flush marker either
+    finally:
+        transport.release.set()
+    assert exporter.flush()
+    exporter.close()
+
+    stats = exporter.stats()
+    assert stats["submitted"] == 3 and stats["dropped"] == 1 and stats["exported"] == 3
+    assert exporter.submit(_event(4)) is False and exporter.stats()["dropped"] == 2
+    assert exporter.flush() is True
+    exporter.close()  # idempotent
+
+
+def test_submit_racing_close_is_exported_or_dropped_never_lost():
+    transport = Recorder()
+    exporter = AdaptiveEventExporter(transport)
+    closer = threading.Thread(target=exporter.close)
+    real_put = exporter._queue.put_nowait
+
+    def put_while_closing(item):
+        closer.start()
+        closer.join(0.05)  # close must wait until this event is queued
+        real_put(item)
+
+    exporter._queue.put_nowait = put_while_closing
+    assert exporter.submit(_event(1))
+    closer.join(5)
+
+    assert transport.batches == [["a1"]] and transport.closed
+    assert exporter.submit(_event(2)) is False
+    stats = exporter.stats()
+    assert stats["submitted"] == stats["exported"] == 1 and stats["dropped"] == 1
+
+
+def test_close_gives_up_on_a_stuck_transport():
+    transport = Blocking()
+    exporter = AdaptiveEventExporter(transport, max_queue=1, batch_size=1)
+    exporter.submit(_event(0))
+    assert transport.entered.wait(5)
+    exporter.submit(_event(1))
+    exporter.close(timeout=0.02)
+    assert transport.closed
+    transport.release.set()
+
+
+def test_transport_errors_are_counted_not_raised():
+    class Failing(Recorder):
+        def send(self, events):
+            raise RuntimeError("down")
+
+    with AdaptiveEventExporter(Failing(), batch_size=2) as exporter:
+        for n in range(3):
+            exporter.submit(_event(n))
+        exporter.flush()
+        stats = exporter.stats()
+    assert stats["failed"] == 3 and stats["failed_batches"] == 2 and stats["exported"] == 0
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveEventExporter(Recorder(), max_queue=0)
+    with pytest.raises(ValueError):
+        AdaptiveEventExporter(Recorder(), flush_interval=0)
+
+
+def test_serialize_event_matches_the_legacy_log_line():
+    from dataclasses import asdict
+
+    evt = _event(txid="t1", details="d")
+    assert ax.serialize_event(evt) == json.dumps(asdict(evt), sort_keys=True, default=str)
+
+
+def test_log_transport_serializes_only_when_enabled(caplog, monkeypatch):
+    logger = logging.getLogger("sentinel_ai_v2.test_exporter")
+    transport = LogTransport(logger, level=logging.DEBUG)
+
+    caplog.set_level(logging.INFO, logger=logger.name)
+    monkeypatch.setattr(ax, "serialize_event", lambda e: pytest.fail("serialized a filtered event"))
+    transport.send([_event()])
+    monkeypatch.undo()
+
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    transport.send([_event(7)])
+    transport.close()
+    assert [r.message for r in caplog.records][-1].startswith('AdaptiveEvent {"anomaly_type": "a7"')
+    assert LogTransport().logger.name == "sentinel_ai_v2.adaptive_bridge"
+
+
+def test_file_transport_appends_json_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    transport = FileTransport(path)
+    transport.send([_event(0), _event(1)])
+    transport.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["anomaly_type"] for line in lines] == ["a0", "a1"]
+
+
+def test_socket_transport_streams_and_reconnects(tmp_path):
+    path = str(tmp_path / "s.sock")
+    transport = SocketTransport(path, timeout=1)
+    with pytest.raises(OSError):
+        transport.send([_event()])  # nobody listening
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    try:
+        transport.send([_event(1), _event(2)])
+        conn, _ = server.accept()
+        with conn:
+            received = b""
+            while received.count(b"\n") < 2:
+                received += conn.recv(65536)
+    finally:
+        server.close()
+    assert [json.loads(line)["anomaly_type"] for line in received.splitlines()] == ["a1", "a2"]
+
+    class Broken:
+        def sendall(self, data):
+            raise BrokenPipeError
+
+        def close(self):
+            pass
+
+    transport._sock = Broken()
+    with pytest.raises(OSError):
+        transport.send([_event()])
+    assert transport._sock is None
+    transport.close()
+
+
+def test_adaptive_core_transport_maps_events_to_threats():
+    calls = []
+
+    class Bridge:
+        is_available = True
+
+        def submit_simple_threat(self, **kwargs):
+            calls.append(kwargs)
+
+    transport = AdaptiveCoreTransport(Bridge())
+    transport.send([_event(0, block_height=5, txid="t"), ab.build_adaptive_event(anomaly_type="x", severity=2.0)])
+    transport.close()
+
+    assert calls[0]["threat_type"] == "a0" and calls[0]["severity"] == 5
+    assert calls[0]["block_height"] == 5 and calls[0]["tx_id"] == "t"
+    assert calls[0]["description"] == "sentinel:a0"
+    assert calls[1]["severity"] == 10
+
+    Bridge.is_available = False
+    transport.send([_event()])
+    assert len(calls) == 2
+
+
+def test_emit_routes_through_attached_exporter_and_skips_filtered_logging(monkeypatch, caplog):
+    transport = Recorder()
+    exporter = AdaptiveEventExporter(transport)
+    ab.attach_exporter(exporter)
+    try:
+        ab.emit_adaptive_event(_event(3))
+        exporter.flush()
+    finally:
+        ab.attach_exporter(None)
+        exporter.close()
+    assert transport.batches == [["a3"]]
+
+    caplog.set_level(logging.INFO, logger=ab.logger.name)
+    monkeypatch.setattr(ab, "asdict", lambda e: pytest.fail("serialized a filtered event"))
+    ab.emit_adaptive_event(_event())
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import statistics
+
+import pytest
+
+from sentinel_ai_v2.adversarial_engine import (
+    AdversarialStatsTracker,
+    analyse_for_adversarial_patterns,
+)
+from sentinel_ai_v2.config import CircuitBreakerThresholds
+from sentinel_ai_v2.scoring import compute_risk_score
+
+
+def _tracker(**kwargs) -> AdversarialStatsTracker:
+    return AdversarialStatsTracker(CircuitBreakerThresholds(), **kwargs)
+
+
+def test_welford_and_ewma_match_reference():
+    t = _tracker(features=("entropy_score",), alpha=0.5)
+    values = [0.1, 0.4, 0.2, 0.9, 0.3]
+    for v in values:
+        t.update({"entropy_score": v})
+    stats = t._stats["entropy_score"]
+    assert stats.count == 5
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+
+    ewma = values[0]
+    for v in values[1:]:
+        ewma += 0.5 * (v - ewma)
+    assert stats.ewma == pytest.approx(ewma)
+
+
+def test_variance_suppression_after_noisy_history_goes_flat():
+    t = _tracker(features=("mempool_score",), min_samples=10)
+    for i in range(200):
+        t.update({"mempool_score": 0.1 if i % 2 else 0.9})
+    assert t.scores().variance_suppression["mempool_score"] < 0.2
+    for _ in range(100):
+        out = t.update({"mempool_score": 0.5})
+    assert out.variance_suppression["mempool_score"] > 0.9
+
+
+def test_threshold_hugging_counts_near_misses_over_window():
+    t = _tracker(window=10, min_samples=5)
+    for _ in range(10):
+        out = t.update({"mempool_anomaly": 0.65, "reorg_depth": 2})
+    assert out.threshold_hugging["mempool_anomaly"] == 1.0
+    assert out.threshold_hugging["reorg_depth"] == 0.0
+    assert out.threshold_hugging["entropy_score"] == 0.0
+
+    for _ in range(5):
+        out = t.update({"mempool_anomaly": 0.9})
+    assert out.threshold_hugging["mempool_anomaly"] == 0.5
+
+
+def test_scores_wait_for_min_samples_and_skip_non_finite():
+    t = _tracker(min_samples=3)
+    out = t.update({"mempool_anomaly": 0.65, "entropy_score": float("nan")})
+    assert out.threshold_hugging["mempool_anomaly"] == 0.0
+    assert t._stats["entropy_score"].count == 0
+
+
+def test_state_round_trips_through_json():
+    t = _tracker(window=8, min_samples=2)
+    for i in range(13):
+        t.update({"entropy_drop": 0.19, "mempool_score": i / 10})
+    restored = AdversarialStatsTracker.from_dict(json.loads(json.dumps(t.to_dict())))
+    assert restored.to_dict() == t.to_dict()
+    assert restored.scores() == t.scores()
+
+    sample = {"entropy_drop": 0.1, "mempool_score": 0.3}
+    assert restored.update(sample) == t.update(sample)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda s: s.update(version=99),
+        lambda s: s.pop("alpha"),
+        lambda s: s["features"]["entropy_score"].update(near=[0]),
+        lambda s: s["features"]["entropy_score"].update(near_pos=-1),
+        lambda s: s.update(thresholds=None),
+    ],
+)
+def test_malformed_state_is_rejected(mutate):
+    state = _tracker(window=4).to_dict()
+    mutate(state)
+    with pytest.raises(ValueError):
+        AdversarialStatsTracker.from_dict(state)
+    with pytest.raises(ValueError):
+        AdversarialStatsTracker.from_dict([])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"features": ()},
+        {"features": ("a", "a")},
+        {"alpha": 1.0},
+        {"window": 0},
+        {"min_samples": 0},
+        {"near_margin": 0.0},
+    ],
+)
+def test_invalid_configuration_rejected(kwargs):
+    with pytest.raises(ValueError):
+        _tracker(**kwargs)
+
+
+def test_zero_threshold_never_counts_as_near():
+    t = AdversarialStatsTracker(
+        CircuitBreakerThresholds(entropy_drop_threshold=0.0), min_samples=1
+    )
+    assert t.update({"entropy_drop": 0.0}).threshold_hugging["entropy_drop"] == 0.0
+
+
+def test_analysis_reports_history_patterns_and_scoring_uses_them():
+    t = _tracker(window=10, min_samples=10)
+    for i in range(100):
+        analyse_for_adversarial_patterns({"reorg_score": i % 2}, tracker=t)
+    for _ in range(60):
+        result = analyse_for_adversarial_patterns(
+            {"reorg_score": 0.5, "mempool_anomaly": 0.68, "suspicious_smoothness": True},
+            tracker=t,
+        )
+    assert result.risk_boost == pytest.approx(0.3)
+    assert "variance_suppression:reorg_score" in result.reasons
+    assert "threshold_hugging:mempool_anomaly" in result.reasons
+
+    score = compute_risk_score(
+        {"reorg_score": 0.5, "mempool_anomaly": 0.68},
+        CircuitBreakerThresholds(),
+        adversarial_stats=t,
+    )
+    assert "adversarial:threshold_hugging:mempool_anomaly" in score.details
+
+
+def test_default_tracked_features_follow_the_feature_layout():
+    from sentinel_ai_v2.adversarial_engine import DEFAULT_TRACKED_FEATURES
+    from sentinel_ai_v2.feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+
+    assert DEFAULT_TRACKED_FEATURES == DEFAULT_FEATURE_EXTRACTOR.names
+    assert _tracker().features == DEFAULT_FEATURE_EXTRACTOR.names
+
+
+def test_stream_state_feeds_the_tracker_from_a_watched_stream():
+    from sentinel_ai_v2.api import SentinelClient
+    from sentinel_ai_v2.config import SentinelConfig
+    from sentinel_ai_v2.engine.watcher_loop import watch_stream
+    from sentinel_ai_v2.scoring import StreamState
+
+    client = SentinelClient(SentinelConfig())
+    hugging = [{"entropy": {"drop": 0.19}}] * 25  # just under the 0.2 threshold
+
+    plain, tracked = [], []
+    watch_stream(hugging, client=client, handler=plain.append)
+    state = StreamState.for_thresholds(client._thresholds, correlate=False)
+    watch_stream(hugging, client=client, handler=tracked.append, stream_state=state)
+
+    assert state.correlator is None
+    assert not any("threshold_hugging" in d for d in plain[-1].details)
+    assert "adversarial:threshold_hugging:entropy_drop" in tracked[-1].details
+    assert tracked[-1].risk_score > plain[-1].risk_score
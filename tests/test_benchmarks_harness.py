@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_PATH = Path(__file__).resolve().parents[1] / "benchmarks" / "_harness.py"
+_spec = importlib.util.spec_from_file_location("bench_harness", _PATH)
+harness = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(harness)
+
+
+def test_measure_reports_throughput_percentiles_and_allocations():
+    result = harness.measure("noop", lambda: [0] * 1000, group="t", min_time=0.0, alloc_calls=3)
+
+    assert result["name"] == "noop" and result["group"] == "t"
+    assert result["calls"] >= 5
+    assert result["ops_per_sec"] > 0
+    assert result["p50_us"] <= result["p90_us"] <= result["p99_us"] <= result["max_us"]
+    assert result["alloc_peak_bytes"] >= 8000  # the 1000-slot list
+
+
+def test_compare_flags_only_drops_beyond_threshold():
+    baseline = [
+        {"name": "a", "ops_per_sec": 100.0},
+        {"name": "b", "ops_per_sec": 100.0},
+        {"name": "gone", "ops_per_sec": 100.0},
+    ]
+    results = [
+        {"name": "a", "ops_per_sec": 85.0},
+        {"name": "b", "ops_per_sec": 70.0},
+        {"name": "new", "ops_per_sec": 1.0},
+    ]
+
+    regressions = harness.compare(results, baseline, threshold=0.2)
+
+    assert [r["name"] for r in regressions] == ["b"]
+    assert regressions[0]["change"] == -0.3
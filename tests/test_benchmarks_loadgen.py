@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_PATH = Path(__file__).resolve().parents[1] / "benchmarks" / "loadgen.py"
+_spec = importlib.util.spec_from_file_location("bench_loadgen", _PATH)
+loadgen = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(loadgen)
+
+
+def test_parse_mix_weights_and_rejects_unknown_operations():
+    assert loadgen.parse_mix("evaluate=3, status") == {"evaluate": 3, "status": 1}
+    with pytest.raises(ValueError, match="unknown operation"):
+        loadgen.parse_mix("evaluate=1,nope=2")
+    with pytest.raises(ValueError, match="empty"):
+        loadgen.parse_mix("evaluate=0")
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    hist = loadgen.Histogram()
+    for _ in range(90):
+        hist.record(95.0)
+    for _ in range(10):
+        hist.record(4_000.0, "http_500")
+
+    summary = hist.summary()
+    assert summary["p50_us"] == 100.0
+    assert summary["p99_us"] == 5012.0  # 4000 us falls in the (3981, 5012] bucket
+    assert summary["errors"] == 10 and summary["error_rate"] == 0.1
+    assert summary["error_kinds"] == {"http_500": 10}
+
+
+def test_memory_growth_fits_a_trend_after_warmup():
+    samples = [(float(t), 1_000_000 + 1_000 * t) for t in range(11)]
+    samples[0] = (0.0, 5_000_000)  # warm-up spike is ignored
+
+    growth = loadgen.memory_growth(samples)
+
+    assert growth["slope_bytes_per_min"] == pytest.approx(60_000.0)
+    assert growth["growth_bytes"] == pytest.approx(8_000.0)
+    assert loadgen.memory_growth(samples[:2])["growth_bytes"] is None
+
+
+def test_run_load_in_process_against_server_app():
+    from sentinel_ai_v2.server import app
+
+    report = asyncio.run(
+        loadgen.run_load(
+            loadgen.InProcessTarget(app),
+            mix={"evaluate": 3, "health": 1, "history": 1},
+            concurrency=4,
+            duration=None,
+            requests=40,
+        )
+    )
+
+    assert report["overall"]["requests"] == 40
+    assert report["operations"]["evaluate"]["errors"] == 0
+    history = report["operations"]["history"]
+    assert history["error_kinds"] == {"http_404": history["requests"]}  # log dir unset
+
+
+def test_http_target_reuses_keep_alive_connections():
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+            status = b"404 Not Found" if b"/missing" in head else b"200 OK"
+            writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        target = loadgen.HttpTarget(f"http://127.0.0.1:{port}")
+        statuses = [await target.request("POST", "/evaluate", b"{}") for _ in range(3)]
+        statuses.append(await target.request("GET", "/missing", b""))
+        await target.close()
+        server.close()
+        return statuses
+
+    assert asyncio.run(scenario()) == [200, 200, 200, 404]
+    assert len(connections) == 1
+    with pytest.raises(ValueError):
+        loadgen.HttpTarget("https://example.invalid")
+
+
+def test_http_target_is_limited_to_loopback_unless_allowed():
+    for url in ("http://localhost:8000", "http://127.0.0.2", "http://[::1]:8000/api"):
+        loadgen.HttpTarget(url)
+    for url in ("http://10.0.0.5:8000", "http://sentinel.example.invalid"):
+        with pytest.raises(ValueError, match="--allow-remote"):
+            loadgen.HttpTarget(url)
+    assert loadgen.HttpTarget("http://10.0.0.5:8000", allow_remote=True).host == "10.0.0.5"
+
+    with pytest.raises(SystemExit):
+        loadgen.main(["--url", "http://10.0.0.5:8000"])
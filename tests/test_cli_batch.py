@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+import sentinel_ai_v2.cli as cli
+
+
+class _Result:
+    def __init__(self, snapshot):
+        self.status = "HIGH" if snapshot.get("bad") else "NORMAL"
+        self.risk_score = 0.9 if snapshot.get("bad") else 0.1
+        self.details = []
+
+
+class _Wrapper:
+    def evaluate(self, snapshot):
+        if snapshot.get("explode"):
+            raise RuntimeError("boom")
+        return _Result(snapshot)
+
+
+@pytest.fixture(autouse=True)
+def _fake_wrapper(monkeypatch):
+    monkeypatch.setattr(cli, "SentinelWrapper", _Wrapper)
+
+
+def _summary(capsys):
+    captured = capsys.readouterr()
+    return captured.out, json.loads(captured.err)
+
+
+def test_batch_file_streams_ndjson_in_order(tmp_path, capsys):
+    src = tmp_path / "in.jsonl"
+    src.write_text('{"i": 1}\n\n{"bad": true}\nnot json\n[1]\n{"explode": 1}\n', encoding="utf-8")
+    assert cli.main(["batch", "-i", str(src), "-w", "3"]) == 0
+    out, summary = _summary(capsys)
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [r["source"].rsplit(":", 1)[1] for r in records] == ["1", "3", "4", "5", "6"]
+    assert records[0] == {"source": f"{src}:1", "status": "NORMAL", "risk_score": 0.1, "details": []}
+    assert [r.get("error") for r in records[2:]] == ["invalid_json", "not_object", "evaluation_failed"]
+
+    assert summary["processed"] == 5
+    assert summary["evaluated"] == 2
+    assert summary["statuses"] == {"NORMAL": 1, "HIGH": 1}
+    assert summary["errors"] == {"invalid_json": 1, "not_object": 1, "evaluation_failed": 1}
+    assert summary["per_second"] is None or summary["per_second"] > 0
+
+
+def test_batch_directory_and_output_file(tmp_path, capsys):
+    (tmp_path / "in" / "sub").mkdir(parents=True)
+    (tmp_path / "in" / "b.jsonl").write_text('{"i": 2}\n', encoding="utf-8")
+    (tmp_path / "in" / "sub" / "a.ndjson").write_text('{"i": 1}\n{"i": 3}\n', encoding="utf-8")
+    (tmp_path / "in" / "sub" / "c.JSON").write_text('{"i": 4}\n', encoding="utf-8")
+    (tmp_path / "in" / "README.md").write_text("# not telemetry\n", encoding="utf-8")
+    (tmp_path / "in" / ".b.jsonl.swp").write_bytes(b"\xff\xfe")
+    out_path = tmp_path / "out.ndjson"
+
+    assert cli.main(["batch", "--input", str(tmp_path / "in"), "--output", str(out_path)]) == 0
+    _, summary = _summary(capsys)
+    sources = [json.loads(line)["source"] for line in out_path.read_text().splitlines()]
+    assert [s.split("in/")[1] for s in sources] == ["b.jsonl:1", "sub/a.ndjson:1", "sub/a.ndjson:2", "sub/c.JSON:1"]
+    assert summary["processed"] == 4 and summary["errors"] == {}
+
+
+def test_batch_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO('{"i": 1}\n{"i": 2}\n'))
+    assert cli.main(["batch"]) == 0
+    out, summary = _summary(capsys)
+    assert [json.loads(line)["source"] for line in out.splitlines()] == ["<stdin>:1", "<stdin>:2"]
+    assert summary["errors"] == {}
+
+
+def test_batch_input_errors(tmp_path):
+    with pytest.raises(SystemExit) as e:
+        cli.main(["batch", "-i", str(tmp_path / "missing.jsonl")])
+    assert "Cannot read batch input" in str(e.value)
+
+    with pytest.raises(SystemExit) as e:
+        cli.main(["batch", "-w", "0"])
+    assert "--workers" in str(e.value)
+
+    with pytest.raises(SystemExit) as e:
+        cli.main(["batch", "-i", "  "])
+    assert "--input must not be empty" in str(e.value)
+
+
+def test_batch_defaults_to_one_worker():
+    args = cli._build_parser().parse_args(["batch"])
+    assert args.workers == 1
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import sentinel_ai_v2.api as api
+import sentinel_ai_v2.config as config_mod
+from sentinel_ai_v2.config import (
+    CONFIG_ENV_VAR,
+    CircuitBreakerThresholds,
+    ConfigError,
+    SentinelConfig,
+    clear_config_cache,
+    load_config,
+)
+from sentinel_ai_v2.engine.watcher_loop import build_default_client
+from sentinel_ai_v2.wrapper.workflow import run_full_workflow
+
+HASH = "ab" * 32
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    monkeypatch.delenv(CONFIG_ENV_VAR, raising=False)
+    clear_config_cache()
+    api.reset_default_client()
+    yield
+    clear_config_cache()
+    api.reset_default_client()
+
+
+def _write_json(path, doc):
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path
+
+
+def test_default_config_is_cached_defaults():
+    cfg = load_config()
+    assert cfg == SentinelConfig()
+    assert load_config() is cfg
+
+
+def test_json_config_is_compiled_and_validated(tmp_path):
+    path = _write_json(
+        tmp_path / "sentinel.json",
+        {
+            "model_path": "models/m.json",
+            "model_hash": HASH,
+            "model_signature_path": "models/m.sig",
+            "circuit_breakers": {"entropy_drop_threshold": 1, "reorg_depth_threshold": 5},
+            "enabled_detectors": {"reorg": False},
+            "extra": {"site": "eu-1"},
+        },
+    )
+    cfg = load_config(str(path))
+    assert cfg.model_path == str(tmp_path / "models" / "m.json")
+    assert cfg.model_hash == HASH
+    assert cfg.model_signature_path == str(tmp_path / "models" / "m.sig")
+    assert cfg.circuit_breakers == CircuitBreakerThresholds(
+        entropy_drop_threshold=1.0, reorg_depth_threshold=5
+    )
+    assert isinstance(cfg.circuit_breakers.entropy_drop_threshold, float)
+    assert cfg.enabled_detectors == {"reorg": False}
+    assert cfg.extra == {"site": "eu-1"}
+
+
+def test_toml_config_and_null_model_path(tmp_path):
+    toml = tmp_path / "sentinel.toml"
+    toml.write_text(
+        '[circuit_breakers]\nmempool_anomaly_threshold = 0.5\n', encoding="utf-8"
+    )
+    cfg = load_config(str(toml))
+    assert cfg.circuit_breakers.mempool_anomaly_threshold == 0.5
+    assert cfg.model_path == SentinelConfig().model_path
+
+    cfg2 = load_config(str(_write_json(tmp_path / "none.json", {"model_path": None})))
+    assert cfg2.model_path is None
+
+
+def test_cache_is_keyed_on_path_and_mtime(tmp_path):
+    path = _write_json(tmp_path / "c.json", {"extra": {"v": 1}})
+    first = load_config(str(path))
+    assert load_config(str(path)) is first
+
+    _write_json(path, {"extra": {"v": 22}})
+    os.utime(path, ns=(1, 1))
+    second = load_config(str(path))
+    assert second is not first
+    assert second.extra == {"v": 22}
+
+
+def test_env_var_names_default_config(tmp_path, monkeypatch):
+    path = _write_json(tmp_path / "env.json", {"extra": {"from": "env"}})
+    monkeypatch.setenv(CONFIG_ENV_VAR, str(path))
+    assert load_config().extra == {"from": "env"}
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        [],
+        {"unknown": 1},
+        {"model_path": ""},
+        {"model_path": 3},
+        {"model_hash": "XYZ"},
+        {"circuit_breakers": []},
+        {"circuit_breakers": {"nope": 1}},
+        {"circuit_breakers": {"entropy_drop_threshold": "high"}},
+        {"circuit_breakers": {"entropy_drop_threshold": True}},
+        {"circuit_breakers": {"reorg_depth_threshold": 2.5}},
+        {"circuit_breakers": {"reorg_depth_threshold": -1}},
+        {"enabled_detectors": {"x": "yes"}},
+        {"extra": []},
+    ],
+)
+def test_invalid_documents_fail_closed(tmp_path, doc):
+    with pytest.raises(ConfigError):
+        load_config(str(_write_json(tmp_path / "bad.json", doc)))
+
+
+def test_non_finite_threshold_fails_closed(tmp_path):
+    path = tmp_path / "nan.json"
+    path.write_text('{"circuit_breakers": {"entropy_drop_threshold": NaN}}', encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_config(str(path))
+
+
+def test_missing_unparsable_and_unsupported_files(tmp_path):
+    with pytest.raises(ConfigError):
+        load_config(str(tmp_path / "absent.json"))
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{nope", encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_config(str(bad))
+
+    yaml = tmp_path / "c.yaml"
+    yaml.write_text("a: 1\n", encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_config(str(yaml))
+
+
+def test_toml_without_parser_fails_closed(tmp_path, monkeypatch):
+    def _missing(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(config_mod.importlib, "import_module", _missing)
+    toml = tmp_path / "c.toml"
+    toml.write_text("[extra]\n", encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_config(str(toml))
+
+
+def test_default_client_is_reused_until_config_changes(tmp_path, monkeypatch):
+    built = []
+    real_client = api.SentinelClient
+
+    def _counting(config):
+        built.append(config)
+        return real_client(config)
+
+    monkeypatch.setattr(api, "SentinelClient", _counting)
+    path = _write_json(tmp_path / "c.json", {"model_path": None})
+    monkeypatch.setenv(CONFIG_ENV_VAR, str(path))
+
+    for _ in range(3):
+        assert run_full_workflow({"entropy": {"score": 0.1}}).status == "NORMAL"
+    assert build_default_client() is api.get_default_client()
+    assert len(built) == 1
+
+    _write_json(path, {"model_path": None, "extra": {"v": 2}})
+    os.utime(path, ns=(1, 1))
+    run_full_workflow({})
+    assert len(built) == 2
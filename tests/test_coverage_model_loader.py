@@ -10,8 +10,8 @@ from sentinel_ai_v2.model_loader import (
 
 
 def test_compute_file_hash_and_load(tmp_path: Path):
-    p = tmp_path / "m.bin"
-    p.write_bytes(b"hello")
+    p = tmp_path / "m.json"
+    p.write_bytes(b'{"format": "sentinel.linear.v1", "weights": {"entropy_drop": 1.0}}')
 
     h = compute_file_hash(p)
     model = load_and_verify_model(str(p), expected_hash=h)
@@ -32,3 +32,53 @@ def test_load_model_hash_mismatch(tmp_path: Path):
     p.write_bytes(b"hello")
     with pytest.raises(ModelVerificationError):
         load_and_verify_model(str(p), expected_hash="deadbeef")
+
+
+def test_hash_buffer_matches_streaming_hash_for_any_chunk_size(tmp_path: Path):
+    from sentinel_ai_v2.model_loader import hash_buffer, map_model_file
+
+    p = tmp_path / "m.bin"
+    p.write_bytes(bytes(range(256)) * 1000)
+    expected = compute_file_hash(p)
+
+    assert compute_file_hash(p, chunk_size=8192) == expected
+    with map_model_file(p) as mapped:
+        assert hash_buffer(mapped) == expected
+        assert hash_buffer(mapped, chunk_size=7) == expected
+    assert hash_buffer(p.read_bytes(), algo="sha256") == compute_file_hash(p, algo="sha256")
+
+
+def test_empty_model_file_maps_to_empty_buffer_and_fails_closed(tmp_path: Path):
+    from sentinel_ai_v2.model_loader import map_model_file
+
+    p = tmp_path / "empty.onnx"
+    p.write_bytes(b"")
+    with map_model_file(p) as mapped:
+        assert mapped == b""
+    with pytest.raises(ModelVerificationError):
+        load_and_verify_model(str(p))
+
+
+def test_load_hashes_and_binds_from_one_mapping(tmp_path: Path, monkeypatch):
+    import mmap
+
+    import sentinel_ai_v2.model_loader as ml
+
+    p = tmp_path / "m.json"
+    p.write_bytes(b'  {"format": "sentinel.linear.v1", "weights": [0, 0, 0, 1, 0, 0]}')
+    ml.clear_runtime_cache()
+
+    seen = []
+    real_build = ml.build_runtime
+
+    def _build(model_bytes):
+        seen.append(type(model_bytes))
+        return real_build(model_bytes)
+
+    monkeypatch.setattr(ml, "build_runtime", _build)
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("second read"))
+
+    model = load_and_verify_model(str(p))
+    assert seen == [mmap.mmap]
+    assert model.runtime is not None
+    ml.clear_runtime_cache()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dataclasses import fields
+
+import pytest
+
+import sentinel_ai_v2.feature_extractor as fx
+from sentinel_ai_v2.config import CircuitBreakerThresholds
+from sentinel_ai_v2.contracts.v3_reason_codes import ReasonCode
+from sentinel_ai_v2.data_intake import normalize_raw_telemetry
+from sentinel_ai_v2.engine.feature_engineering import FeatureVector, build_feature_vector
+from sentinel_ai_v2.feature_extractor import (
+    DEFAULT_FEATURE_EXTRACTOR,
+    FeatureExtractor,
+    FeatureSpec,
+)
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+TELEMETRY = {
+    "entropy": {"score": 0.3, "drop": 0.25},
+    "mempool": {"score": 0.2, "anomaly": 0.8},
+    "reorg": {"score": 0.1, "depth": 4},
+    "peers": {"count": 8},
+}
+
+
+def test_default_layout_matches_feature_vector_fields():
+    names = tuple(f.name for f in fields(FeatureVector) if f.name != "model_score")
+    assert DEFAULT_FEATURE_EXTRACTOR.names == names
+    assert DEFAULT_FEATURE_EXTRACTOR.width == 6
+
+
+def test_extract_reads_sections_into_fixed_layout():
+    buf = DEFAULT_FEATURE_EXTRACTOR.extract(TELEMETRY)
+    assert list(buf) == [0.3, 0.2, 0.1, 0.25, 0.8, 4.0]
+    assert DEFAULT_FEATURE_EXTRACTOR.to_features(buf) == {
+        "entropy_score": 0.3,
+        "mempool_score": 0.2,
+        "reorg_score": 0.1,
+        "entropy_drop": 0.25,
+        "mempool_anomaly": 0.8,
+        "reorg_depth": 4,
+    }
+
+
+def test_missing_sections_and_keys_use_defaults():
+    features = DEFAULT_FEATURE_EXTRACTOR.extract_features(
+        {"entropy": None, "mempool": {}, "reorg": {"score": None}}
+    )
+    assert features == {
+        "entropy_score": 0.0,
+        "mempool_score": 0.0,
+        "reorg_score": 0.0,
+        "entropy_drop": 0.0,
+        "mempool_anomaly": 0.0,
+        "reorg_depth": 0,
+    }
+    assert isinstance(features["reorg_depth"], int)
+
+
+def test_numeric_strings_are_cast_like_the_engine_helper():
+    features = DEFAULT_FEATURE_EXTRACTOR.extract_features(
+        {"entropy": {"score": "0.5"}, "reorg": {"depth": "3"}}
+    )
+    assert features["entropy_score"] == 0.5
+    assert features["reorg_depth"] == 3
+
+
+@pytest.mark.parametrize("bad", ["abc", [1], "nan", "inf", float("inf")])
+def test_bad_numbers_fail_closed(bad):
+    with pytest.raises(ValueError) as e:
+        DEFAULT_FEATURE_EXTRACTOR.extract({"mempool": {"anomaly": bad}})
+    assert e.value.args[0] == ReasonCode.SNTL_ERROR_BAD_NUMBER.value
+
+
+def test_non_mapping_section_fails_closed():
+    with pytest.raises(ValueError) as e:
+        DEFAULT_FEATURE_EXTRACTOR.extract({"entropy": [0.1]})
+    assert e.value.args[0] == ReasonCode.SNTL_ERROR_INVALID_REQUEST.value
+
+
+def test_extract_into_writes_requested_row_only():
+    buf = DEFAULT_FEATURE_EXTRACTOR.new_buffer(rows=2)
+    DEFAULT_FEATURE_EXTRACTOR.extract_into(TELEMETRY, buf, row=1)
+    assert list(buf[:6]) == [0.0] * 6
+    assert DEFAULT_FEATURE_EXTRACTOR.row_values(buf, row=1) == (0.3, 0.2, 0.1, 0.25, 0.8, 4)
+
+
+def test_custom_spec_and_spec_validation():
+    extractor = FeatureExtractor(
+        (FeatureSpec("peer_count", "peers", "count", default=1.0, integral=True),)
+    )
+    assert extractor.extract_features(TELEMETRY) == {"peer_count": 8}
+    assert extractor.extract_features({}) == {"peer_count": 1}
+
+    with pytest.raises(ValueError):
+        FeatureExtractor(())
+    with pytest.raises(ValueError):
+        FeatureExtractor((FeatureSpec("a", "s", "k"), FeatureSpec("a", "s", "j")))
+
+
+def test_extract_batch_returns_numpy_rows_viewing_one_buffer():
+    np = pytest.importorskip("numpy")
+    rows = DEFAULT_FEATURE_EXTRACTOR.extract_batch([TELEMETRY, {}, TELEMETRY])
+    assert rows.shape == (3, 6)
+    assert rows.dtype == np.float64
+    assert rows[0].tolist() == [0.3, 0.2, 0.1, 0.25, 0.8, 4.0]
+    assert rows[1].tolist() == [0.0] * 6
+    assert DEFAULT_FEATURE_EXTRACTOR.extract_batch([]).shape == (0, 6)
+
+
+def test_extract_batch_without_numpy_raises(monkeypatch):
+    def _missing(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(fx.importlib, "import_module", _missing)
+    with pytest.raises(RuntimeError):
+        DEFAULT_FEATURE_EXTRACTOR.extract_batch([TELEMETRY])
+
+
+def test_engine_feature_vector_uses_shared_extractor():
+    vec = build_feature_vector(normalize_raw_telemetry(TELEMETRY))
+    assert vec == FeatureVector(
+        entropy_score=0.3,
+        mempool_score=0.2,
+        reorg_score=0.1,
+        entropy_drop=0.25,
+        mempool_anomaly=0.8,
+        reorg_depth=4,
+    )
+
+
+def test_v3_bad_feature_value_is_fail_closed_error():
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds())
+    resp = v3.evaluate(make_valid_v3_request(telemetry={"reorg": {"depth": "deep"}}))
+    assert resp["decision"] == "ERROR"
+    assert resp["reason_codes"] == [ReasonCode.SNTL_ERROR_BAD_NUMBER.value]
+
+
+def test_v3_features_drive_circuit_breaker():
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds())
+    resp = v3.evaluate(make_valid_v3_request(telemetry=TELEMETRY))
+    assert resp["decision"] == "BLOCK"
+    assert resp["risk"]["tier"] == "CRITICAL"
+
+
+def test_feature_vector_to_dict_drops_missing_model_score():
+    vec = build_feature_vector(normalize_raw_telemetry({}))
+    assert "model_score" not in vec.to_dict()
+    vec.model_score = 0.9
+    assert vec.to_dict()["model_score"] == 0.9
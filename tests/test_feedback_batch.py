@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+import sentinel_ai_v2.adaptive_core_bridge as acb
+from sentinel_ai_v2.adaptive_core_bridge import FeedbackEvent
+from sentinel_ai_v2.feedback_hooks import iter_feedback_labels, send_feedback_batch_to_adaptive
+
+
+class Interface:
+    def __init__(self) -> None:
+        self.chunks = []
+
+    def submit_feedback_events(self, events):
+        self.chunks.append([(e.event_id, e.layer, e.feedback) for e in events])
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", Interface)
+    return acb.SentinelAdaptiveCoreBridge()
+
+
+def test_feedback_event_is_slotted():
+    event = FeedbackEvent("e1", "sentinel", "TRUE_POSITIVE")
+    assert not hasattr(event, "__dict__")
+    assert repr(event) == "FeedbackEvent('e1', 'sentinel', 'TRUE_POSITIVE')"
+
+
+def test_single_label_uses_the_module_level_event(bridge):
+    bridge.submit_feedback_label(layer="sentinel", feedback="false_positive", event_id="e1")
+    assert bridge._interface.chunks == [[("e1", "sentinel", "FALSE_POSITIVE")]]
+
+
+def test_bulk_labels_are_chunked_deduplicated_and_normalised(bridge):
+    upper = FeedbackEvent("e3", "wallet", "MISSED_ATTACK")
+    labels = iter([
+        ("e1", "true_positive"),
+        {"event_id": "e2", "feedback": "false_positive", "layer": "adn"},
+        ("e1", "false_positive"),  # duplicate: first one wins
+        upper,
+        FeedbackEvent("e4", "wallet", "true_positive"),
+        {"event_id": "e5", "feedback": "TRUE_POSITIVE"},
+    ])
+
+    counts = bridge.submit_feedback_labels(labels, layer="sentinel", chunk_size=2)
+
+    assert counts == {"submitted": 5, "duplicates": 1, "chunks": 3}
+    assert bridge._interface.chunks == [
+        [("e1", "sentinel", "TRUE_POSITIVE"), ("e2", "adn", "FALSE_POSITIVE")],
+        [("e3", "wallet", "MISSED_ATTACK"), ("e4", "wallet", "TRUE_POSITIVE")],
+        [("e5", "sentinel", "TRUE_POSITIVE")],
+    ]
+
+
+def test_bulk_labels_noop_without_adaptive_core_and_reject_bad_chunk_size(monkeypatch, bridge):
+    with pytest.raises(ValueError):
+        bridge.submit_feedback_labels([], chunk_size=0)
+
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", None)
+    consumed = []
+
+    def labels():
+        consumed.append(1)
+        yield ("e1", "true_positive")
+
+    unavailable = acb.SentinelAdaptiveCoreBridge()
+    assert unavailable.submit_feedback_labels(labels()) == {"submitted": 0, "duplicates": 0, "chunks": 0}
+    assert consumed == []
+
+
+def test_stream_jsonl_file_through_the_batch_hook(tmp_path, bridge):
+    path = tmp_path / "labels.jsonl"
+    path.write_text(
+        '{"event_id": "a", "feedback": "true_positive"}\n'
+        "\n"
+        '{"event_id": "b", "feedback": "false_positive", "layer": "adn"}\n'
+        '{"event_id": "a", "feedback": "false_positive"}\n',
+        encoding="utf-8",
+    )
+
+    counts = send_feedback_batch_to_adaptive(iter_feedback_labels(path, layer="sentinel"), bridge=bridge)
+
+    assert counts == {"submitted": 2, "duplicates": 1, "chunks": 1}
+    assert bridge._interface.chunks == [[("a", "sentinel", "TRUE_POSITIVE"), ("b", "adn", "FALSE_POSITIVE")]]
+
+
+def test_stream_csv_file(tmp_path):
+    path = tmp_path / "labels.CSV"
+    path.write_text("event_id,feedback,layer\nx,missed_attack,\ny,true_positive,adn\n", encoding="utf-8")
+
+    events = [(e.event_id, e.layer, e.feedback) for e in iter_feedback_labels(path)]
+
+    assert events == [("x", "sentinel_ai_v2", "MISSED_ATTACK"), ("y", "adn", "TRUE_POSITIVE")]
+
+
+@pytest.mark.parametrize(
+    "name, text, line",
+    [
+        ("bad.jsonl", '{"event_id": "a", "feedback": "tp"}\nnot json\n', 2),
+        ("missing.jsonl", '{"event_id": "a"}\n', 1),
+        ("list.jsonl", "[1, 2]\n", 1),
+        ("empty.csv", "event_id,feedback\na,tp\n,tp\n", 3),
+    ],
+)
+def test_malformed_rows_name_the_line(tmp_path, name, text, line):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError, match=rf"{name}:{line}: invalid feedback label"):
+        list(iter_feedback_labels(path))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+
+import sentinel_ai_v2.api as api
+from sentinel_ai_v2.config import CircuitBreakerThresholds
+from sentinel_ai_v2.contracts.v3_reason_codes import ReasonCode
+from sentinel_ai_v2.idempotency import IdempotencyTable
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+CONFLICT = ReasonCode.SNTL_ERROR_IDEMPOTENCY_CONFLICT.value
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_table_ttl_bound_and_copies():
+    clock = _Clock()
+    table = IdempotencyTable(max_entries=2, ttl_seconds=10, clock=clock)
+    resp = {"risk": {"score": 0.5}}
+    table.put("a", "h1", resp)
+    resp["risk"]["score"] = 0.9
+    hit = table.get("a")
+    assert hit.context_hash == "h1" and hit.response == {"risk": {"score": 0.5}}
+    hit.response["risk"]["score"] = 0.1
+    assert table.get("a").response == {"risk": {"score": 0.5}}
+
+    table.put("a", "h2", {})  # first stored response wins
+    assert table.get("a").context_hash == "h1"
+
+    clock.now = 5
+    table.put("b", "h", {})
+    clock.now = 6
+    table.put("c", "h", {})
+    assert table.get("a") is None and len(table) == 2
+
+    clock.now = 15
+    assert table.get("b") is None and table.get("c") is not None
+    clock.now = 16
+    table.clear()
+    assert len(table) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"ttl_seconds": 0}])
+def test_table_rejects_bad_bounds(kwargs):
+    with pytest.raises(ValueError):
+        IdempotencyTable(**kwargs)
+
+
+def test_retry_returns_stored_response_without_rescoring(monkeypatch):
+    v3 = SentinelV3(CircuitBreakerThresholds(), idempotency=IdempotencyTable())
+    first = v3.evaluate(make_valid_v3_request(request_id="retry-1"))
+
+    import sentinel_ai_v2.v3 as v3_module
+
+    def _boom(*args, **kwargs):
+        raise AssertionError("retry must not be re-scored")
+
+    monkeypatch.setattr(v3_module, "compute_risk_score", _boom)
+    assert v3.evaluate(make_valid_v3_request(request_id="retry-1")) == first
+    assert v3.evaluate_batch([make_valid_v3_request(request_id="retry-1")]) == [first]
+
+
+def test_reused_request_id_with_other_telemetry_is_deterministic_error():
+    v3 = SentinelV3(CircuitBreakerThresholds(), idempotency=IdempotencyTable())
+    v3.evaluate(make_valid_v3_request(request_id="dup"))
+    other = make_valid_v3_request(telemetry={"mempool": {"score": 0.9}}, request_id="dup")
+
+    first, second = v3.evaluate(other), v3.evaluate_batch([other])[0]
+    for resp in (first, second):
+        assert resp["decision"] == "ERROR"
+        assert resp["reason_codes"] == [CONFLICT]
+    assert first["context_hash"] == second["context_hash"]
+
+
+def test_without_table_nothing_is_stored_and_batch_still_stores():
+    plain = SentinelV3(CircuitBreakerThresholds())
+    assert plain.idempotency is None
+    a = plain.evaluate(make_valid_v3_request(request_id="x"))
+    b = plain.evaluate(make_valid_v3_request(telemetry={"mempool": {"score": 0.9}}, request_id="x"))
+    assert b["decision"] != "ERROR" and a["context_hash"] != b["context_hash"]
+
+    table = IdempotencyTable()
+    deduped = SentinelV3(CircuitBreakerThresholds(), idempotency=table)
+    deduped.evaluate_batch([make_valid_v3_request(request_id="b1"), {"contract_version": 2}])
+    assert table.get("b1") is not None and len(table) == 1
+
+    bad = make_valid_v3_request(telemetry={"reorg": {"depth": "deep"}}, request_id="bad")
+    assert deduped.evaluate(bad)["decision"] == "ERROR"
+    assert table.get("bad") is None
+
+
+def test_evaluate_v3_idempotency_toggle(monkeypatch):
+    monkeypatch.setattr(api, "_DEFAULT_V3", api._DEFAULT_V3)
+    api.enable_idempotency(IdempotencyTable())
+    api.evaluate_v3(make_valid_v3_request(request_id="ac-1"))
+    conflict = api.evaluate_v3(make_valid_v3_request(telemetry={"reorg": {"depth": 9}}, request_id="ac-1"))
+    assert conflict["reason_codes"] == [CONFLICT]
+
+    api.enable_idempotency(None)
+    assert api._DEFAULT_V3.idempotency is None
+
+
+def test_batch_dedups_repeated_request_ids_like_sequential_calls(monkeypatch):
+    import sentinel_ai_v2.v3 as v3_module
+
+    scored = []
+    real = v3_module.compute_risk_score
+
+    def counting(*args, **kwargs):
+        scored.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(v3_module, "compute_risk_score", counting)
+
+    v3 = SentinelV3(CircuitBreakerThresholds(), idempotency=IdempotencyTable())
+    same = make_valid_v3_request(request_id="in-batch")
+    other = make_valid_v3_request(telemetry={"mempool": {"score": 0.9}}, request_id="in-batch")
+    first, repeat, conflict = v3.evaluate_batch([same, dict(same), other])
+
+    assert len(scored) == 1
+    assert repeat == first and repeat is not first
+    assert conflict["decision"] == "ERROR" and conflict["reason_codes"] == [CONFLICT]
+
+    sequential = SentinelV3(CircuitBreakerThresholds(), idempotency=IdempotencyTable())
+    expected = [sequential.evaluate(r) for r in (same, same, other)]
+    for got, want in zip((first, repeat, conflict), expected):
+        assert got["decision"] == want["decision"] and got["context_hash"] == want["context_hash"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_PATH = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_import.py"
+_spec = importlib.util.spec_from_file_location("bench_import", _PATH)
+bench_import = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_import)
+
+# Cold import budget for the CLI / evaluate_v3 path. Measured at ~50 ms on
+# a laptop-class machine; the headroom absorbs slow CI runners.
+IMPORT_BUDGET_US = 250_000
+
+# Must only load when the feature that needs them is used.
+LAZY_PREFIXES = (
+    "fastapi",
+    "starlette",
+    "pydantic",
+    "requests",
+    "urllib3",
+    "numpy",
+    "onnxruntime",
+    "oqs",
+    "cryptography",
+    "adaptive_core",
+    "tracemalloc",
+    "asyncio",
+    "sentinel_ai_v2.v4",
+    "sentinel_ai_v2.server",
+    "sentinel_ai_v2.profiling",
+    "sentinel_ai_v2.idempotency",
+    "sentinel_ai_v2.rpc_client",
+    "sentinel_ai_v2.shared_status",
+)
+
+
+def _lazy_loaded(records) -> list:
+    return sorted(
+        name
+        for name in bench_import.loaded_modules(records)
+        if any(name == p or name.startswith(p + ".") for p in LAZY_PREFIXES)
+    )
+
+
+def test_parse_importtime_skips_site_and_tracks_depth():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:        10 |         10 |   encodings.idna\n"
+        "import time:        50 |         60 | site\n"
+        "import time:       100 |        100 |     json.decoder\n"
+        "import time:        20 |        120 |   json\n"
+        "import time:        30 |        150 | mypkg\n"
+        "import time:         5 |          5 | other\n"
+    )
+
+    records = bench_import.parse_importtime(stderr)
+
+    assert bench_import.loaded_modules(records) == ["json.decoder", "json", "mypkg", "other"]
+    assert [r[3] for r in records] == [2, 1, 0, 0]
+    assert bench_import.total_us(records) == 155
+    assert bench_import.heaviest(records, top=1) == [{"module": "json.decoder", "self_us": 100, "cumulative_us": 100}]
+
+
+@pytest.mark.parametrize("module", ["sentinel_ai_v2.cli", "sentinel_ai_v2.api"])
+def test_entry_points_leave_heavy_and_optional_modules_unloaded(module):
+    assert _lazy_loaded(bench_import.import_profile(module)) == []
+
+
+def test_cli_import_time_within_budget():
+    best = min(bench_import.total_us(bench_import.import_profile("sentinel_ai_v2.cli")) for _ in range(3))
+    assert best <= IMPORT_BUDGET_US, f"sentinel_ai_v2.cli imported in {best} us (budget {IMPORT_BUDGET_US} us)"
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import sentinel_ai_v2.model_loader as ml
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import SentinelConfig
+from sentinel_ai_v2.contracts import canonical_hash_v3
+from sentinel_ai_v2.model_loader import compute_file_hash
+from sentinel_ai_v2.model_registry import ModelRegistry
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+
+def _doc(bias: float) -> dict:
+    return {"format": "sentinel.linear.v1", "weights": {"entropy_drop": 1.0}, "bias": bias}
+
+
+def _publish(path: Path, doc: dict, mtime_ns: int) -> str:
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return compute_file_hash(path)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ml.clear_runtime_cache()
+    yield
+    ml.clear_runtime_cache()
+
+
+def test_refresh_loads_swaps_and_notifies(tmp_path):
+    path = tmp_path / "model.json"
+    first_hash = _publish(path, _doc(0.0), 1_000_000_000)
+    registry = ModelRegistry(str(path))
+    seen = []
+    registry.subscribe(seen.append)
+
+    assert registry.current is None
+    assert registry.refresh() is True
+    assert registry.current.hash == first_hash
+    assert registry.refresh() is False  # unchanged file
+
+    second_hash = _publish(path, _doc(1.0), 2_000_000_000)
+    assert registry.refresh() is True
+    assert [m.hash for m in seen] == [first_hash, second_hash]
+
+    # Touch without content change: verified again but not swapped.
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert registry.refresh() is False
+    assert registry.current.hash == second_hash
+
+
+def test_rejected_file_keeps_previous_model(tmp_path):
+    path = tmp_path / "model.json"
+    good_hash = _publish(path, _doc(0.0), 1_000_000_000)
+    pinned = {"hash": good_hash}
+    registry = ModelRegistry(str(path), expected_hash=lambda: pinned["hash"])
+    assert registry.refresh() is True
+
+    _publish(path, _doc(5.0), 2_000_000_000)
+    assert registry.refresh() is False
+    assert "hash mismatch" in registry.last_error
+    assert registry.current.hash == good_hash
+
+    # Publishing the matching digest for the same file is not retried
+    # until the file changes again.
+    pinned["hash"] = compute_file_hash(path)
+    assert registry.refresh() is False
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert registry.refresh() is True
+    assert registry.last_error is None
+
+
+def test_missing_file_and_static_pin(tmp_path):
+    path = tmp_path / "model.json"
+    registry = ModelRegistry(str(path), expected_hash="0" * 64)
+    assert registry.refresh() is False
+    _publish(path, _doc(0.0), 1_000_000_000)
+    assert registry.refresh() is False
+    assert registry.current is None
+
+
+def test_client_swaps_evaluator_and_in_flight_keeps_old_model(tmp_path):
+    path = tmp_path / "model.json"
+    _publish(path, _doc(0.0), 1_000_000_000)
+    client = SentinelClient(SentinelConfig(model_path=None))
+    registry = ModelRegistry(str(path))
+    registry.refresh()
+    client.attach_model_registry(registry)
+
+    in_flight = client._v3
+    old_hash = in_flight.model.hash
+    new_hash = _publish(path, _doc(1.0), 2_000_000_000)
+    assert registry.refresh() is True
+
+    assert client._v3 is not in_flight
+    assert client._v3.model.hash == new_hash
+    assert in_flight.model.hash == old_hash
+
+    req = make_valid_v3_request()
+    old_resp = in_flight.evaluate(req)
+    new_resp = client._v3.evaluate(req)
+    assert old_resp["context_hash"] != new_resp["context_hash"]
+    assert new_resp["context_hash"] == canonical_hash_v3(
+        {
+            "component": "sentinel",
+            "contract_version": 3,
+            "telemetry": req["telemetry"],
+            "thresholds": client._v3._thresholds_fingerprint(client._v3.thresholds),
+            "model_used": True,
+            "model_hash": new_hash,
+        }
+    )
+
+
+def test_attach_before_first_load_keeps_client_model(tmp_path):
+    client = SentinelClient(SentinelConfig(model_path=None))
+    evaluator = client._v3
+    client.attach_model_registry(ModelRegistry(str(tmp_path / "absent.json")))
+    assert client._v3 is evaluator
+
+
+def test_background_polling_swaps_and_stops(tmp_path):
+    path = tmp_path / "model.json"
+    _publish(path, _doc(0.0), 1_000_000_000)
+    registry = ModelRegistry(str(path))
+    swapped = threading.Event()
+
+    registry.start(poll_interval_seconds=0.01)
+    registry.start(poll_interval_seconds=0.01)  # idempotent
+    assert registry.current is not None
+    registry.subscribe(lambda model: swapped.set())
+
+    _publish(path, _doc(1.0), 2_000_000_000)
+    assert swapped.wait(5.0)
+    registry.stop(timeout=5.0)
+    registry.stop()  # idempotent
+    assert registry._thread is None
+
+
+def test_background_poll_errors_are_contained(tmp_path, monkeypatch):
+    registry = ModelRegistry(str(tmp_path / "model.json"))
+    polled = threading.Event()
+
+    def _boom():
+        polled.set()
+        raise RuntimeError("stat failed")
+
+    registry.start(poll_interval_seconds=0.01)
+    monkeypatch.setattr(registry, "refresh", _boom)
+    assert polled.wait(5.0)
+    registry.stop(timeout=5.0)
+
+
+def test_concurrent_refresh_never_records_a_stale_rejection(tmp_path, monkeypatch):
+    import sentinel_ai_v2.model_registry as mr
+
+    path = tmp_path / "model.json"
+    _publish(path, _doc(0.0), 1_000_000_000)
+    entered, release = threading.Event(), threading.Event()
+    real_load = mr.load_and_verify_model
+
+    def load(model_path, expected_hash=None):
+        if not entered.is_set():  # the first (older) file is rejected, slowly
+            entered.set()
+            release.wait(5)
+            raise ml.ModelVerificationError("bad model")
+        return real_load(model_path, expected_hash=expected_hash)
+
+    monkeypatch.setattr(mr, "load_and_verify_model", load)
+    registry = ModelRegistry(str(path))
+    slow = threading.Thread(target=registry.refresh)
+    slow.start()
+    assert entered.wait(5)
+
+    good_hash = _publish(path, _doc(1.0), 2_000_000_000)
+    fast = threading.Thread(target=registry.refresh)
+    fast.start()
+    fast.join(0.05)
+    release.set()
+    slow.join(5)
+    fast.join(5)
+
+    assert registry.current.hash == good_hash
+    assert registry.last_error is None
+    assert registry.refresh() is False  # the good file's fingerprint is recorded
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import json
+from array import array
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import sentinel_ai_v2.model_loader as ml
+import sentinel_ai_v2.model_runtime as mr
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.feature_extractor import DEFAULT_FEATURE_EXTRACTOR
+from sentinel_ai_v2.model_loader import (
+    LoadedModel,
+    ModelVerificationError,
+    clear_runtime_cache,
+    load_and_verify_model,
+    run_batch_inference,
+    run_model_inference,
+)
+from sentinel_ai_v2.model_runtime import (
+    LinearModelRuntime,
+    ModelRuntimeError,
+    OnnxModelRuntime,
+    build_runtime,
+)
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+LINEAR_DOC = {
+    "format": "sentinel.linear.v1",
+    "weights": {"entropy_drop": 4.0, "mempool_anomaly": 2.0},
+    "bias": -2.0,
+    "link": "logistic",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_runtime_cache()
+    yield
+    clear_runtime_cache()
+
+
+def _write_model(tmp_path: Path, doc: dict, name: str = "model.json") -> Path:
+    path = tmp_path / name
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path
+
+
+def _sigmoid(z: float) -> float:
+    return float(1.0 / (1.0 + np.exp(-z)))
+
+
+def test_linear_runtime_logistic_and_identity_links():
+    logistic = LinearModelRuntime.from_document(LINEAR_DOC)
+    rows = np.array([[0, 0, 0, 0.5, 0.5, 0], [0] * 6], dtype=np.float64)
+    assert logistic.predict(rows).tolist() == pytest.approx([_sigmoid(1.0), _sigmoid(-2.0)])
+
+    identity = LinearModelRuntime(weights=[0, 0, 0, 2.0, 0, 0], bias=0.1, link="identity")
+    assert identity.predict(rows).tolist() == pytest.approx([1.0, 0.1])
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        {"format": "other"},
+        {**LINEAR_DOC, "link": "softmax"},
+        {**LINEAR_DOC, "weights": {"unknown_feature": 1.0}},
+        {**LINEAR_DOC, "weights": [1.0, 2.0]},
+        {**LINEAR_DOC, "weights": ["a", 0, 0, 0, 0, 0]},
+        {**LINEAR_DOC, "weights": [float("inf"), 0, 0, 0, 0, 0]},
+    ],
+)
+def test_linear_runtime_rejects_bad_documents(doc):
+    with pytest.raises(ModelRuntimeError):
+        LinearModelRuntime.from_document(doc)
+
+
+def test_build_runtime_dispatch():
+    assert isinstance(build_runtime(json.dumps(LINEAR_DOC).encode()), LinearModelRuntime)
+    with pytest.raises(ModelRuntimeError):
+        build_runtime(b"{not json")
+    with pytest.raises(ModelRuntimeError):
+        build_runtime(b'{"format": "\xff"}')  # not UTF-8
+
+
+def test_build_runtime_decodes_json_from_the_buffer(monkeypatch):
+    doc = bytearray(b" \r\n\t" + json.dumps(LINEAR_DOC).encode())
+    monkeypatch.setattr(mr, "OnnxModelRuntime", lambda data: pytest.fail("dispatched to ONNX"))
+    assert isinstance(build_runtime(memoryview(doc)), LinearModelRuntime)
+
+
+def test_numpy_missing_is_runtime_error(monkeypatch):
+    def _missing(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(mr.importlib, "import_module", _missing)
+    with pytest.raises(ModelRuntimeError):
+        mr.load_numpy()
+    with pytest.raises(ModelRuntimeError):
+        OnnxModelRuntime._load_ort()
+
+
+class _FakeInput:
+    name = "features"
+
+
+class _FakeSession:
+    def __init__(self, model_bytes, providers):
+        assert model_bytes == b"onnx-bytes"
+        assert providers == ["CPUExecutionProvider"]
+        self.runs = 0
+
+    def get_inputs(self):
+        return [_FakeInput()]
+
+    def run(self, output_names, feed):
+        self.runs += 1
+        rows = feed["features"]
+        assert rows.dtype == np.float32
+        # Two-column probability output: [p(benign), p(attack)]
+        attack = np.clip(rows[:, 3] * 2.0, 0.0, 1.0)
+        return [np.stack([1.0 - attack, attack], axis=1)]
+
+
+class _FakeOrt:
+    InferenceSession = _FakeSession
+
+
+class _BrokenOrt:
+    @staticmethod
+    def InferenceSession(model_bytes, providers):
+        raise RuntimeError("bad graph")
+
+
+def test_onnx_runtime_uses_positive_class_column():
+    runtime = OnnxModelRuntime(b"onnx-bytes", ort_module=_FakeOrt())
+    rows = np.array([[0, 0, 0, 0.25, 0, 0], [0, 0, 0, 0.9, 0, 0]])
+    assert runtime.predict(rows).tolist() == pytest.approx([0.5, 1.0])
+
+
+def test_onnx_runtime_session_failure_is_runtime_error():
+    with pytest.raises(ModelRuntimeError):
+        OnnxModelRuntime(b"onnx-bytes", ort_module=_BrokenOrt())
+
+
+def test_onnx_model_file_without_onnxruntime_fails_verification(tmp_path, monkeypatch):
+    real_import = mr.importlib.import_module
+
+    def _no_ort(name):
+        if name == "onnxruntime":
+            raise ImportError(name)
+        return real_import(name)
+
+    monkeypatch.setattr(mr.importlib, "import_module", _no_ort)
+    path = tmp_path / "model.onnx"
+    path.write_bytes(b"\x08\x07binary-onnx")
+    with pytest.raises(ModelVerificationError):
+        load_and_verify_model(str(path))
+
+
+def test_onnx_model_file_binds_cached_session(tmp_path, monkeypatch):
+    real_import = mr.importlib.import_module
+    monkeypatch.setattr(
+        mr.importlib,
+        "import_module",
+        lambda name: _FakeOrt() if name == "onnxruntime" else real_import(name),
+    )
+    path = tmp_path / "model.onnx"
+    path.write_bytes(b"onnx-bytes")
+    model = load_and_verify_model(str(path))
+    assert isinstance(model.runtime, OnnxModelRuntime)
+    assert model.runtime._session.runs == 1  # warm-up call
+    assert load_and_verify_model(str(path)).runtime is model.runtime
+
+
+def test_load_binds_cached_runtime_and_warms_up(tmp_path, monkeypatch):
+    path = _write_model(tmp_path, LINEAR_DOC)
+    calls = []
+    real_build = ml.build_runtime
+    monkeypatch.setattr(ml, "build_runtime", lambda data: calls.append(data) or real_build(data))
+
+    first = load_and_verify_model(str(path))
+    second = load_and_verify_model(str(path), expected_hash=first.hash)
+    assert first.runtime is second.runtime
+    assert len(calls) == 1
+
+    # New content -> new hash -> new session.
+    _write_model(tmp_path, {**LINEAR_DOC, "bias": 0.0})
+    third = load_and_verify_model(str(path), warmup=False)
+    assert third.hash != first.hash
+    assert third.runtime is not first.runtime
+
+
+def test_inference_accepts_dict_row_and_batch(tmp_path):
+    model = load_and_verify_model(str(_write_model(tmp_path, LINEAR_DOC)))
+    features = {"entropy_drop": 0.5, "mempool_anomaly": 0.5}
+    buf = DEFAULT_FEATURE_EXTRACTOR.extract({"entropy": {"drop": 0.5}, "mempool": {"anomaly": 0.5}})
+
+    assert run_model_inference(model, features) == pytest.approx(_sigmoid(1.0))
+    assert run_model_inference(model, buf) == pytest.approx(_sigmoid(1.0))
+
+    rows = DEFAULT_FEATURE_EXTRACTOR.extract_batch([{}, {"entropy": {"drop": 0.5}}])
+    scores = run_batch_inference(model, rows)
+    assert scores.shape == (2,)
+    assert scores.tolist() == pytest.approx([_sigmoid(-2.0), _sigmoid(0.0)])
+
+
+def test_inference_without_runtime_fails(tmp_path):
+    with pytest.raises(ModelVerificationError):
+        run_model_inference(LoadedModel(path=tmp_path, hash="x"), array("d", [0.0] * 6))
+
+
+def test_v3_evaluate_and_batch_agree_with_real_model(tmp_path):
+    model = load_and_verify_model(str(_write_model(tmp_path, LINEAR_DOC)))
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), model=model)
+    requests = [
+        make_valid_v3_request(request_id="a"),
+        {"contract_version": 2},
+        make_valid_v3_request(request_id="b", telemetry={"entropy": {"drop": "x"}}),
+        make_valid_v3_request(request_id="c", telemetry={"entropy": {"drop": 0.5}}),
+    ]
+
+    batch = v3.evaluate_batch(requests)
+    single = [v3.evaluate(r) for r in requests]
+    for got, want in zip(batch, single):
+        got["meta"].pop("latency_ms")
+        want["meta"].pop("latency_ms")
+        assert got == want
+    assert [r["decision"] for r in batch][1:3] == ["ERROR", "ERROR"]
+    assert batch[0]["meta"]["model_used"] is True
+
+
+def test_v3_batch_without_model_and_all_errors():
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds())
+    out = v3.evaluate_batch([make_valid_v3_request(), "nope"])
+    assert out[0]["meta"]["model_used"] is False
+    assert out[1]["decision"] == "ERROR"
+    assert v3.evaluate_batch([]) == []
+
+
+def test_sentinel_client_binds_model_from_config(tmp_path):
+    path = _write_model(tmp_path, LINEAR_DOC)
+    client = SentinelClient(SentinelConfig(model_path=str(path)))
+    assert client._model is not None
+    assert isinstance(client._model.runtime, LinearModelRuntime)
+    assert client.evaluate_snapshot({"entropy": {"score": 0.1}}).status == "NORMAL"
+
+
+# Two stumps over the default layout:
+#   tree 0: entropy_drop (col 3) < 0.2 ? -1.0 : +1.0
+#   tree 1: reorg_depth  (col 5) < 3   ? (mempool_anomaly (col 4) < 0.5 ? -0.5 : 0.5) : +2.0
+TREE_DOC = {
+    "format": "sentinel.trees.v1",
+    "feature": [3, -1, -1, 5, 4, -1, -1, -1],
+    "threshold": [0.2, 0, 0, 3, 0.5, 0, 0, 0],
+    "left": [1, -1, -1, 4, 5, -1, -1, -1],
+    "right": [2, -1, -1, 7, 6, -1, -1, -1],
+    "value": [0, -1.0, 1.0, 0, 0, -0.5, 0.5, 2.0],
+    "roots": [0, 3],
+    "base_score": 0.0,
+    "link": "identity",
+}
+
+
+def _reference_tree_score(row) -> float:
+    total = -1.0 if row[3] < 0.2 else 1.0
+    if row[5] < 3:
+        total += -0.5 if row[4] < 0.5 else 0.5
+    else:
+        total += 2.0
+    return min(max(total, 0.0), 1.0)
+
+
+def test_tree_runtime_matches_scalar_reference():
+    from sentinel_ai_v2.model_runtime import TreeEnsembleRuntime
+
+    runtime = TreeEnsembleRuntime.from_document(TREE_DOC)
+    assert runtime.depth == 2
+    rng = np.random.default_rng(7)
+    rows = np.column_stack(
+        [rng.random((256, 5)), rng.integers(0, 6, size=256).astype(np.float64)]
+    )
+    rows[:, 3] = rng.random(256) * 0.4
+    expected = [_reference_tree_score(r) for r in rows]
+    assert runtime.predict(rows).tolist() == pytest.approx(expected)
+
+
+def test_tree_runtime_logistic_link_and_single_leaf_tree():
+    from sentinel_ai_v2.model_runtime import TreeEnsembleRuntime
+
+    runtime = TreeEnsembleRuntime(
+        feature=[-1], threshold=[0.0], left=[-1], right=[-1], value=[0.0], roots=[0], base_score=0.0
+    )
+    assert runtime.depth == 0
+    assert runtime.predict(np.zeros((3, 6))).tolist() == [0.5, 0.5, 0.5]
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        {"format": "other"},
+        {"link": "softmax"},
+        {"feature": [3.0, -1, -1, 5, 4, -1, -1, -1]},
+        {"feature": "nope"},
+        {"threshold": "nope"},
+        {"threshold": ["a"] * 8},
+        {"value": [float("nan")] * 8},
+        {"value": [0.0] * 7},
+        {"roots": []},
+        {"roots": [8]},
+        {"feature": [9, -1, -1, 5, 4, -1, -1, -1]},
+        {"right": [99, -1, -1, 7, 6, -1, -1, -1]},
+        {"left": [0, -1, -1, 4, 5, -1, -1, -1]},
+    ],
+)
+def test_tree_runtime_rejects_bad_documents(patch):
+    from sentinel_ai_v2.model_runtime import TreeEnsembleRuntime
+
+    with pytest.raises(ModelRuntimeError):
+        TreeEnsembleRuntime.from_document({**TREE_DOC, **patch})
+
+
+def test_build_runtime_rejects_unknown_document_format():
+    with pytest.raises(ModelRuntimeError):
+        build_runtime(b'{"format": "sentinel.unknown.v1"}')
+
+
+def test_tree_model_file_scores_through_v3(tmp_path):
+    from sentinel_ai_v2.model_loader import compute_file_hash
+    from sentinel_ai_v2.model_runtime import TreeEnsembleRuntime
+
+    path = _write_model(tmp_path, TREE_DOC, name="trees.json")
+    model = load_and_verify_model(str(path), expected_hash=compute_file_hash(path))
+    assert isinstance(model.runtime, TreeEnsembleRuntime)
+
+    telemetry = {"entropy": {"drop": 0.5}, "mempool": {"anomaly": 0.9}, "reorg": {"depth": 1}}
+    assert run_model_inference(model, DEFAULT_FEATURE_EXTRACTOR.extract(telemetry)) == 1.0
+    assert run_model_inference(model, {}) == 0.0
+
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), model=model)
+    out = v3.evaluate(make_valid_v3_request(telemetry=telemetry))
+    assert out["meta"]["model_used"] is True
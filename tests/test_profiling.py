@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import PlainTextResponse
+
+import sentinel_ai_v2.api as api
+import sentinel_ai_v2.server as server
+import sentinel_ai_v2.v3 as v3mod
+from sentinel_ai_v2.config import CircuitBreakerThresholds
+from sentinel_ai_v2.idempotency import IdempotencyTable
+from sentinel_ai_v2.profiling import StageProfiler
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+
+def _run(coro):
+    try:
+        return coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+def _always(**kwargs) -> StageProfiler:
+    return StageProfiler(1.0, rng=lambda: 0.0, **kwargs)
+
+
+def _stacks(profiler: StageProfiler) -> set:
+    return set(profiler.stats()["stacks"])
+
+
+def test_sample_rate_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        StageProfiler(1.5)
+    with pytest.raises(ValueError):
+        StageProfiler(-0.1)
+
+
+def test_sampled_evaluate_records_every_stage():
+    profiler = _always()
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), profiler=profiler)
+
+    plain = SentinelV3(thresholds=CircuitBreakerThresholds()).evaluate(make_valid_v3_request())
+    resp = v3.evaluate(make_valid_v3_request())
+
+    assert resp["decision"] == plain["decision"] and resp["context_hash"] == plain["context_hash"]
+    assert profiler.samples == 1
+    assert _stacks(profiler) == {
+        "v3.evaluate;parse;size_check",
+        "v3.evaluate;parse;finite_walk",
+        "v3.evaluate;parse;gates",
+        "v3.evaluate;extract",
+        "v3.evaluate;scoring",
+        "v3.evaluate;hash",
+        "v3.evaluate;respond",
+        "v3.evaluate",
+    }
+    stats = profiler.stats()["stacks"]["v3.evaluate;parse;finite_walk"]
+    assert stats["laps"] == 1 and stats["wall_us"] >= stats["mean_wall_us"] > 0
+    assert not tracemalloc.is_tracing()  # only traced while a sample is in flight
+
+
+def test_idempotency_and_model_stages(monkeypatch):
+    monkeypatch.setattr(v3mod, "run_model_inference", lambda model, features: 0.42)
+    profiler = _always()
+    v3 = SentinelV3(
+        thresholds=CircuitBreakerThresholds(),
+        model=object(),  # type: ignore[arg-type]
+        idempotency=IdempotencyTable(),
+        profiler=profiler,
+    )
+
+    v3.evaluate(make_valid_v3_request())
+    v3.evaluate(make_valid_v3_request())  # replayed
+
+    stacks = profiler.stats()["stacks"]
+    assert stacks["v3.evaluate;idempotency"]["laps"] == 2
+    assert stacks["v3.evaluate;hash"]["laps"] == 2
+    assert stacks["v3.evaluate;model"]["laps"] == 1
+
+
+def test_failed_requests_are_profiled_up_to_the_failure():
+    profiler = _always()
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), profiler=profiler)
+
+    bad_number = make_valid_v3_request(telemetry={"entropy": {"score": "x"}})
+    assert v3.evaluate(bad_number)["decision"] == "ERROR"
+    assert v3.evaluate({"contract_version": 2})["decision"] == "ERROR"
+
+    assert "v3.evaluate;extract" in _stacks(profiler)
+    assert profiler.samples == 2
+
+
+def test_unsampled_requests_record_nothing_and_nested_follow_outer_decision():
+    profiler = StageProfiler(0.5, rng=lambda: 0.9)
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), profiler=profiler)
+
+    with profiler.profile("http.evaluate") as sample:
+        assert sample is None
+        v3.evaluate(make_valid_v3_request())
+
+    assert profiler.samples == 0 and profiler.folded() == ""
+
+
+def test_nested_profiles_share_one_stack():
+    profiler = _always(track_allocations=False)
+    v3 = SentinelV3(thresholds=CircuitBreakerThresholds(), profiler=profiler)
+
+    with profiler.profile("http.evaluate") as sample:
+        sample.lap("decode")
+        v3.evaluate(make_valid_v3_request())
+
+    stacks = _stacks(profiler)
+    assert profiler.samples == 1
+    assert {"http.evaluate", "http.evaluate;decode", "http.evaluate;v3.evaluate"} <= stacks
+    assert "http.evaluate;v3.evaluate;parse;finite_walk" in stacks
+    assert all(v["alloc_bytes"] == 0 for v in profiler.stats()["stacks"].values())
+
+
+def test_external_tracemalloc_is_left_running():
+    profiler = _always()
+    tracemalloc.start()
+    try:
+        with profiler.profile("job") as sample:
+            data = [0] * 100_000
+            sample.lap("alloc")
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    del data
+
+    assert profiler.stats()["stacks"]["job;alloc"]["alloc_bytes"] >= 800_000
+
+
+def test_folded_output_and_reset():
+    profiler = _always()
+    with profiler.profile("job") as sample:
+        sample.lap("a")
+
+    lines = profiler.folded("cpu").splitlines()
+    assert [line.rsplit(" ", 1)[0] for line in lines] == ["job", "job;a"]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in profiler.folded("alloc").splitlines())
+    with pytest.raises(ValueError):
+        profiler.folded("bogus")
+
+    profiler.reset()
+    assert profiler.samples == 0 and profiler.stats()["stacks"] == {}
+
+
+def test_enable_profiling_on_default_evaluator():
+    profiler = _always()
+    api.enable_profiling(profiler)
+    try:
+        api.evaluate_v3(make_valid_v3_request())
+    finally:
+        api.enable_profiling(None)
+
+    assert profiler.samples == 1
+    assert api._DEFAULT_V3.profiler is None
+
+
+def test_profiler_from_env(monkeypatch):
+    attached = []
+
+    class Wrapper:
+        def attach_profiler(self, profiler):
+            attached.append(profiler)
+
+    monkeypatch.delenv(server.PROFILE_SAMPLE_RATE_ENV_VAR, raising=False)
+    assert server._profiler_from_env(Wrapper()) is None
+
+    monkeypatch.setenv(server.PROFILE_SAMPLE_RATE_ENV_VAR, "0.25")
+    monkeypatch.setenv(server.PROFILE_ALLOCATIONS_ENV_VAR, "0")
+    profiler = server._profiler_from_env(Wrapper())
+    assert profiler.sample_rate == 0.25 and profiler.track_allocations is False
+    assert attached == [profiler]
+
+
+def test_admin_profile_requires_the_admin_token(monkeypatch):
+    monkeypatch.setattr(server, "profiler", _always())
+    monkeypatch.delenv(server.ADMIN_TOKEN_ENV_VAR, raising=False)
+    with pytest.raises(HTTPException) as e:
+        _run(server.profile(x_sentinel_admin_token="anything"))
+    assert e.value.status_code == 404  # admin endpoints off by default
+
+    monkeypatch.setenv(server.ADMIN_TOKEN_ENV_VAR, "s3cret")
+    for token in (None, "wrong"):
+        with pytest.raises(HTTPException) as e:
+            _run(server.profile(x_sentinel_admin_token=token))
+        assert e.value.status_code == 403
+    assert isinstance(_run(server.profile(x_sentinel_admin_token="s3cret")), PlainTextResponse)
+
+
+def test_server_profiles_evaluate_and_serves_admin_profile(monkeypatch):
+    monkeypatch.setenv(server.ADMIN_TOKEN_ENV_VAR, "s3cret")
+    with pytest.raises(HTTPException) as e:
+        _run(server.profile(x_sentinel_admin_token="s3cret"))
+    assert e.value.status_code == 404
+
+    profiler = _always()
+    monkeypatch.setattr(server, "profiler", profiler)
+    server.wrapper.attach_profiler(profiler)
+    try:
+        req = server.EvaluateRequest(telemetry={"block_height": 1, "mempool_size": 2})
+        assert _run(server.evaluate(req)).status
+    finally:
+        server.wrapper.attach_profiler(None)
+
+    folded = _run(server.profile(x_sentinel_admin_token="s3cret"))
+    assert isinstance(folded, PlainTextResponse)
+    assert b"http.evaluate;v3.evaluate;parse;finite_walk " in folded.body
+
+    stats = _run(server.profile(format="json", metric="cpu", reset=True, x_sentinel_admin_token="s3cret"))
+    assert stats["samples"] == 1
+    assert profiler.samples == 0
+
+
+def test_server_profiler_does_not_touch_the_default_client():
+    assert server.wrapper._client is not api.get_default_client()
+    server.wrapper.attach_profiler(StageProfiler(1.0))
+    try:
+        assert api.get_default_client()._v3.profiler is None
+    finally:
+        server.wrapper.attach_profiler(None)
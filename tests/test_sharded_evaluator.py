@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+import sentinel_ai_v2.model_loader as model_loader
+import sentinel_ai_v2.sharded_evaluator as sharded
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.model_loader import ModelVerificationError, load_and_verify_model
+from sentinel_ai_v2.sharded_evaluator import ShardedV3Evaluator
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+MODEL = b'{"format": "sentinel.linear.v1", "weights": {"entropy_drop": 4.0}, "bias": -1.0}'
+
+
+def _requests(n):
+    out = [
+        make_valid_v3_request(
+            telemetry={"entropy": {"drop": i / n}, "reorg": {"depth": i % 5}},
+            request_id=f"r{i}",
+        )
+        for i in range(n)
+    ]
+    out[3] = {"contract_version": 2}
+    return out
+
+
+def _strip_latency(responses):
+    for resp in responses:
+        resp["meta"].pop("latency_ms", None)
+    return responses
+
+
+@pytest.fixture()
+def model_file(tmp_path):
+    path = tmp_path / "model.json"
+    path.write_bytes(MODEL)
+    return path
+
+
+def test_sharded_matches_single_process(model_file):
+    thresholds = CircuitBreakerThresholds()
+    requests = _requests(25)
+    reference = SentinelV3(thresholds, model=load_and_verify_model(str(model_file)))
+
+    with ShardedV3Evaluator(
+        thresholds,
+        model_path=str(model_file),
+        processes=2,
+        chunk_size=4,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as evaluator:
+        got = evaluator.evaluate_batch(requests)
+        single = evaluator.evaluate(requests[7])
+        assert evaluator.evaluate_batch([]) == []
+
+    assert evaluator.model_hash == reference.model.hash
+    assert _strip_latency(got) == _strip_latency(reference.evaluate_batch(requests))
+    assert _strip_latency([single]) == _strip_latency([reference.evaluate(requests[7])])
+    assert got[7]["meta"]["model_used"] is True
+
+
+def test_worker_functions_in_process(model_file, monkeypatch):
+    monkeypatch.setattr(sharded, "_WORKER_V3", None)
+    sharded._init_worker(CircuitBreakerThresholds(), None, None)
+    assert sharded._WORKER_V3.model is None
+    assert len(sharded._evaluate_chunk(_requests(5))) == 5
+
+    sharded._init_worker(CircuitBreakerThresholds(), str(model_file), None)
+    assert sharded._WORKER_V3.model is not None
+
+
+def test_model_is_verified_in_parent(model_file, tmp_path):
+    with pytest.raises(ModelVerificationError, match="hash mismatch"):
+        ShardedV3Evaluator(
+            CircuitBreakerThresholds(), model_path=str(model_file), expected_hash="0" * 64
+        )
+    with pytest.raises(ModelVerificationError, match="not found"):
+        ShardedV3Evaluator(CircuitBreakerThresholds(), model_path=str(tmp_path / "missing.json"))
+
+
+def test_parent_hashes_the_model_without_building_a_runtime(model_file, monkeypatch):
+    def no_runtime(*args, **kwargs):
+        pytest.fail("the parent built a model runtime")
+
+    monkeypatch.setattr(model_loader, "_get_runtime", no_runtime)
+    expected = model_loader.verify_model_file(str(model_file))
+    evaluator = ShardedV3Evaluator(
+        CircuitBreakerThresholds(), model_path=str(model_file), expected_hash=expected
+    )
+    evaluator.close()
+    assert evaluator.model_hash == expected
+
+
+def test_from_config_and_validation(model_file):
+    config = SentinelConfig(model_path=str(model_file))
+    with ShardedV3Evaluator.from_config(config, processes=1) as evaluator:
+        assert evaluator.processes == 1
+        assert evaluator.model_hash == load_and_verify_model(str(model_file)).hash
+
+    with ShardedV3Evaluator.from_config(SentinelConfig(model_path=""), processes=1) as evaluator:
+        assert evaluator.model_hash is None
+
+    with pytest.raises(ValueError):
+        ShardedV3Evaluator(CircuitBreakerThresholds(), processes=0)
+    with pytest.raises(ValueError):
+        ShardedV3Evaluator(CircuitBreakerThresholds(), chunk_size=0)
+    ShardedV3Evaluator(CircuitBreakerThresholds()).close()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import struct
+
+import pytest
+from fastapi import HTTPException
+
+import sentinel_ai_v2.server as server
+import sentinel_ai_v2.shared_status as shs
+from sentinel_ai_v2.api import SentinelClient, SentinelResult
+from sentinel_ai_v2.config import SentinelConfig
+from sentinel_ai_v2.shared_status import SharedStatusError, SharedStatusStore
+from sentinel_ai_v2.wrapper.monitor import Monitor
+from sentinel_ai_v2.wrapper.sentinel_wrapper import SentinelWrapper
+
+SECOND = 1_000_000_000
+
+
+def _run(coro):
+    try:
+        return coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+class Clock:
+    def __init__(self, now: int = 1_000 * SECOND) -> None:
+        self.now = now
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def test_record_latest_and_aggregates(tmp_path):
+    clock = Clock()
+    with SharedStatusStore(tmp_path / "status", slots=4, clock=clock) as store:
+        assert store.latest() is None
+        store.record("HIGH", 0.7, ["a", "b"])
+        clock.now += SECOND
+        store.record("NORMAL", 0.1)
+
+        assert store.latest() == {"status": "NORMAL", "risk_score": 0.1, "details": [], "updated_at": 1001.0}
+        snap = store.snapshot()
+
+    assert snap["slots"] == 1 and snap["evaluations"] == 2
+    assert snap["by_status"] == {"NORMAL": 1, "ELEVATED": 0, "HIGH": 1, "CRITICAL": 0, "ERROR": 0}
+    assert snap["risk"]["mean"] == pytest.approx(0.4)
+    assert snap["risk"]["stddev"] == pytest.approx(0.3)
+    assert snap["risk"]["max"] == 0.7
+    assert snap["window"]["evaluations"] == 2 and snap["window"]["alerts"] == 1
+
+
+def test_window_drops_old_seconds_and_reuses_buckets(tmp_path):
+    clock = Clock()
+    with SharedStatusStore(tmp_path / "status", slots=1, clock=clock) as store:
+        store.record("CRITICAL", 0.9)
+        clock.now += shs.WINDOW_SECONDS * SECOND  # same bucket, next lap
+        store.record("NORMAL", 0.2)
+        store.record("NORMAL", 0.2)
+        window = store.snapshot()["window"]
+        clock.now += shs.WINDOW_SECONDS * SECOND
+        assert store.snapshot()["window"]["evaluations"] == 0
+
+    assert window["evaluations"] == 2 and window["alerts"] == 0
+
+
+def test_unknown_status_non_finite_risk_and_long_details(tmp_path):
+    with SharedStatusStore(tmp_path / "status", slots=1) as store:
+        store.record("WHATEVER", float("nan"), ["x" * 300, "y" * 300, "z"])
+        latest = store.latest()
+        snap = store.snapshot()
+
+    assert latest["status"] == "UNKNOWN" and latest["details"] == ["x" * 300]
+    assert snap["evaluations"] == 1 and sum(snap["by_status"].values()) == 0
+    assert snap["risk"] == {"mean": 0.0, "stddev": 0.0, "max": 0.0}
+
+
+def test_processes_share_one_view_and_dead_slots_are_adopted(tmp_path):
+    path = tmp_path / "status"
+    parent = SharedStatusStore(path, slots=2)
+    parent.record("NORMAL", 0.1)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        parent.record("CRITICAL", 0.95, ["child"])  # forked: claims its own slot
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    snap = parent.snapshot()
+    assert snap["slots"] == 2 and snap["evaluations"] == 2
+    assert snap["latest"]["details"] == ["child"]
+
+    # Both slots are taken; the child's is free again because it exited.
+    with SharedStatusStore(path) as restarted:
+        assert restarted.slots == 2
+        restarted.record("ELEVATED", 0.5)
+        assert restarted.snapshot()["by_status"]["CRITICAL"] == 1  # adopted counters
+        with SharedStatusStore(path) as extra:
+            with pytest.raises(SharedStatusError, match="no free slot"):
+                extra.record("NORMAL", 0.0)
+    parent.close()
+
+
+def test_torn_slot_is_skipped_by_readers_and_repaired_on_claim(tmp_path, monkeypatch):
+    path = tmp_path / "status"
+    with SharedStatusStore(path, slots=1) as store:
+        store.record("HIGH", 0.8)
+        seq = shs.HEADER_SIZE // 8
+        store._words[seq] += 1  # writer "died" mid-update
+        struct.pack_into("<I", store._mm, shs.HEADER_SIZE + 8, 0x7FFFFFFF)
+        monkeypatch.setattr(shs, "MAX_READ_RETRIES", 3)
+
+        assert store.snapshot()["slots"] == 0
+        store._pid = 0  # next record re-claims, as a fresh process would
+        store.record("NORMAL", 0.1)
+        assert store._words[seq] % 2 == 0
+        assert store.snapshot()["evaluations"] == 2
+
+
+def test_pid_alive_treats_foreign_processes_as_alive(monkeypatch):
+    def denied(pid, sig):
+        raise PermissionError
+
+    monkeypatch.setattr(shs.os, "kill", denied)
+    assert shs._pid_alive(1) is True
+
+
+def test_rejects_bad_files_and_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        SharedStatusStore(tmp_path / "s", slots=0)
+
+    short = tmp_path / "short"
+    short.write_bytes(b"x" * 10)
+    with pytest.raises(SharedStatusError, match="truncated"):
+        SharedStatusStore(short)
+
+    foreign = tmp_path / "foreign"
+    foreign.write_bytes(b"x" * 4096)
+    with pytest.raises(SharedStatusError, match="not a shared status file"):
+        SharedStatusStore(foreign)
+
+    cut = tmp_path / "cut"
+    SharedStatusStore(cut, slots=4).close()
+    os.truncate(cut, shs.HEADER_SIZE + shs.SLOT_SIZE)
+    with pytest.raises(SharedStatusError, match="layout mismatch"):
+        SharedStatusStore(cut)
+
+
+def test_monitor_and_wrapper_report_the_shared_latest(tmp_path):
+    path = tmp_path / "status"
+    with SharedStatusStore(path) as mine, SharedStatusStore(path) as other:
+        monitor = Monitor(store=mine)
+        assert monitor.last_status()["status"] == "NO_DATA"
+
+        wrapper = SentinelWrapper(client=SentinelClient(SentinelConfig()), status_store=mine)
+        wrapper.evaluate({"block_height": 1, "mempool_size": 2})
+        other.record("CRITICAL", 0.99, ["other-worker"])
+
+        assert wrapper.last_status() == {"status": "CRITICAL", "risk_score": 0.99, "details": ["other-worker"]}
+        monitor.update(SentinelResult(status="ELEVATED", risk_score=0.4, details=[]))
+        assert monitor.last_status()["status"] == "ELEVATED"
+        assert mine.snapshot()["evaluations"] == 3
+
+
+def test_server_status_store_from_env_and_aggregate_endpoint(tmp_path, monkeypatch):
+    monkeypatch.delenv(server.SHARED_STATUS_ENV_VAR, raising=False)
+    assert server._status_store_from_env() is None
+    with pytest.raises(HTTPException) as e:
+        _run(server.status_aggregate())
+    assert e.value.status_code == 404
+
+    monkeypatch.setenv(server.SHARED_STATUS_ENV_VAR, str(tmp_path / "status"))
+    store = server._status_store_from_env()
+    try:
+        store.record("NORMAL", 0.05)
+        monkeypatch.setattr(server, "status_store", store)
+        body = _run(server.status_aggregate())
+    finally:
+        store.close()
+    assert body["evaluations"] == 1 and body["latest"]["status"] == "NORMAL"
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import pytest
+
+from sentinel_ai_v2.config import CircuitBreakerThresholds
+from sentinel_ai_v2.correlation_engine import TemporalCorrelator, TemporalSignal
+from sentinel_ai_v2.scoring import compute_risk_score
+
+ENTROPY = {"entropy_drop": 0.3}
+MEMPOOL = {"mempool_anomaly": 0.9}
+REORG = {"reorg_depth": 4}
+QUIET: dict = {}
+
+
+def _correlator(**kwargs) -> TemporalCorrelator:
+    return TemporalCorrelator(CircuitBreakerThresholds(), **kwargs)
+
+
+def test_ordered_chain_within_window_is_detected():
+    c = _correlator()
+    assert c.window_seconds == 60.0
+    assert not c.observe(ENTROPY, now=0.0).sequence_detected
+    assert not c.observe(MEMPOOL, now=20.0).sequence_detected
+    out = c.observe(REORG, now=59.0)
+    assert out.sequence_detected
+    assert out.co_occurrence
+    assert out.window_hits == {"entropy_drop": 1, "mempool_anomaly": 1, "reorg_depth": 1}
+    assert "temporal:sequence entropy_drop>mempool_anomaly>reorg_depth within 60s" in out.details
+
+
+def test_chain_outside_window_or_out_of_order_is_not_a_sequence():
+    c = _correlator()
+    c.observe(ENTROPY, now=0.0)
+    c.observe(MEMPOOL, now=30.0)
+    late = c.observe(REORG, now=61.0)
+    assert not late.sequence_detected
+    assert not late.co_occurrence
+    assert late.window_hits["entropy_drop"] == 0
+
+    c = _correlator()
+    c.observe(REORG, now=0.0)
+    c.observe(MEMPOOL, now=1.0)
+    out = c.observe(ENTROPY, now=2.0)
+    assert out.co_occurrence
+    assert not out.sequence_detected
+    assert out.details == ["temporal:co_occurrence within 60s"]
+
+
+def test_later_start_keeps_chain_alive():
+    c = _correlator()
+    c.observe(ENTROPY, now=0.0)
+    c.observe(ENTROPY, now=50.0)
+    c.observe(MEMPOOL, now=55.0)
+    assert c.observe(REORG, now=100.0).sequence_detected
+
+
+def test_single_snapshot_combo_counts_as_sequence():
+    c = _correlator()
+    out = c.observe({**ENTROPY, **MEMPOOL, **REORG}, now=5.0)
+    assert out.sequence_detected and out.co_occurrence
+
+
+def test_window_max_is_sliding_maximum():
+    c = _correlator(window_seconds=10)
+    c.observe({"entropy_drop": 0.5}, now=0.0)
+    c.observe({"entropy_drop": 0.1}, now=1.0)
+    assert c.observe({"entropy_drop": 0.2}, now=5.0).window_max["entropy_drop"] == 0.5
+    assert c.observe(QUIET, now=10.5).window_max["entropy_drop"] == 0.2
+    assert c.observe(QUIET, now=20.0).window_max["entropy_drop"] == 0.0
+
+
+def test_deques_stay_bounded_and_clock_never_runs_backwards():
+    c = _correlator(capacity=4)
+    for t in range(100):
+        c.observe({**ENTROPY, "mempool_anomaly": 100 - t}, now=float(t))
+    windows = dict(zip((s.name for s in c.signals), c._windows))
+    assert len(windows["entropy_drop"].hits) == 4
+    assert len(windows["mempool_anomaly"].maxima) <= 61
+
+    out = c.observe(QUIET, now=10.0)
+    assert c._last == 99.0
+    assert out.window_hits["entropy_drop"] == 4
+
+    c.reset()
+    assert c.observe(QUIET, now=0.0).window_hits["entropy_drop"] == 0
+
+
+def test_clock_and_custom_signals():
+    ticks = iter([1.0, 2.0])
+    c = _correlator(
+        signals=[TemporalSignal("a", "x", 1.0), TemporalSignal("b", "y", 1.0)],
+        clock=lambda: next(ticks),
+    )
+    c.observe({"x": 1})
+    out = c.observe({"y": 2})
+    assert out.sequence_detected
+    assert out.window_max == {"a": 1.0, "b": 2.0}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"signals": []}, {"capacity": 0}, {"window_seconds": 0}],
+)
+def test_invalid_configuration_rejected(kwargs):
+    with pytest.raises(ValueError):
+        _correlator(**kwargs)
+
+
+def test_compute_risk_score_trips_breaker_on_windowed_combo():
+    thresholds = CircuitBreakerThresholds()
+    ticks = iter([0.0, 10.0, 20.0])
+    c = TemporalCorrelator(thresholds, clock=lambda: next(ticks))
+
+    assert compute_risk_score(ENTROPY, thresholds, correlator=c).status != "CRITICAL"
+    compute_risk_score(MEMPOOL, thresholds, correlator=c)
+    score = compute_risk_score(REORG, thresholds, correlator=c)
+    assert score.status == "CRITICAL"
+    assert score.temporal is not None and score.temporal.sequence_detected
+    assert (
+        "circuit_breaker:windowed combo: entropy_drop + mempool_anomaly + reorg_depth"
+        in score.details
+    )
+
+    assert compute_risk_score(REORG, thresholds).temporal is None
+
+
+def test_snapshot_combo_is_not_reported_twice():
+    thresholds = CircuitBreakerThresholds()
+    c = TemporalCorrelator(thresholds, clock=lambda: 0.0)
+    score = compute_risk_score({**ENTROPY, **MEMPOOL, **REORG}, thresholds, correlator=c)
+    assert score.circuit_breakers.reasons == ["combo: entropy + mempool + reorg"]
+
+
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import SentinelConfig
+from sentinel_ai_v2.engine.watcher_loop import watch_stream, watch_stream_pipelined
+from sentinel_ai_v2.scoring import StreamState
+from sentinel_ai_v2.v3 import SentinelV3
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+CHAIN = [{"entropy": {"drop": 0.3}}, {"mempool": {"anomaly": 0.9}}, {"reorg": {"depth": 4}}]
+
+
+def test_stream_state_lets_v3_trip_the_windowed_combo():
+    thresholds = CircuitBreakerThresholds()
+    state = StreamState.for_thresholds(thresholds)
+    assert state.correlator.window_seconds == thresholds.multi_signal_window_seconds
+
+    stateless = SentinelV3(thresholds)
+    stateful = SentinelV3(thresholds, stream_state=state)
+    plain = [stateless.evaluate(make_valid_v3_request(telemetry=t)) for t in CHAIN]
+    windowed = [stateful.evaluate(make_valid_v3_request(telemetry=t)) for t in CHAIN]
+
+    assert [r["risk"]["tier"] for r in windowed[:2]] == [r["risk"]["tier"] for r in plain[:2]]
+    assert "CRITICAL" not in {r["risk"]["tier"] for r in plain}
+    assert windowed[2]["risk"]["tier"] == "CRITICAL"
+    assert any("windowed combo" in d for d in windowed[2]["evidence"]["details"]["v2_details"])
+
+
+def test_watch_streams_opt_in_without_touching_the_client():
+    client = SentinelClient(SentinelConfig())
+    seen = []
+    watch_stream(CHAIN, client=client, handler=seen.append)
+    assert seen[-1].status != "CRITICAL"
+
+    state = StreamState.for_thresholds(client._thresholds)
+    watch_stream(CHAIN, client=client, handler=seen.append, stream_state=state)
+    assert seen[-1].status == "CRITICAL"
+    assert client._v3.stream_state is None
+
+    seen.clear()
+    state = StreamState.for_thresholds(client._thresholds)
+    watch_stream_pipelined(CHAIN, client=client, handler=seen.append, workers=1, stream_state=state)
+    assert seen[-1].status == "CRITICAL"
+
+    client.attach_stream_state(state)
+    assert client.evaluate_snapshot(CHAIN[0]).status == "CRITICAL"  # the chain is still in the window
+    client.attach_stream_state(None)
+    assert client.evaluate_snapshot(CHAIN[0]).status != "CRITICAL"
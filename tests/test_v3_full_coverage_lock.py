@@ -284,14 +284,16 @@ def test_wrapper_default_client_paths(monkeypatch):
             self.seen = raw_telemetry
             return types.SimpleNamespace(status="OK", risk_score=0.01, details=[])
 
-    monkeypatch.setattr("sentinel_ai_v2.wrapper.workflow.SentinelClient", DummyClient)
+    # Default paths go through the shared process-wide client.
+    monkeypatch.setattr("sentinel_ai_v2.api.SentinelClient", DummyClient)
+    monkeypatch.setattr("sentinel_ai_v2.api._DEFAULT_CLIENT", None)
     workflow_result = run_full_workflow({"height": 1})
     assert workflow_result.status == "OK"
 
     default_client = _get_client()
     assert isinstance(default_client, DummyClient)
+    assert _get_client() is default_client
 
-    monkeypatch.setattr("sentinel_ai_v2.wrapper.sentinel_wrapper.SentinelClient", DummyClient)
     wrapper = SentinelWrapper()
     wrapped_result = wrapper.evaluate({"height": 2})
     assert wrapped_result.status == "OK"
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+
+import pytest
+from fastapi import HTTPException
+
+import sentinel_ai_v2.cli as cli
+import sentinel_ai_v2.server as server
+import sentinel_ai_v2.verdict_history as vh
+from sentinel_ai_v2.verdict_history import VerdictHistory, rows_to_dicts
+from sentinel_ai_v2.verdict_log import (
+    HEADER,
+    RECORD,
+    VerdictLogError,
+    VerdictLogWriter,
+    VerdictRecord,
+    segment_path,
+)
+
+np = pytest.importorskip("numpy")
+
+DECISIONS = ("ALLOW", "WARN", "BLOCK", "ERROR")
+TIERS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+SECOND = 1_000_000_000
+
+
+def _record(i: int) -> VerdictRecord:
+    return VerdictRecord(
+        timestamp_ns=i * SECOND,
+        request_id=f"r{i}",
+        context_hash=f"{i % 7:064x}",
+        decision=DECISIONS[i % 4],
+        tier=TIERS[i % 4],
+        risk_score=i / 100,
+        reason_codes=("SNTL_V2_SIGNAL",),
+        latency_ms=i,
+    )
+
+
+@pytest.fixture()
+def log_dir(tmp_path):
+    with VerdictLogWriter(tmp_path, segment_records=20, batch_size=8, index_stride=4) as log:
+        for i in range(50):
+            log.append(_record(i))
+    return tmp_path
+
+
+def _ids(rows):
+    return [int(r["request_id"][1:]) for r in rows]
+
+
+def test_rows_are_zero_copy_structured_views(log_dir):
+    with VerdictHistory(log_dir) as history:
+        assert len(history) == 50
+        assert history.dtype.itemsize == RECORD.size
+        segment = history._segments[0]
+        assert segment.records.base is not None  # view over the mapping
+        assert segment.records["request_id"][3] == b"r3"
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [(None, None), (0, 50), (5, 17), (19, 41), (20, 20), (-5, 3), (48, 99), (60, 70), (None, 7), (33, None)],
+)
+def test_time_range_matches_linear_scan(log_dir, start, end):
+    expected = [
+        i for i in range(50)
+        if (start is None or i >= start) and (end is None or i < end)
+    ]
+    with VerdictHistory(log_dir) as history:
+        rows = history.query(
+            None if start is None else start * SECOND,
+            None if end is None else end * SECOND,
+        )
+    assert _ids(rows_to_dicts(rows)) == expected
+
+
+def test_filters_and_limit(log_dir):
+    with VerdictHistory(log_dir) as history:
+        rows = history.query(10 * SECOND, 45 * SECOND, decisions=["BLOCK", "ERROR"], tiers=["CRITICAL"])
+        assert _ids(rows_to_dicts(rows)) == [i for i in range(10, 45) if i % 4 == 3]
+        assert _ids(rows_to_dicts(history.query(limit=25))) == list(range(25))
+        assert _ids(rows_to_dicts(history.query(limit=20))) == list(range(20))
+        with pytest.raises(ValueError):
+            history.query(decisions=["DENY"])
+    # results are copies and outlive the mappings
+    assert rows["risk_score"].tolist() == [i / 100 for i in range(10, 45) if i % 4 == 3]
+
+
+def test_context_hash_lookup_uses_sealed_index_and_active_scan(log_dir):
+    with VerdictHistory(log_dir) as history:
+        assert history._segments[0].hash_index is not None
+        assert history._segments[-1].hash_index is None
+        rows = rows_to_dicts(history.by_context_hash(f"{3:064x}"))
+        assert _ids(rows) == [i for i in range(50) if i % 7 == 3]
+        assert rows[0] == {
+            "timestamp_ns": 3 * SECOND,
+            "request_id": "r3",
+            "context_hash": f"{3:064x}",
+            "decision": "ERROR",
+            "tier": "CRITICAL",
+            "risk_score": 0.03,
+            "reason_codes": ["SNTL_V2_SIGNAL"],
+            "latency_ms": 3,
+            "model_used": False,
+        }
+        assert len(history.by_context_hash(f"{3:064x}", limit=2)) == 2
+        assert len(history.by_context_hash("ff" * 32)) == 0
+        for bad in ("zz", "abcd"):
+            with pytest.raises(ValueError):
+                history.by_context_hash(bad)
+
+
+def test_refresh_sees_new_records_and_tolerates_partial_tail(tmp_path):
+    writer = VerdictLogWriter(tmp_path, batch_size=1)
+    with VerdictHistory(tmp_path) as history:
+        assert len(history) == 0
+        assert len(history.query()) == 0
+        writer.append(_record(1))
+        writer.flush()
+        history.refresh()
+        assert len(history) == 1
+    writer.close()
+
+    with open(segment_path(tmp_path, 0), "ab") as f:
+        f.write(b"\0" * 10)
+    segment_path(tmp_path, 0).with_suffix(".tidx").unlink()
+    with VerdictHistory(tmp_path) as history:
+        assert _ids(rows_to_dicts(history.query(0, 5 * SECOND))) == [1]
+
+
+def test_empty_files_and_bad_segments(tmp_path):
+    segment_path(tmp_path, 0).write_bytes(b"")
+    segment_path(tmp_path, 0).with_suffix(".hidx").write_bytes(b"")
+    with VerdictHistory(tmp_path) as history:
+        assert len(history) == 0
+        assert len(history.by_context_hash("00" * 32)) == 0
+
+    segment_path(tmp_path, 0).write_bytes(b"x" * HEADER.size)
+    with pytest.raises(VerdictLogError):
+        VerdictHistory(tmp_path)
+    with pytest.raises(VerdictLogError):
+        VerdictHistory(tmp_path / "missing")
+
+
+def test_unknown_codes_decode_as_unknown():
+    np_rows = np.zeros(1, dtype=vh.record_dtype(np))
+    np_rows["reason_count"] = 1
+    np_rows["reason_codes"][0, 0] = 999
+    row = rows_to_dicts(np_rows)[0]
+    assert (row["decision"], row["tier"], row["reason_codes"]) == ("UNKNOWN", "UNKNOWN", ["UNKNOWN"])
+
+
+def test_missing_numpy_raises(monkeypatch, tmp_path):
+    def _missing(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(importlib, "import_module", _missing)
+    with pytest.raises(RuntimeError):
+        VerdictHistory(tmp_path)
+
+
+def test_cli_history(log_dir, capsys):
+    assert cli.main(["history", "--log-dir", str(log_dir), "--since", "40", "--until", "44", "--tier", "LOW"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [v["request_id"] for v in lines] == ["r40"]
+
+    assert cli.main(["history", "--log-dir", str(log_dir), "--context-hash", f"{5:064x}", "--limit", "3"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 3
+
+    with pytest.raises(SystemExit):
+        cli.main(["history", "--log-dir", str(log_dir), "--decision", "DENY"])
+
+
+def _history(**kwargs):
+    params = dict(since=None, until=None, decision=None, tier=None, context_hash=None, limit=1000)
+    params.update(kwargs)
+    return server.history(**params)
+
+
+def test_http_history(log_dir, monkeypatch):
+    assert not inspect.iscoroutinefunction(server.history)  # runs in the threadpool
+    monkeypatch.delenv(server.VERDICT_LOG_ENV_VAR, raising=False)
+    with pytest.raises(HTTPException) as e:
+        _history()
+    assert e.value.status_code == 404
+
+    monkeypatch.setenv(server.VERDICT_LOG_ENV_VAR, str(log_dir))
+    resp = _history(since=0, until=10, decision=["BLOCK"])
+    assert resp.count == 2
+    assert [v["request_id"] for v in resp.verdicts] == ["r2", "r6"]
+    assert _history(context_hash=f"{1:064x}", limit=1).count == 1
+
+    with pytest.raises(HTTPException) as e:
+        _history(tier=["SEVERE"])
+    assert e.value.status_code == 400
+
+    monkeypatch.setenv(server.VERDICT_LOG_ENV_VAR, str(log_dir / "missing"))
+    with pytest.raises(HTTPException) as e:
+        _history()
+    assert e.value.status_code == 500
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import time
+
+import pytest
+
+import sentinel_ai_v2.api as api
+import sentinel_ai_v2.server as server
+from sentinel_ai_v2.verdict_log import (
+    HASH_INDEX_ENTRY,
+    HEADER,
+    RECORD,
+    TIME_INDEX_ENTRY,
+    VerdictLogError,
+    VerdictLogWriter,
+    VerdictRecord,
+    iter_records,
+    list_segments,
+    segment_path,
+)
+from sentinel_ai_v2.wrapper.sentinel_wrapper import SentinelWrapper
+
+from tests.fixtures_v3 import make_valid_v3_request
+
+
+def _record(i: int, ts: int | None = None, **kw) -> VerdictRecord:
+    fields = dict(
+        timestamp_ns=1_000 + i if ts is None else ts,
+        request_id=f"r{i}",
+        context_hash=f"{i:064x}",
+        decision="BLOCK" if i % 2 else "ALLOW",
+        tier="CRITICAL" if i % 2 else "LOW",
+        risk_score=i / 100,
+        reason_codes=("SNTL_V2_SIGNAL",),
+        latency_ms=i,
+        model_used=bool(i % 3),
+    )
+    fields.update(kw)
+    return VerdictRecord(**fields)
+
+
+def _all(directory):
+    return [rec for _, path in list_segments(directory) for rec in iter_records(path)]
+
+
+def test_record_round_trip_is_fixed_width():
+    rec = _record(7, reason_codes=("SNTL_OK", "NOT_A_CODE"))
+    raw = rec.pack()
+    assert len(raw) == RECORD.size == 128
+    back = VerdictRecord.unpack(raw)
+    assert back == VerdictRecord(**{**vars(rec), "reason_codes": ("SNTL_OK", "UNKNOWN")})
+
+
+def test_record_normalises_odd_fields():
+    rec = _record(
+        1,
+        request_id="é" * 40,
+        context_hash="not-hex",
+        decision="MAYBE",
+        tier="",
+        latency_ms=-5,
+        reason_codes=tuple(["SNTL_OK"] * 6),
+    )
+    back = VerdictRecord.unpack(rec.pack())
+    assert back.request_id == "é" * 32
+    assert back.context_hash == "0" * 64
+    assert (back.decision, back.tier, back.latency_ms) == ("UNKNOWN", "UNKNOWN", 0)
+    assert back.reason_codes == ("SNTL_OK",) * 4
+    assert VerdictRecord.unpack(_record(1, context_hash="ab").pack()).context_hash == "0" * 64
+
+
+def test_writer_batches_rotates_and_indexes(tmp_path):
+    with VerdictLogWriter(tmp_path, segment_records=10, batch_size=4, index_stride=3) as log:
+        for i in range(25):
+            log.append(_record(i))
+        assert len(_all(tmp_path)) == 24  # last partial batch still buffered
+    records = _all(tmp_path)
+    assert [r.request_id for r in records] == [f"r{i}" for i in range(25)]
+
+    segments = list_segments(tmp_path)
+    assert [seq for seq, _ in segments] == [0, 1, 2]
+    first = segments[0][1]
+    assert first.with_suffix(".hidx").exists()
+    assert not segments[2][1].with_suffix(".hidx").exists()
+
+    tidx = first.with_suffix(".tidx").read_bytes()
+    assert [e[1] for e in TIME_INDEX_ENTRY.iter_unpack(tidx)] == [0, 3, 6, 9]
+
+    hidx = [HASH_INDEX_ENTRY.unpack_from(first.with_suffix(".hidx").read_bytes(), n * 36) for n in range(10)]
+    assert [h for h, _ in hidx] == sorted(h for h, _ in hidx)
+    assert {n for _, n in hidx} == set(range(10))
+
+
+def test_timestamps_are_clamped_non_decreasing(tmp_path):
+    with VerdictLogWriter(tmp_path, batch_size=1) as log:
+        log.append(_record(0, ts=500))
+        log.append(_record(1, ts=100))
+        log.append(_record(2, ts=900))
+    assert [r.timestamp_ns for r in _all(tmp_path)] == [500, 500, 900]
+
+
+def test_reopen_recovers_torn_tail_and_resumes(tmp_path):
+    log = VerdictLogWriter(tmp_path, batch_size=1, index_stride=2, fsync_interval=0)
+    for i in range(5):
+        log.append(_record(i, ts=10 * i))
+    log.close()
+    log.close()  # idempotent
+    log.flush()  # no-op once closed
+    with pytest.raises(VerdictLogError):
+        log.append(_record(9))
+
+    path = segment_path(tmp_path, 0)
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 50)  # torn record from a crash
+
+    with VerdictLogWriter(tmp_path, batch_size=1, index_stride=2) as log:
+        log.append(_record(5, ts=1))  # clamped to the recovered last timestamp
+        log.flush(fsync=True)
+    assert path.stat().st_size == HEADER.size + 6 * RECORD.size
+    assert [r.timestamp_ns for r in _all(tmp_path)] == [0, 10, 20, 30, 40, 40]
+    tidx = path.with_suffix(".tidx").read_bytes()
+    assert list(TIME_INDEX_ENTRY.iter_unpack(tidx)) == [(0, 0), (20, 2), (40, 4)]
+
+
+def test_reopen_after_sealed_segment_starts_new_one(tmp_path):
+    with VerdictLogWriter(tmp_path, segment_records=2, batch_size=1) as log:
+        log.append(_record(0))
+        log.append(_record(1))
+    segment_path(tmp_path, 1).unlink()
+    segment_path(tmp_path, 1).with_suffix(".tidx").unlink()
+    with VerdictLogWriter(tmp_path) as log:
+        log.append(_record(2))
+    assert [seq for seq, _ in list_segments(tmp_path)] == [0, 1]
+
+
+def test_empty_active_segment_recovers(tmp_path):
+    VerdictLogWriter(tmp_path).close()
+    with VerdictLogWriter(tmp_path, batch_size=1) as log:
+        log.append(_record(0))
+    assert len(_all(tmp_path)) == 1
+
+
+def test_bad_segments_and_arguments_are_rejected(tmp_path):
+    (tmp_path / "verdicts-00000000.log").write_bytes(b"short")
+    with pytest.raises(VerdictLogError):
+        VerdictLogWriter(tmp_path)
+    (tmp_path / "verdicts-00000000.log").write_bytes(struct.pack("<8sHHI", b"NOTMAGIC", 1, 128, 0))
+    with pytest.raises(VerdictLogError):
+        list(iter_records(tmp_path / "verdicts-00000000.log"))
+    (tmp_path / "unrelated.txt").write_text("x")
+    assert len(list_segments(tmp_path)) == 1
+
+    bad = ({"segment_records": 0}, {"batch_size": 0}, {"index_stride": 0}, {"fsync_interval": -1}, {"flush_interval": 0})
+    for kwargs in bad:
+        with pytest.raises(ValueError):
+            VerdictLogWriter(tmp_path / "other", **kwargs)
+
+
+def test_evaluate_v3_appends_to_attached_log(tmp_path, monkeypatch):
+    log = VerdictLogWriter(tmp_path, batch_size=1, clock=lambda: 42)
+    monkeypatch.setattr(api, "_VERDICT_LOG", None)
+    api.attach_verdict_log(log)
+    resp = api.evaluate_v3(make_valid_v3_request(request_id="audit-1"))
+    api.attach_verdict_log(None)
+    log.close()
+
+    (rec,) = _all(tmp_path)
+    assert rec == VerdictRecord.from_response(resp, 42)
+    assert rec.context_hash == resp["context_hash"]
+
+
+def test_evaluate_v3_survives_log_failure(monkeypatch):
+    class _Broken:
+        def append_response(self, response):
+            raise OSError("disk full")
+
+    monkeypatch.setattr(api, "_VERDICT_LOG", _Broken())
+    assert api.evaluate_v3(make_valid_v3_request())["decision"] != "ERROR"
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_partial_batch_is_written_and_synced_after_flush_interval(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    with VerdictLogWriter(tmp_path, fsync_interval=0.2, flush_interval=0.02) as log:
+        log.flush(fsync=True)
+        synced.clear()
+        for i in range(5):
+            log.append(_record(i))
+        assert _wait_for(lambda: len(_all(tmp_path)) == 5)  # idle writer, no explicit flush
+        assert _wait_for(lambda: len(synced) == 2)  # fsync of data and time index, once due
+
+        log.flush_interval = 0.0  # an overdue batch is also written by the next append
+        log.append(_record(5))
+        assert len(_all(tmp_path)) == 6
+
+
+def test_client_appends_to_attached_log(tmp_path):
+    client = api.SentinelClient(api.load_config())
+    with VerdictLogWriter(tmp_path, batch_size=1) as log:
+        SentinelWrapper(client=client).attach_verdict_log(log)
+        client.evaluate_snapshot({"block_height": 1, "mempool_size": 2})
+        client.attach_verdict_log(None)
+        client.evaluate_snapshot({"block_height": 1, "mempool_size": 2})
+    (rec,) = _all(tmp_path)
+    assert rec.request_id == "v2-evaluate_snapshot" and rec.decision != "ERROR"
+
+
+def test_attached_log_is_closed_at_exit(tmp_path, monkeypatch):
+    log = VerdictLogWriter(tmp_path)
+    monkeypatch.setattr(api, "_VERDICT_LOG", log)
+    log.append(_record(0))
+    api._close_verdict_log()
+    assert len(_all(tmp_path)) == 1
+    monkeypatch.setattr(api, "_VERDICT_LOG", None)
+    api._close_verdict_log()
+
+
+def test_server_writes_verdicts_from_env_and_closes_on_shutdown(tmp_path, monkeypatch):
+    class Wrapper:
+        def attach_verdict_log(self, writer):
+            self.writer = writer
+
+    monkeypatch.delenv(server.VERDICT_LOG_ENV_VAR, raising=False)
+    assert server._verdict_log_from_env(Wrapper()) is None
+
+    monkeypatch.setenv(server.VERDICT_LOG_ENV_VAR, str(tmp_path))
+    target = Wrapper()
+    log = server._verdict_log_from_env(target)
+    assert target.writer is log
+    monkeypatch.setattr(server, "verdict_log", log)
+    log.append(_record(0))
+
+    async def serve():
+        async with server._lifespan(server.app):
+            pass
+
+    asyncio.run(serve())
+    assert len(_all(tmp_path)) == 1
+    with pytest.raises(VerdictLogError):
+        log.append(_record(1))
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import gc
+import os
+import signal
+import threading
+
+import pytest
+
+import sentinel_ai_v2.adaptive_core_bridge as adaptive_core_bridge
+import sentinel_ai_v2.api as api
+import sentinel_ai_v2.config as config
+import sentinel_ai_v2.model_loader as model_loader
+import sentinel_ai_v2.server as server
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.adversarial_engine import AdversarialStatsTracker
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.fork_safety import reset_lock_in_child
+from sentinel_ai_v2.idempotency import IdempotencyTable
+from sentinel_ai_v2.profiling import StageProfiler
+from sentinel_ai_v2.scoring import StreamState
+from sentinel_ai_v2.wrapper.sentinel_wrapper import SentinelWrapper
+
+
+@pytest.fixture(autouse=True)
+def _fresh_default_client():
+    api.reset_default_client()
+    yield
+    api.reset_default_client()
+
+
+def test_warm_up_builds_default_client_and_leaves_no_state_behind():
+    appended = []
+
+    class Log:
+        def append_response(self, response):
+            appended.append(response)
+
+    table = IdempotencyTable()
+    profiler = StageProfiler(1.0, rng=lambda: 0.0)
+    api.enable_idempotency(table)
+    api.enable_profiling(profiler)
+    api.attach_verdict_log(Log())
+    try:
+        report = api.warm_up()
+    finally:
+        api.enable_idempotency(None)
+        api.enable_profiling(None)
+        api.attach_verdict_log(None)
+
+    assert report["decision"] != "ERROR"
+    assert report["frozen"] is False
+    assert set(report["timings"]) == {"client_ms", "evaluate_ms"}
+    assert api._DEFAULT_CLIENT is not None
+    assert len(table) == 0 and profiler.samples == 0 and appended == []
+
+
+def test_warm_up_freeze_moves_heap_to_permanent_generation():
+    client = SentinelClient(SentinelConfig())
+    try:
+        assert api.warm_up(client, freeze=True)["frozen"] is True
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+    assert api._DEFAULT_CLIENT is None  # explicit client: shared one untouched
+
+
+def test_warm_up_leaves_the_attached_stream_state_untouched():
+    state = StreamState.for_thresholds(CircuitBreakerThresholds())
+    client = SentinelClient(SentinelConfig()).with_stream_state(state)
+
+    assert api.warm_up(client)["decision"] != "ERROR"
+    assert state.correlator._last is None
+    assert state.adversarial_stats.to_dict() == AdversarialStatsTracker(CircuitBreakerThresholds()).to_dict()
+
+
+def test_wrapper_warm_up_uses_its_own_client():
+    profiler = StageProfiler(1.0, rng=lambda: 0.0)
+    wrapper = SentinelWrapper(client=SentinelClient(SentinelConfig()))
+    wrapper.attach_profiler(profiler)
+
+    assert wrapper.warm_up()["decision"] != "ERROR"
+    assert profiler.samples == 0
+    assert wrapper.last_status()["status"] == "NO_DATA"
+
+
+def test_warm_up_from_env(monkeypatch):
+    calls = []
+
+    class Wrapper:
+        def warm_up(self, *, freeze):
+            calls.append(freeze)
+            return {"frozen": freeze}
+
+    monkeypatch.delenv(server.WARMUP_ENV_VAR, raising=False)
+    assert server._warm_up_from_env(Wrapper()) is None
+    monkeypatch.setenv(server.WARMUP_ENV_VAR, "1")
+    server._warm_up_from_env(Wrapper())
+    monkeypatch.setenv(server.WARMUP_ENV_VAR, "prefork")
+    server._warm_up_from_env(Wrapper())
+    assert calls == [False, True]
+
+    monkeypatch.setenv(server.WARMUP_ENV_VAR, "yes")
+    with pytest.raises(ValueError):
+        server._warm_up_from_env(Wrapper())
+
+
+def test_fork_resets_locks_held_by_parent_threads():
+    api.warm_up()
+    locks = [
+        api._DEFAULT_CLIENT_LOCK,
+        config._CONFIG_CACHE_LOCK,
+        model_loader._RUNTIME_CACHE_LOCK,
+        adaptive_core_bridge._SHARED_LOCK,
+    ]
+    for lock in locks:
+        lock.acquire()
+    try:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            signal.alarm(5)
+            ok = api.get_default_client() is api._DEFAULT_CLIENT[1]
+            ok = ok and config._CONFIG_CACHE_LOCK.acquire(timeout=1)
+            ok = ok and model_loader._RUNTIME_CACHE_LOCK.acquire(timeout=1)
+            ok = ok and adaptive_core_bridge._SHARED_LOCK.acquire(timeout=1)
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+    finally:
+        for lock in locks:
+            lock.release()
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_reset_lock_in_child_replaces_the_lock(monkeypatch):
+    hooks = []
+    monkeypatch.setattr(os, "register_at_fork", lambda *, after_in_child: hooks.append(after_in_child))
+    namespace = {"_LOCK": threading.Lock()}
+    before = namespace["_LOCK"]
+    before.acquire()
+    reset_lock_in_child(namespace, "_LOCK")
+    (hook,) = hooks
+    hook()
+    assert namespace["_LOCK"] is not before and namespace["_LOCK"].acquire(blocking=False)
+
+
+def test_reset_lock_in_child_is_a_noop_without_fork(monkeypatch):
+    monkeypatch.delattr(os, "register_at_fork")
+    namespace = {"_LOCK": threading.Lock()}
+    before = namespace["_LOCK"]
+    reset_lock_in_child(namespace, "_LOCK")
+    assert namespace["_LOCK"] is before
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import types
+
+import sentinel_ai_v2.engine.watcher_loop as watcher_loop
+from sentinel_ai_v2.engine.watcher_loop import default_print_handler, watch_stream
+
+
+class _EchoClient:
+    def evaluate_snapshot(self, raw_telemetry):
+        return types.SimpleNamespace(
+            status="NORMAL", risk_score=float(raw_telemetry["i"]), details=[str(raw_telemetry["i"])]
+        )
+
+
+def test_default_print_handler_prints_one_line(capsys):
+    default_print_handler(types.SimpleNamespace(status="HIGH", risk_score=0.8123, details=["a", "b"]))
+    assert capsys.readouterr().out == "[SentinelAI v2] status=HIGH score=0.812 details=a,b\n"
+
+
+def test_watch_stream_serial_defaults(monkeypatch, capsys):
+    monkeypatch.setattr(watcher_loop, "get_default_client", lambda: _EchoClient())
+    watch_stream([{"i": 1}, {"i": 2}])
+    out = capsys.readouterr().out.splitlines()
+    assert [line.split("details=")[1] for line in out] == ["1", "2"]
+
+
+def test_watch_stream_with_client_and_handler():
+    seen = []
+    watch_stream([{"i": 3}], client=_EchoClient(), handler=seen.append)  # type: ignore[arg-type]
+    assert [r.risk_score for r in seen] == [3.0]
+
+
+import random
+import threading
+import time
+
+import pytest
+
+from sentinel_ai_v2.engine.watcher_loop import watch_stream_pipelined
+
+
+class _JitterClient(_EchoClient):
+    def evaluate_snapshot(self, raw_telemetry):
+        time.sleep(random.random() / 500)
+        return super().evaluate_snapshot(raw_telemetry)
+
+
+def _snapshots(n):
+    return ({"i": i} for i in range(n))
+
+
+def test_pipelined_preserves_order_with_bounded_queues():
+    seen = []
+    handled = watch_stream_pipelined(
+        _snapshots(200), client=_JitterClient(), handler=seen.append, workers=8, queue_size=2
+    )
+    assert handled == 200
+    assert [r.risk_score for r in seen] == [float(i) for i in range(200)]
+
+
+def test_pipelined_unordered_handles_everything():
+    seen = []
+    handled = watch_stream_pipelined(
+        _snapshots(100), client=_JitterClient(), handler=seen.append, preserve_order=False
+    )
+    assert handled == 100
+    assert sorted(r.risk_score for r in seen) == [float(i) for i in range(100)]
+
+
+def test_pipelined_defaults(monkeypatch, capsys):
+    monkeypatch.setattr(watcher_loop, "get_default_client", lambda: _EchoClient())
+    assert watch_stream_pipelined([{"i": 1}, {"i": 2}], workers=1) == 2
+    assert capsys.readouterr().out.count("[SentinelAI v2]") == 2
+
+
+def test_pipelined_stop_event_drains_what_was_queued():
+    stop = threading.Event()
+    seen = []
+
+    def source():
+        for i in range(1000):
+            if i == 5:
+                stop.set()
+            yield {"i": i}
+
+    handled = watch_stream_pipelined(source(), client=_EchoClient(), handler=seen.append, stop_event=stop)
+    assert handled == 5  # the snapshot yielded after stop is not queued
+    assert [r.risk_score for r in seen] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def _idle_source(release):
+    yield {"i": 0}
+    yield {"i": 1}
+    release.wait(5)  # e.g. a socket with no traffic
+    yield {"i": 2}
+
+
+def test_pipelined_stop_does_not_wait_for_an_idle_source():
+    stop = threading.Event()
+    release = threading.Event()
+    seen = []
+    threading.Timer(0.1, stop.set).start()
+    started = time.monotonic()
+    try:
+        handled = watch_stream_pipelined(
+            _idle_source(release), client=_EchoClient(), handler=seen.append, stop_event=stop
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+    assert handled == 2 and elapsed < 2
+    assert [r.risk_score for r in seen] == [0.0, 1.0]
+
+
+class _Boom(Exception):
+    pass
+
+
+def test_pipelined_handler_error_does_not_wait_for_an_idle_source():
+    release = threading.Event()
+
+    def handler(result):
+        if result.risk_score == 1.0:
+            raise _Boom("handler")
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(_Boom, match="handler"):
+            watch_stream_pipelined(_idle_source(release), client=_EchoClient(), handler=handler)
+        assert time.monotonic() - started < 2
+    finally:
+        release.set()
+
+
+def test_pipelined_reraises_source_error():
+    def source():
+        yield {"i": 0}
+        raise _Boom("source")
+
+    with pytest.raises(_Boom, match="source"):
+        watch_stream_pipelined(source(), client=_EchoClient(), handler=lambda r: None)
+
+
+def test_pipelined_reraises_client_error():
+    class _Failing(_EchoClient):
+        def evaluate_snapshot(self, raw_telemetry):
+            if raw_telemetry["i"] == 3:
+                raise _Boom("client")
+            return super().evaluate_snapshot(raw_telemetry)
+
+    with pytest.raises(_Boom, match="client"):
+        watch_stream_pipelined(_snapshots(10_000), client=_Failing(), handler=lambda r: None, queue_size=1)
+
+
+@pytest.mark.parametrize("preserve_order", [True, False])
+def test_pipelined_handler_error_aborts_blocked_stages(preserve_order):
+    def handler(result):
+        time.sleep(0.1)
+        raise _Boom("handler")
+
+    with pytest.raises(_Boom, match="handler"):
+        watch_stream_pipelined(
+            _snapshots(10_000),
+            client=_EchoClient(),
+            handler=handler,
+            workers=2,
+            queue_size=1,
+            preserve_order=preserve_order,
+        )
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"queue_size": 0}])
+def test_pipelined_rejects_bad_sizes(kwargs):
+    with pytest.raises(ValueError):
+        watch_stream_pipelined([], client=_EchoClient(), handler=print, **kwargs)
+
+
+def test_queue_helpers_give_up_on_abort():
+    import queue
+
+    abort = threading.Event()
+    q = queue.Queue(maxsize=1)
+    assert watcher_loop._put(q, 1, abort)
+    threading.Timer(0.1, abort.set).start()
+    assert not watcher_loop._put(q, 2, abort)
+    assert watcher_loop._get(queue.Queue(), abort) is watcher_loop._DONE
+
+    abort = threading.Event()
+    slots = threading.BoundedSemaphore(1)
+    assert watcher_loop._acquire(slots, abort)
+    threading.Timer(0.1, abort.set).start()
+    assert not watcher_loop._acquire(slots, abort)
+
+
+import asyncio
+
+from sentinel_ai_v2.engine.watcher_loop import watch_stream_async
+
+
+async def _feed(n, delay=0.0):
+    for i in range(n):
+        if delay:
+            await asyncio.sleep(delay)
+        yield {"i": i}
+
+
+def test_async_watcher_ordered_with_sync_and_async_handlers():
+    seen = []
+
+    async def async_handler(result):
+        await asyncio.sleep(0)
+        seen.append(result.risk_score)
+
+    async def main():
+        a = await watch_stream_async(_feed(30), client=_JitterClient(), handler=async_handler, concurrency=4)
+        b = await watch_stream_async(_feed(3), client=_EchoClient(), handler=lambda r: seen.append(-1.0))
+        return a, b
+
+    assert asyncio.run(main()) == (30, 3)
+    assert seen == [float(i) for i in range(30)] + [-1.0] * 3
+
+
+def test_async_watcher_multiplexes_feeds_with_defaults(monkeypatch, capsys):
+    monkeypatch.setattr(watcher_loop, "get_default_client", lambda: _EchoClient())
+
+    async def main():
+        return await asyncio.gather(*(watch_stream_async(_feed(5, 0.001)) for _ in range(4)))
+
+    assert asyncio.run(main()) == [5, 5, 5, 5]
+    assert capsys.readouterr().out.count("[SentinelAI v2]") == 20
+
+
+def test_async_watcher_timeout_and_cancellation():
+    release = threading.Event()
+
+    class _Slow(_EchoClient):
+        def evaluate_snapshot(self, raw_telemetry):
+            release.wait(0.3)
+            return super().evaluate_snapshot(raw_telemetry)
+
+    async def timed_out():
+        await watch_stream_async(_feed(10), client=_Slow(), handler=print, timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(timed_out())
+
+    async def cancelled():
+        task = asyncio.ensure_future(watch_stream_async(_feed(10), client=_Slow(), handler=print))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled())
+    release.set()
+
+
+def test_async_watcher_rejects_bad_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(watch_stream_async(_feed(1), client=_EchoClient(), handler=print, concurrency=0))